@@ -22,6 +22,8 @@ from app.models.constructor import Constructor
 from app.models.race import Race
 from app.models.result import RaceResult
 from app.models.qualifying import Qualifying
+from app.models.standing import DriverStanding, ConstructorStanding
+from app.models.lap import Lap
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
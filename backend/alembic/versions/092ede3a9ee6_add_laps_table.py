@@ -0,0 +1,52 @@
+"""Add laps table partitioned by season
+
+Revision ID: 092ede3a9ee6
+Revises: c388f6e5d125
+Create Date: 2026-10-17 17:05:12.730451
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '092ede3a9ee6'
+down_revision: Union[str, None] = 'c388f6e5d125'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    key_type = sa.String(length=36).with_variant(postgresql.UUID(as_uuid=False), 'postgresql')
+    # Partitions (laps_<year>) are created by ingestion when a season's laps are first stored
+    op.create_table('laps',
+    sa.Column('season_year', sa.Integer(), nullable=False),
+    sa.Column('race_id', key_type, nullable=False),
+    sa.Column('driver_id', key_type, nullable=False),
+    sa.Column('lap', sa.Integer(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=True),
+    sa.Column('lap_time_ms', sa.Integer(), nullable=True),
+    sa.Column('sector_1_ms', sa.Integer(), nullable=True),
+    sa.Column('sector_2_ms', sa.Integer(), nullable=True),
+    sa.Column('sector_3_ms', sa.Integer(), nullable=True),
+    sa.Column('session_time_ms', sa.Integer(), nullable=True),
+    sa.Column('stint', sa.Integer(), nullable=True),
+    sa.Column('compound', sa.String(), nullable=True),
+    sa.Column('tyre_life', sa.Integer(), nullable=True),
+    sa.Column('pit_in', sa.Boolean(), nullable=False),
+    sa.Column('pit_out', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['driver_id'], ['drivers.id'], ondelete='RESTRICT'),
+    sa.ForeignKeyConstraint(['race_id'], ['races.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('race_id', 'driver_id', 'lap', 'season_year', name='pk_laps'),
+    postgresql_partition_by='LIST (season_year)'
+    )
+
+
+def downgrade() -> None:
+    # Dropping the partitioned table drops its partitions
+    op.drop_table('laps')
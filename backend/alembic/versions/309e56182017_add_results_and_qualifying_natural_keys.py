@@ -0,0 +1,36 @@
+"""Add natural key unique constraints on results and qualifying
+
+Revision ID: 309e56182017
+Revises: 9e2d7d542f99
+Create Date: 2026-10-17 11:41:08.772390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '309e56182017'
+down_revision: Union[str, None] = '9e2d7d542f99'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the most recently updated row per (race_id, driver_id)
+    for table in ('results', 'qualifying'):
+        op.execute(
+            f"DELETE FROM {table} a USING {table} b "
+            "WHERE a.race_id = b.race_id AND a.driver_id = b.driver_id "
+            "AND (a.updated_at, a.id) < (b.updated_at, b.id)"
+        )
+
+    op.create_unique_constraint('uq_results_race_id_driver_id', 'results', ['race_id', 'driver_id'])
+    op.create_unique_constraint('uq_qualifying_race_id_driver_id', 'qualifying', ['race_id', 'driver_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_qualifying_race_id_driver_id', 'qualifying', type_='unique')
+    op.drop_constraint('uq_results_race_id_driver_id', 'results', type_='unique')
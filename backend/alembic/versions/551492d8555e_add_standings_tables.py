@@ -0,0 +1,120 @@
+"""Add driver and constructor standings tables
+
+Revision ID: 551492d8555e
+Revises: 309e56182017
+Create Date: 2026-10-17 12:26:53.904217
+
+"""
+import uuid
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '551492d8555e'
+down_revision: Union[str, None] = '309e56182017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('driver_standings',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('race_id', sa.String(), nullable=False),
+    sa.Column('driver_id', sa.String(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('points', sa.Float(), nullable=False),
+    sa.Column('wins', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['driver_id'], ['drivers.id'], ondelete='RESTRICT'),
+    sa.ForeignKeyConstraint(['race_id'], ['races.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('race_id', 'driver_id', name='uq_driver_standings_race_id_driver_id')
+    )
+    op.create_index(op.f('ix_driver_standings_driver_id'), 'driver_standings', ['driver_id'], unique=False)
+    op.create_table('constructor_standings',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('race_id', sa.String(), nullable=False),
+    sa.Column('constructor_id', sa.String(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('points', sa.Float(), nullable=False),
+    sa.Column('wins', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['constructor_id'], ['constructors.id'], ondelete='RESTRICT'),
+    sa.ForeignKeyConstraint(['race_id'], ['races.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('race_id', 'constructor_id', name='uq_constructor_standings_race_id_constructor_id')
+    )
+    op.create_index(op.f('ix_constructor_standings_constructor_id'), 'constructor_standings', ['constructor_id'], unique=False)
+    _backfill_standings()
+
+
+def _ranked(totals):
+    """Rank by points, then count-back on finishing positions, then key (as app.services.standings)"""
+    depth = max((max(placings, default=0) for _, placings in totals.values()), default=0)
+    order = sorted(
+        totals.items(),
+        key=lambda item: (-item[1][0], *(-item[1][1][place] for place in range(1, depth + 1)), item[0]),
+    )
+    return [(key, points, placings[1], position) for position, (key, (points, placings)) in enumerate(order, start=1)]
+
+
+def _backfill_standings() -> None:
+    """Standings of the races already in the database, walking each season round by round"""
+    # Offline (--sql) runs cannot read the data; recompute with the
+    # recompute_standings job after applying the script
+    if context.is_offline_mode():
+        return
+
+    bind = op.get_bind()
+    results = defaultdict(list)
+    for row in bind.execute(sa.text("SELECT race_id, driver_id, constructor_id, points, position FROM results")):
+        results[row.race_id].append(row)
+
+    driver_standings = sa.table(
+        'driver_standings', sa.column('id'), sa.column('race_id'), sa.column('driver_id'), sa.column('position'),
+        sa.column('points'), sa.column('wins'), sa.column('created_at'), sa.column('updated_at'),
+    )
+    constructor_standings = sa.table(
+        'constructor_standings', sa.column('id'), sa.column('race_id'), sa.column('constructor_id'), sa.column('position'),
+        sa.column('points'), sa.column('wins'), sa.column('created_at'), sa.column('updated_at'),
+    )
+
+    now = datetime.utcnow()
+    season_id = None
+    for race in bind.execute(sa.text("SELECT id, season_id FROM races ORDER BY season_id, round")):
+        if race.season_id != season_id:
+            season_id = race.season_id
+            drivers = defaultdict(lambda: [0.0, Counter()])
+            constructors = defaultdict(lambda: [0.0, Counter()])
+        if not results[race.id]:
+            continue
+
+        for result in results[race.id]:
+            for totals, key in ((drivers, result.driver_id), (constructors, result.constructor_id)):
+                totals[key][0] += result.points
+                if result.position is not None:
+                    totals[key][1][result.position] += 1
+
+        for table, key_column, totals in (
+            (driver_standings, 'driver_id', drivers),
+            (constructor_standings, 'constructor_id', constructors),
+        ):
+            op.bulk_insert(table, [
+                {'id': str(uuid.uuid4()), 'race_id': race.id, key_column: key, 'position': position,
+                 'points': points, 'wins': wins, 'created_at': now, 'updated_at': now}
+                for key, points, wins, position in _ranked(totals)
+            ])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_constructor_standings_constructor_id'), table_name='constructor_standings')
+    op.drop_table('constructor_standings')
+    op.drop_index(op.f('ix_driver_standings_driver_id'), table_name='driver_standings')
+    op.drop_table('driver_standings')
@@ -0,0 +1,66 @@
+"""Add numeric millisecond lap time columns
+
+Revision ID: 5e237de91a28
+Revises: 551492d8555e
+Create Date: 2026-10-17 13:58:30.166942
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import pandas as pd
+import sqlalchemy as sa
+
+from app.utils.laptime import parse_lap_times
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e237de91a28'
+down_revision: Union[str, None] = '551492d8555e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def _backfill(table: str, columns: dict) -> None:
+    """Parse the time strings of `table` with the vectorized parser and store milliseconds"""
+    bind = op.get_bind()
+    text_columns = ", ".join(columns.values())
+    frame = pd.read_sql(sa.text(f"SELECT id, {text_columns} FROM {table}"), bind)
+    if frame.empty:
+        return
+
+    for ms_column, text_column in columns.items():
+        frame[ms_column] = parse_lap_times(frame[text_column])
+
+    frame = frame[["id", *columns.keys()]].astype(object).where(frame.notna(), None)
+    assignments = ", ".join(f"{ms_column} = :{ms_column}" for ms_column in columns)
+    update = sa.text(f"UPDATE {table} SET {assignments} WHERE id = :id")
+    records = frame.to_dict("records")
+    for start in range(0, len(records), BACKFILL_BATCH_SIZE):
+        bind.execute(update, records[start:start + BACKFILL_BATCH_SIZE])
+
+
+def upgrade() -> None:
+    op.add_column('qualifying', sa.Column('q1_ms', sa.Integer(), nullable=True))
+    op.add_column('qualifying', sa.Column('q2_ms', sa.Integer(), nullable=True))
+    op.add_column('qualifying', sa.Column('q3_ms', sa.Integer(), nullable=True))
+    op.add_column('results', sa.Column('fastest_lap_time_ms', sa.Integer(), nullable=True))
+
+    # Existing rows can only be backfilled against a live database
+    if not context.is_offline_mode():
+        _backfill('qualifying', {'q1_ms': 'q1', 'q2_ms': 'q2', 'q3_ms': 'q3'})
+        _backfill('results', {'fastest_lap_time_ms': 'fastest_lap_time'})
+
+    op.create_index(op.f('ix_qualifying_q3_ms'), 'qualifying', ['q3_ms'], unique=False)
+    op.create_index(op.f('ix_results_fastest_lap_time_ms'), 'results', ['fastest_lap_time_ms'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_results_fastest_lap_time_ms'), table_name='results')
+    op.drop_index(op.f('ix_qualifying_q3_ms'), table_name='qualifying')
+    op.drop_column('results', 'fastest_lap_time_ms')
+    op.drop_column('qualifying', 'q3_ms')
+    op.drop_column('qualifying', 'q2_ms')
+    op.drop_column('qualifying', 'q1_ms')
@@ -0,0 +1,44 @@
+"""Add foreign key and composite indexes on results and qualifying
+
+Revision ID: 9e2d7d542f99
+Revises: c508f5e48718
+Create Date: 2026-10-17 10:03:27.118640
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e2d7d542f99'
+down_revision: Union[str, None] = 'c508f5e48718'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # results: (race_id, position_order) and (driver_id, race_id) also cover
+    # the race_id and driver_id foreign keys used by cascading deletes
+    op.create_index('ix_results_race_id_position_order', 'results', ['race_id', 'position_order'], unique=False)
+    op.create_index('ix_results_driver_id_race_id', 'results', ['driver_id', 'race_id'], unique=False)
+    op.create_index(op.f('ix_results_constructor_id'), 'results', ['constructor_id'], unique=False)
+
+    # qualifying
+    op.create_index('ix_qualifying_race_id_position', 'qualifying', ['race_id', 'position'], unique=False)
+    op.create_index('ix_qualifying_driver_id_race_id', 'qualifying', ['driver_id', 'race_id'], unique=False)
+    op.create_index(op.f('ix_qualifying_constructor_id'), 'qualifying', ['constructor_id'], unique=False)
+
+    # races: season calendar
+    op.create_index('ix_races_season_id_round', 'races', ['season_id', 'round'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_races_season_id_round', table_name='races')
+    op.drop_index(op.f('ix_qualifying_constructor_id'), table_name='qualifying')
+    op.drop_index('ix_qualifying_driver_id_race_id', table_name='qualifying')
+    op.drop_index('ix_qualifying_race_id_position', table_name='qualifying')
+    op.drop_index(op.f('ix_results_constructor_id'), table_name='results')
+    op.drop_index('ix_results_driver_id_race_id', table_name='results')
+    op.drop_index('ix_results_race_id_position_order', table_name='results')
@@ -0,0 +1,76 @@
+"""Use native uuid columns for primary and foreign keys
+
+Revision ID: c388f6e5d125
+Revises: 5e237de91a28
+Create Date: 2026-10-17 16:12:41.508213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c388f6e5d125'
+down_revision: Union[str, None] = '5e237de91a28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = [
+    'seasons', 'drivers', 'constructors', 'races',
+    'results', 'qualifying', 'driver_standings', 'constructor_standings',
+]
+
+# (table, column, referenced table, ondelete)
+FOREIGN_KEYS = [
+    ('races', 'season_id', 'seasons', 'CASCADE'),
+    ('results', 'race_id', 'races', 'CASCADE'),
+    ('results', 'driver_id', 'drivers', 'RESTRICT'),
+    ('results', 'constructor_id', 'constructors', 'RESTRICT'),
+    ('qualifying', 'race_id', 'races', 'CASCADE'),
+    ('qualifying', 'driver_id', 'drivers', 'RESTRICT'),
+    ('qualifying', 'constructor_id', 'constructors', 'RESTRICT'),
+    ('driver_standings', 'race_id', 'races', 'CASCADE'),
+    ('driver_standings', 'driver_id', 'drivers', 'RESTRICT'),
+    ('constructor_standings', 'race_id', 'races', 'CASCADE'),
+    ('constructor_standings', 'constructor_id', 'constructors', 'RESTRICT'),
+]
+
+
+def _fk_name(table: str, column: str) -> str:
+    # PostgreSQL's default name for the unnamed constraints of earlier revisions
+    return f'{table}_{column}_fkey'
+
+
+def _convert(type_, using: str) -> None:
+    for table, column, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(_fk_name(table, column), table, type_='foreignkey')
+
+    key_columns = [(table, 'id') for table in TABLES] + [(table, column) for table, column, _, _ in FOREIGN_KEYS]
+    for table, column in key_columns:
+        op.alter_column(
+            table, column,
+            type_=type_,
+            existing_nullable=False,
+            postgresql_using=f'{column}::{using}',
+        )
+
+    for table, column, referred, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(_fk_name(table, column), table, referred, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    # Keys are uuid4 strings: stored natively they take 16 bytes instead of
+    # 37, which shrinks the primary key and foreign key indexes and the join
+    # columns. Other databases keep the text representation.
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    _convert(postgresql.UUID(as_uuid=False), 'uuid')
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    _convert(sa.String(), 'varchar')
@@ -0,0 +1,30 @@
+"""Add keyset pagination indexes
+
+Revision ID: c508f5e48718
+Revises: 5e61670bf294
+Create Date: 2026-10-17 09:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c508f5e48718'
+down_revision: Union[str, None] = '5e61670bf294'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_races_date_id', 'races', ['date', 'id'], unique=False)
+    op.create_index('ix_drivers_family_name_id', 'drivers', ['family_name', 'id'], unique=False)
+    op.create_index('ix_constructors_name_id', 'constructors', ['name', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_constructors_name_id', table_name='constructors')
+    op.drop_index('ix_drivers_family_name_id', table_name='drivers')
+    op.drop_index('ix_races_date_id', table_name='races')
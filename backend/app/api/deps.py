@@ -1,6 +1,13 @@
-from typing import Generator
-from sqlalchemy.orm import Session
-from app.db.database import SessionLocal
+from typing import Annotated, AsyncGenerator, Generator
+from pydantic import AfterValidator
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+from app.db.database import SessionLocal, AsyncSessionLocal
+from app.db.types import canonical_uuid
+
+# Surrogate key parameter, canonicalized on the way in so that entity cache
+# keys, response cache keys and validators do not depend on its spelling
+UUIDParam = Annotated[str, AfterValidator(canonical_uuid)]
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -13,3 +20,20 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def get_session_factory() -> sessionmaker:
+    """
+    Dependency to get the session factory, for work that outlives the request
+    handler (e.g. streamed responses) and so cannot use its session.
+    """
+    return SessionLocal
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get an async database session (requires DB_ASYNC).
+    Yields an async session and ensures it's closed after use.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.api.deps import UUIDParam, get_db
+from app.models.lap import Lap
+from app.models.race import Race
+from app.schemas.analysis import RaceGapsResponse, RacePaceResponse, RaceStintsResponse, RaceUndercutsResponse
+from app.services.analysis import RaceAnalysis, race_analysis, race_laps_clause
+from app.utils.cache import response_cache
+from app.utils.conditional import conditional
+
+router = APIRouter()
+
+_VALIDATORS = (
+    (Race, lambda race_id, **_: Race.id == race_id),
+    (Lap, lambda race_id, **_: race_laps_clause(race_id)),
+)
+
+
+def _analysis(race_id: str, db: Session) -> RaceAnalysis:
+    analysis = race_analysis(db, race_id)
+    if analysis is None:
+        raise HTTPException(status_code=404, detail=f"Race {race_id} not found")
+    return analysis
+
+
+@router.get("/{race_id}/analysis/pace", response_model=RacePaceResponse)
+@conditional(*_VALIDATORS)
+@response_cache.cached("laps", "races", "drivers", "seasons", response_model=RacePaceResponse)
+def get_race_pace(race_id: UUIDParam, db: Session = Depends(get_db)):
+    """
+    Get each driver's race pace: median, mean and best lap time over
+    representative laps (no opening, in or out laps, none slower than 107% of
+    the race median) and the median's delta to the fastest driver.
+    """
+    return {"race_id": race_id, "drivers": _analysis(race_id, db).pace}
+
+
+@router.get("/{race_id}/analysis/stints", response_model=RaceStintsResponse)
+@conditional(*_VALIDATORS)
+@response_cache.cached("laps", "races", "drivers", "seasons", response_model=RaceStintsResponse)
+def get_race_stints(race_id: UUIDParam, db: Session = Depends(get_db)):
+    """
+    Get every stint with its compound and laps, and a linear fit of its
+    fuel-corrected lap times against tyre age: the degradation per lap and
+    the lap time on new tyres.
+    """
+    return {"race_id": race_id, "stints": _analysis(race_id, db).stints}
+
+
+@router.get("/{race_id}/analysis/gaps", response_model=RaceGapsResponse)
+@conditional(*_VALIDATORS)
+@response_cache.cached("laps", "races", "drivers", "seasons", response_model=RaceGapsResponse)
+def get_race_gaps(race_id: UUIDParam, db: Session = Depends(get_db)):
+    """
+    Get every driver's gap to the leader at the end of each lap, drivers in
+    classification order; null for laps a driver did not complete.
+    """
+    return {"race_id": race_id, **_analysis(race_id, db).gaps}
+
+
+@router.get("/{race_id}/analysis/undercuts", response_model=RaceUndercutsResponse)
+@conditional(*_VALIDATORS)
+@response_cache.cached("laps", "races", "drivers", "seasons", response_model=RaceUndercutsResponse)
+def get_race_undercuts(race_id: UUIDParam, db: Session = Depends(get_db)):
+    """
+    Get the laps on which a driver was within undercut range of the car
+    ahead: the interval was smaller than the time the car ahead would lose on
+    its worn tyres (stint degradation x tyre age) the lap after the driver
+    pitted for new ones.
+    """
+    return {"race_id": race_id, "windows": _analysis(race_id, db).undercuts}
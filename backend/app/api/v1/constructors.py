@@ -1,32 +1,75 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
-
-from app.api.deps import get_db
+from typing import List, Optional
+
+from app.api.deps import get_async_db, get_db
+from app.utils.batch import batch_get, batch_get_async, parse_ids
+from app.utils.cache import entity_cache, response_cache
+from app.utils.conditional import conditional, provides_validators
+from app.utils.entities import get_entity, get_entity_async
+from app.utils.formats import response_format
+from app.utils.pagination import keyset_paginate, keyset_paginate_async, page_response
+from app.utils.serialization import serialized
 from app.models.constructor import Constructor
+from app.schemas.batch import BatchResponse
 from app.schemas.constructor import ConstructorResponse, ConstructorCreate, ConstructorUpdate
 
 router = APIRouter()
 
+# Async read handlers, mounted ahead of `router` when DB_ASYNC is enabled
+async_router = APIRouter()
+
+# Sort key of the constructor list
+_ORDER = [Constructor.name, Constructor.id]
+
+# Validator source of a single constructor
+_CONSTRUCTOR = (Constructor, lambda constructor_id, **_: Constructor.constructor_id == constructor_id)
+
 
 @router.get("/", response_model=List[ConstructorResponse])
-def get_constructors(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@conditional(Constructor)
+@response_cache.cached("constructors", response_model=List[ConstructorResponse])
+def get_constructors(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+    fmt: str = Depends(response_format),
+    db: Session = Depends(get_db),
+):
     """
     Get all constructors.
+
+    Pass the cursor from the X-Next-Cursor response header as `after` to fetch
+    the next page by keyset instead of `skip`. Use `format=arrow|parquet` (or
+    the matching Accept header) for a columnar response.
     """
-    constructors = db.query(Constructor).order_by(Constructor.name).offset(skip).limit(limit).all()
-    return constructors
+    constructors, next_cursor = keyset_paginate(db, select(Constructor), _ORDER, limit, after=after, skip=skip)
+    return page_response(constructors, next_cursor, response, ConstructorResponse, fmt)
+
+
+@router.get("/batch", response_model=BatchResponse[ConstructorResponse])
+@conditional(Constructor)
+@serialized(BatchResponse[ConstructorResponse])
+def batch_get_constructors(ids: str, db: Session = Depends(get_db)):
+    """
+    Get several constructors by constructor_id in one query. `ids` is comma-separated; items keep
+    the request order and unknown ids are listed in `missing`.
+    """
+    return batch_get(db, Constructor.constructor_id, parse_ids(ids), ConstructorResponse, "constructor")
 
 
 @router.get("/{constructor_id}", response_model=ConstructorResponse)
+@conditional(_CONSTRUCTOR, last_modified=True)
+@provides_validators
+@serialized(ConstructorResponse)
 def get_constructor(constructor_id: str, db: Session = Depends(get_db)):
     """
     Get a specific constructor by constructor_id.
     """
-    constructor = db.query(Constructor).filter(Constructor.constructor_id == constructor_id).first()
-    if not constructor:
-        raise HTTPException(status_code=404, detail=f"Constructor {constructor_id} not found")
-    return constructor
+    return get_entity(db, Constructor.constructor_id, constructor_id, ConstructorResponse, "constructor")
 
 
 @router.post("/", response_model=ConstructorResponse, status_code=201)
@@ -42,6 +85,7 @@ def create_constructor(constructor_data: ConstructorCreate, db: Session = Depend
     constructor = Constructor(**constructor_data.model_dump())
     db.add(constructor)
     db.commit()
+    response_cache.invalidate("constructors")
     db.refresh(constructor)
     return constructor
 
@@ -60,6 +104,8 @@ def update_constructor(constructor_id: str, constructor_data: ConstructorUpdate,
         setattr(constructor, key, value)
 
     db.commit()
+    response_cache.invalidate("constructors")
+    entity_cache.invalidate(("constructor", constructor_id))
     db.refresh(constructor)
     return constructor
 
@@ -75,4 +121,39 @@ def delete_constructor(constructor_id: str, db: Session = Depends(get_db)):
 
     db.delete(constructor)
     db.commit()
+    response_cache.invalidate("constructors")
+    entity_cache.invalidate(("constructor", constructor_id))
     return None
+
+
+@async_router.get("/", response_model=List[ConstructorResponse])
+@conditional(Constructor)
+@response_cache.cached("constructors", response_model=List[ConstructorResponse])
+async def get_constructors_async(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+    fmt: str = Depends(response_format),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Async variant of get_constructors"""
+    constructors, next_cursor = await keyset_paginate_async(db, select(Constructor), _ORDER, limit, after=after, skip=skip)
+    return page_response(constructors, next_cursor, response, ConstructorResponse, fmt)
+
+
+@async_router.get("/batch", response_model=BatchResponse[ConstructorResponse])
+@conditional(Constructor)
+@serialized(BatchResponse[ConstructorResponse])
+async def batch_get_constructors_async(ids: str, db: AsyncSession = Depends(get_async_db)):
+    """Async variant of batch_get_constructors"""
+    return await batch_get_async(db, Constructor.constructor_id, parse_ids(ids), ConstructorResponse, "constructor")
+
+
+@async_router.get("/{constructor_id}", response_model=ConstructorResponse)
+@conditional(_CONSTRUCTOR, last_modified=True)
+@provides_validators
+@serialized(ConstructorResponse)
+async def get_constructor_async(constructor_id: str, db: AsyncSession = Depends(get_async_db)):
+    """Async variant of get_constructor"""
+    return await get_entity_async(db, Constructor.constructor_id, constructor_id, ConstructorResponse, "constructor")
@@ -1,32 +1,75 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
-
-from app.api.deps import get_db
+from typing import List, Optional
+
+from app.api.deps import get_async_db, get_db
+from app.utils.batch import batch_get, batch_get_async, parse_ids
+from app.utils.cache import entity_cache, response_cache
+from app.utils.conditional import conditional, provides_validators
+from app.utils.entities import get_entity, get_entity_async
+from app.utils.formats import response_format
+from app.utils.pagination import keyset_paginate, keyset_paginate_async, page_response
+from app.utils.serialization import serialized
 from app.models.driver import Driver
+from app.schemas.batch import BatchResponse
 from app.schemas.driver import DriverResponse, DriverCreate, DriverUpdate
 
 router = APIRouter()
 
+# Async read handlers, mounted ahead of `router` when DB_ASYNC is enabled
+async_router = APIRouter()
+
+# Sort key of the driver list
+_ORDER = [Driver.family_name, Driver.id]
+
+# Validator source of a single driver
+_DRIVER = (Driver, lambda driver_id, **_: Driver.driver_id == driver_id)
+
 
 @router.get("/", response_model=List[DriverResponse])
-def get_drivers(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@conditional(Driver)
+@response_cache.cached("drivers", response_model=List[DriverResponse])
+def get_drivers(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+    fmt: str = Depends(response_format),
+    db: Session = Depends(get_db),
+):
     """
     Get all drivers.
+
+    Pass the cursor from the X-Next-Cursor response header as `after` to fetch
+    the next page by keyset instead of `skip`. Use `format=arrow|parquet` (or
+    the matching Accept header) for a columnar response.
     """
-    drivers = db.query(Driver).order_by(Driver.family_name).offset(skip).limit(limit).all()
-    return drivers
+    drivers, next_cursor = keyset_paginate(db, select(Driver), _ORDER, limit, after=after, skip=skip)
+    return page_response(drivers, next_cursor, response, DriverResponse, fmt)
+
+
+@router.get("/batch", response_model=BatchResponse[DriverResponse])
+@conditional(Driver)
+@serialized(BatchResponse[DriverResponse])
+def batch_get_drivers(ids: str, db: Session = Depends(get_db)):
+    """
+    Get several drivers by driver_id in one query. `ids` is comma-separated; items keep
+    the request order and unknown ids are listed in `missing`.
+    """
+    return batch_get(db, Driver.driver_id, parse_ids(ids), DriverResponse, "driver")
 
 
 @router.get("/{driver_id}", response_model=DriverResponse)
+@conditional(_DRIVER, last_modified=True)
+@provides_validators
+@serialized(DriverResponse)
 def get_driver(driver_id: str, db: Session = Depends(get_db)):
     """
     Get a specific driver by driver_id.
     """
-    driver = db.query(Driver).filter(Driver.driver_id == driver_id).first()
-    if not driver:
-        raise HTTPException(status_code=404, detail=f"Driver {driver_id} not found")
-    return driver
+    return get_entity(db, Driver.driver_id, driver_id, DriverResponse, "driver")
 
 
 @router.post("/", response_model=DriverResponse, status_code=201)
@@ -42,6 +85,7 @@ def create_driver(driver_data: DriverCreate, db: Session = Depends(get_db)):
     driver = Driver(**driver_data.model_dump())
     db.add(driver)
     db.commit()
+    response_cache.invalidate("drivers")
     db.refresh(driver)
     return driver
 
@@ -60,6 +104,8 @@ def update_driver(driver_id: str, driver_data: DriverUpdate, db: Session = Depen
         setattr(driver, key, value)
 
     db.commit()
+    response_cache.invalidate("drivers")
+    entity_cache.invalidate(("driver", driver_id))
     db.refresh(driver)
     return driver
 
@@ -75,4 +121,39 @@ def delete_driver(driver_id: str, db: Session = Depends(get_db)):
 
     db.delete(driver)
     db.commit()
+    response_cache.invalidate("drivers")
+    entity_cache.invalidate(("driver", driver_id))
     return None
+
+
+@async_router.get("/", response_model=List[DriverResponse])
+@conditional(Driver)
+@response_cache.cached("drivers", response_model=List[DriverResponse])
+async def get_drivers_async(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+    fmt: str = Depends(response_format),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Async variant of get_drivers"""
+    drivers, next_cursor = await keyset_paginate_async(db, select(Driver), _ORDER, limit, after=after, skip=skip)
+    return page_response(drivers, next_cursor, response, DriverResponse, fmt)
+
+
+@async_router.get("/batch", response_model=BatchResponse[DriverResponse])
+@conditional(Driver)
+@serialized(BatchResponse[DriverResponse])
+async def batch_get_drivers_async(ids: str, db: AsyncSession = Depends(get_async_db)):
+    """Async variant of batch_get_drivers"""
+    return await batch_get_async(db, Driver.driver_id, parse_ids(ids), DriverResponse, "driver")
+
+
+@async_router.get("/{driver_id}", response_model=DriverResponse)
+@conditional(_DRIVER, last_modified=True)
+@provides_validators
+@serialized(DriverResponse)
+async def get_driver_async(driver_id: str, db: AsyncSession = Depends(get_async_db)):
+    """Async variant of get_driver"""
+    return await get_entity_async(db, Driver.driver_id, driver_id, DriverResponse, "driver")
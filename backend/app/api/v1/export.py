@@ -0,0 +1,130 @@
+"""
+Streaming bulk exports.
+
+Rows are read through a server-side cursor in partitions of EXPORT_BATCH_SIZE
+and written to the response as they arrive, so memory stays flat regardless
+of the number of rows and the first bytes go out immediately.
+"""
+import csv
+import io
+import json
+from datetime import date, datetime, time
+from typing import Iterator, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.deps import get_db, get_session_factory
+from app.config import settings
+from app.models.qualifying import Qualifying
+from app.models.race import Race
+from app.models.result import RaceResult
+from app.models.season import Season
+
+router = APIRouter()
+
+# Exported table -> model; every row also carries its season year and round
+EXPORTS = {
+    "results": RaceResult,
+    "qualifying": Qualifying,
+    "races": Race,
+}
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _export_statement(dataset: str, year: Optional[int]):
+    model = EXPORTS[dataset]
+    if model is Race:
+        statement = select(Season.year.label("season"), *Race.__table__.columns).join(Season, Season.id == Race.season_id)
+        order = [Race.round]
+    else:
+        statement = (
+            select(Season.year.label("season"), Race.round, *model.__table__.columns)
+            .join(Race, Race.id == model.race_id)
+            .join(Season, Season.id == Race.season_id)
+        )
+        order = [Race.round, model.position_order if model is RaceResult else model.position]
+    if year is not None:
+        statement = statement.where(Season.year == year)
+    return statement.order_by(Season.year, *order)
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _stream(statement, fmt: str, session_factory: sessionmaker) -> Iterator[str]:
+    """Generate the export body; uses its own session since it runs after the request handler returns"""
+    db = session_factory()
+    try:
+        result = db.execute(statement.execution_options(stream_results=True, yield_per=settings.EXPORT_BATCH_SIZE))
+        columns = list(result.keys())
+
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            for partition in result.partitions():
+                writer.writerows(partition)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            yield buffer.getvalue()
+        else:
+            for partition in result.partitions():
+                yield "".join(
+                    json.dumps(dict(zip(columns, row)), default=_json_default) + "\n" for row in partition
+                )
+    finally:
+        db.close()
+
+
+def _export(
+    dataset: str, fmt: str, season: Optional[int], db: Session, session_factory: sessionmaker
+) -> StreamingResponse:
+    if dataset not in EXPORTS:
+        raise HTTPException(status_code=404, detail=f"Export {dataset} not found")
+    if season is not None and not db.query(Season.id).filter(Season.year == season).first():
+        raise HTTPException(status_code=404, detail=f"Season {season} not found")
+
+    filename = f"{dataset}-{season}.{fmt}" if season is not None else f"{dataset}.{fmt}"
+    return StreamingResponse(
+        _stream(_export_statement(dataset, season), fmt, session_factory),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/{dataset}.ndjson")
+def export_ndjson(
+    dataset: str,
+    season: Optional[int] = None,
+    db: Session = Depends(get_db),
+    session_factory: sessionmaker = Depends(get_session_factory),
+):
+    """
+    Stream results, qualifying or races as newline-delimited JSON, optionally
+    for a single season.
+    """
+    return _export(dataset, "ndjson", season, db, session_factory)
+
+
+@router.get("/{dataset}.csv")
+def export_csv(
+    dataset: str,
+    season: Optional[int] = None,
+    db: Session = Depends(get_db),
+    session_factory: sessionmaker = Depends(get_session_factory),
+):
+    """
+    Stream results, qualifying or races as CSV, optionally for a single season.
+    """
+    return _export(dataset, "csv", season, db, session_factory)
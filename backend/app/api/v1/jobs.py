@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Body, HTTPException, Response
+
+from app.config import settings
+from app.schemas.job import JobCreate, JobResponse
+from app.worker import JobQueueUnavailable, job_status, submit_job
+
+router = APIRouter()
+
+
+@router.post("/", response_model=JobResponse, status_code=202)
+def create_job(response: Response, job: JobCreate = Body()):
+    """
+    Submit a background job: season ingestion, standings recomputation or
+    cache warming. Poll the returned job for progress and result.
+    """
+    try:
+        created = submit_job(job.type, job.params.model_dump())
+    except JobQueueUnavailable as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+    response.headers["Location"] = f"{settings.API_V1_PREFIX}/jobs/{created['id']}"
+    return created
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(job_id: str):
+    """Get the state, progress and result of a job"""
+    try:
+        status = job_status(job_id)
+    except JobQueueUnavailable as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return status
@@ -1,47 +1,338 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
+from typing import List, Literal, Optional
 
-from app.api.deps import get_db
+from app.api.deps import UUIDParam, get_async_db, get_db
+from app.db.types import canonical_uuid
+from app.utils.batch import batch_get, batch_get_async, parse_ids
+from app.utils.cache import entity_cache, response_cache, season_ttl
+from app.utils.conditional import (
+    columns_validators, conditional, inline_validators, provides_validators, validator_columns,
+)
+from app.utils.entities import get_entity, get_entity_async
+from app.utils.formats import JSON, response_format, tabular_response
+from app.utils.pagination import keyset_paginate, keyset_paginate_async, page_response
+from app.utils.serialization import serialized
+from app.models.constructor import Constructor
+from app.models.driver import Driver
+from app.models.lap import Lap
+from app.models.qualifying import Qualifying
 from app.models.race import Race
-from app.schemas.race import RaceResponse, RaceCreate, RaceUpdate
+from app.models.result import RaceResult
+from app.models.season import Season
+from app.schemas.batch import BatchResponse
+from app.schemas.lap import LapResponse
+from app.schemas.race import (
+    RaceResponse, RaceCalendarResponse, RaceFullResponse, RaceResultsSummary, RaceCreate, RaceUpdate
+)
+from app.schemas.result import ResultCreate, ResultResponse, BulkUpsertResponse
+from app.schemas.qualifying import QualifyingCreate, QualifyingResponse
+from app.services.analysis import race_laps_clause
+from app.services.bulk import DuplicateRows, bulk_upsert_results, bulk_upsert_qualifying
+from app.services.standings import update_standings, update_standings_for_race
 
 router = APIRouter()
 
+# Async read handlers, mounted ahead of `router` when DB_ASYNC is enabled
+async_router = APIRouter()
+
+# Sort key of the race list, latest first
+_ORDER = [Race.date, Race.id]
+
+# Validator source of a single race
+_RACE = (Race, lambda race_id, **_: Race.id == race_id)
+
+
+def _season_races(year: int):
+    """Subquery of the race ids of a season"""
+    return select(Race.id).join(Season, Season.id == Race.season_id).where(Season.year == year)
+
+
+def _season_calendar_statement(year: int, include_summary: bool):
+    """
+    Single query for a season calendar: the season outer-joined to its races,
+    so an unknown year yields no rows and a season without races one row with
+    no race. With `include_summary`, the winner and pole sitter of every race
+    are joined in, each picked with ROW_NUMBER() over the race's classification.
+    """
+    statement = select(Season.id, Race).select_from(Season).outerjoin(Race, Race.season_id == Season.id)
+
+    if include_summary:
+        # Rank only this season's rows rather than the whole results table
+        season_races = _season_races(year)
+        winners = (
+            select(
+                RaceResult.race_id,
+                Driver.driver_id.label("winner_driver_id"),
+                Constructor.constructor_id.label("winner_constructor_id"),
+                func.row_number().over(partition_by=RaceResult.race_id, order_by=RaceResult.position_order).label("rank"),
+            )
+            .join(Driver, Driver.id == RaceResult.driver_id)
+            .join(Constructor, Constructor.id == RaceResult.constructor_id)
+            .where(RaceResult.race_id.in_(season_races))
+            .subquery()
+        )
+        poles = (
+            select(
+                Qualifying.race_id,
+                Driver.driver_id.label("pole_driver_id"),
+                func.row_number().over(partition_by=Qualifying.race_id, order_by=Qualifying.position).label("rank"),
+            )
+            .join(Driver, Driver.id == Qualifying.driver_id)
+            .where(Qualifying.race_id.in_(season_races))
+            .subquery()
+        )
+        statement = (
+            statement
+            .add_columns(winners.c.winner_driver_id, winners.c.winner_constructor_id, poles.c.pole_driver_id)
+            .outerjoin(winners, (winners.c.race_id == Race.id) & (winners.c.rank == 1))
+            .outerjoin(poles, (poles.c.race_id == Race.id) & (poles.c.rank == 1))
+        )
+
+    return statement.where(Season.year == year).order_by(Race.round)
+
+
+# Validator sources of a season calendar
+_CALENDAR_SOURCES = (
+    (Season, lambda year, **_: Season.year == year),
+    (Race, lambda year, **_: Race.id.in_(_season_races(year))),
+    (RaceResult, lambda year, **_: RaceResult.race_id.in_(_season_races(year))),
+    (Qualifying, lambda year, **_: Qualifying.race_id.in_(_season_races(year))),
+    Driver,
+    Constructor,
+)
+
+
+def _season_calendar(year: int, rows, validators: list, include_summary: bool, fmt: str):
+    if not rows:
+        raise HTTPException(status_code=404, detail=f"Season {year} not found")
+    if validators:
+        columns_validators(rows[0][-len(validators):])
+
+    races = [row.Race for row in rows if row.Race is not None]
+    if fmt != JSON:
+        return tabular_response(races, RaceResponse, fmt)
+    if not include_summary:
+        return races
+
+    calendar = []
+    for row in rows:
+        if row.Race is None:
+            continue
+        race = RaceCalendarResponse.model_validate(row.Race)
+        race.results_summary = RaceResultsSummary(
+            winner_driver_id=row.winner_driver_id,
+            winner_constructor_id=row.winner_constructor_id,
+            pole_driver_id=row.pole_driver_id,
+        )
+        calendar.append(race)
+    return calendar
+
 
 @router.get("/", response_model=List[RaceResponse])
-def get_races(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@conditional(Race)
+@response_cache.cached("races", "seasons", response_model=List[RaceResponse])
+def get_races(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+    fmt: str = Depends(response_format),
+    db: Session = Depends(get_db),
+):
     """
     Get all races.
+
+    Pass the cursor from the X-Next-Cursor response header as `after` to fetch
+    the next page by keyset instead of `skip`. Use `format=arrow|parquet` (or
+    the matching Accept header) for a columnar response.
     """
-    races = db.query(Race).order_by(Race.date.desc()).offset(skip).limit(limit).all()
-    return races
+    races, next_cursor = keyset_paginate(db, select(Race), _ORDER, limit, after=after, skip=skip, descending=True)
+    return page_response(races, next_cursor, response, RaceResponse, fmt)
+
+
+@router.get("/batch", response_model=BatchResponse[RaceResponse])
+@conditional(Race)
+@serialized(BatchResponse[RaceResponse])
+def batch_get_races(ids: str, db: Session = Depends(get_db)):
+    """
+    Get several races by ID in one query. `ids` is comma-separated; items keep
+    the request order and unknown ids are listed in `missing`.
+    """
+    return batch_get(db, Race.id, parse_ids(ids, canonical_uuid), RaceResponse, "race")
 
 
 @router.get("/{race_id}", response_model=RaceResponse)
-def get_race(race_id: str, db: Session = Depends(get_db)):
+@conditional(_RACE, last_modified=True)
+@provides_validators
+@serialized(RaceResponse)
+def get_race(race_id: UUIDParam, db: Session = Depends(get_db)):
     """
     Get a specific race by ID.
     """
-    race = db.query(Race).filter(Race.id == race_id).first()
+    return get_entity(db, Race.id, race_id, RaceResponse, "race")
+
+
+@router.get("/{race_id}/full", response_model=RaceFullResponse)
+@conditional(
+    _RACE,
+    (RaceResult, lambda race_id, **_: RaceResult.race_id == race_id),
+    (Qualifying, lambda race_id, **_: Qualifying.race_id == race_id),
+    Driver,
+    Constructor,
+)
+@response_cache.cached("races", "results", "drivers", "constructors", "seasons", response_model=RaceFullResponse)
+def get_race_full(race_id: UUIDParam, db: Session = Depends(get_db)):
+    """
+    Get a race with its results and qualifying, each row with its driver and
+    constructor. Loaded in three queries regardless of grid size.
+    """
+    race = (
+        db.query(Race)
+        .options(
+            selectinload(Race.results).options(joinedload(RaceResult.driver), joinedload(RaceResult.constructor)),
+            selectinload(Race.qualifying).options(joinedload(Qualifying.driver), joinedload(Qualifying.constructor)),
+        )
+        .filter(Race.id == race_id)
+        .first()
+    )
     if not race:
         raise HTTPException(status_code=404, detail=f"Race {race_id} not found")
-    return race
+
+    response = RaceFullResponse.model_validate(race)
+    response.results.sort(key=lambda result: result.position_order)
+    response.qualifying.sort(key=lambda row: row.position)
+    return response
 
 
-@router.get("/season/{year}", response_model=List[RaceResponse])
-def get_races_by_season(year: int, db: Session = Depends(get_db)):
+@router.get("/season/{year}", response_model=List[RaceCalendarResponse])
+@conditional(*_CALENDAR_SOURCES)
+@response_cache.cached(
+    "races", "seasons", "results", response_model=List[RaceCalendarResponse], ttl=season_ttl
+)
+@inline_validators
+def get_races_by_season(
+    year: int,
+    include: Optional[Literal["results_summary"]] = None,
+    fmt: str = Depends(response_format),
+    db: Session = Depends(get_db),
+):
     """
-    Get all races for a specific season.
+    Get all races for a specific season in one query. With
+    `include=results_summary`, each race also carries its winner and pole
+    sitter. Supports `format=arrow|parquet`.
     """
-    from app.models.season import Season
+    include_summary = include == "results_summary"
+    # The ETag/Last-Modified aggregates come back with the calendar rows
+    validators = validator_columns()
+    rows = db.execute(_season_calendar_statement(year, include_summary).add_columns(*validators)).all()
+    return _season_calendar(year, rows, validators, include_summary, fmt)
 
-    season = db.query(Season).filter(Season.year == year).first()
-    if not season:
-        raise HTTPException(status_code=404, detail=f"Season {year} not found")
 
-    races = db.query(Race).filter(Race.season_id == season.id).order_by(Race.round).all()
-    return races
+@router.get("/{race_id}/results", response_model=List[ResultResponse])
+@conditional(
+    _RACE,
+    (RaceResult, lambda race_id, **_: RaceResult.race_id == race_id),
+)
+@response_cache.cached("results", "races", "seasons", response_model=List[ResultResponse])
+def get_race_results(race_id: UUIDParam, fmt: str = Depends(response_format), db: Session = Depends(get_db)):
+    """
+    Get the classification of a race. Supports `format=arrow|parquet`.
+    """
+    if not db.query(Race.id).filter(Race.id == race_id).first():
+        raise HTTPException(status_code=404, detail=f"Race {race_id} not found")
+
+    results = db.query(RaceResult).filter(RaceResult.race_id == race_id).order_by(RaceResult.position_order).all()
+    if fmt != JSON:
+        return tabular_response(results, ResultResponse, fmt)
+    return results
+
+
+@router.get("/{race_id}/qualifying", response_model=List[QualifyingResponse])
+@conditional(
+    _RACE,
+    (Qualifying, lambda race_id, **_: Qualifying.race_id == race_id),
+)
+@response_cache.cached("results", "races", "seasons", response_model=List[QualifyingResponse])
+def get_race_qualifying(race_id: UUIDParam, fmt: str = Depends(response_format), db: Session = Depends(get_db)):
+    """
+    Get the qualifying classification of a race. Supports `format=arrow|parquet`.
+    """
+    if not db.query(Race.id).filter(Race.id == race_id).first():
+        raise HTTPException(status_code=404, detail=f"Race {race_id} not found")
+
+    qualifying = db.query(Qualifying).filter(Qualifying.race_id == race_id).order_by(Qualifying.position).all()
+    if fmt != JSON:
+        return tabular_response(qualifying, QualifyingResponse, fmt)
+    return qualifying
+
+
+@router.get("/{race_id}/laps", response_model=List[LapResponse])
+@conditional(
+    _RACE,
+    (Lap, lambda race_id, **_: race_laps_clause(race_id)),
+)
+@response_cache.cached("laps", "races", "drivers", "seasons", response_model=List[LapResponse])
+def get_race_laps(
+    race_id: UUIDParam,
+    driver: Optional[str] = Query(None, description="Driver ID, e.g. hamilton"),
+    from_lap: Optional[int] = Query(None, ge=1),
+    to_lap: Optional[int] = Query(None, ge=1),
+    fmt: str = Depends(response_format),
+    db: Session = Depends(get_db),
+):
+    """
+    Get the lap-by-lap data of a race, ordered by driver and lap, optionally
+    for one driver and a range of laps. Supports `format=arrow|parquet`.
+    """
+    season_year = (
+        db.query(Season.year)
+        .join(Race, Race.season_id == Season.id)
+        .filter(Race.id == race_id)
+        .scalar()
+    )
+    if season_year is None:
+        raise HTTPException(status_code=404, detail=f"Race {race_id} not found")
+
+    # The season filter restricts the scan to one partition
+    query = (
+        db.query(
+            Lap.race_id,
+            Driver.driver_id,
+            Lap.driver_id.label("driver_uuid"),
+            Lap.lap,
+            Lap.position,
+            Lap.lap_time_ms,
+            Lap.sector_1_ms,
+            Lap.sector_2_ms,
+            Lap.sector_3_ms,
+            Lap.session_time_ms,
+            Lap.stint,
+            Lap.compound,
+            Lap.tyre_life,
+            Lap.pit_in,
+            Lap.pit_out,
+        )
+        .join(Driver, Driver.id == Lap.driver_id)
+        .filter(Lap.season_year == season_year, Lap.race_id == race_id)
+    )
+    if driver is not None:
+        driver_pk = db.query(Driver.id).filter(Driver.driver_id == driver).scalar()
+        if driver_pk is None:
+            raise HTTPException(status_code=404, detail=f"Driver {driver} not found")
+        query = query.filter(Lap.driver_id == driver_pk)
+    if from_lap is not None:
+        query = query.filter(Lap.lap >= from_lap)
+    if to_lap is not None:
+        query = query.filter(Lap.lap <= to_lap)
+
+    laps = query.order_by(Lap.driver_id, Lap.lap).all()
+    if fmt != JSON:
+        return tabular_response(laps, LapResponse, fmt)
+    return laps
 
 
 @router.post("/", response_model=RaceResponse, status_code=201)
@@ -52,12 +343,13 @@ def create_race(race_data: RaceCreate, db: Session = Depends(get_db)):
     race = Race(**race_data.model_dump())
     db.add(race)
     db.commit()
+    response_cache.invalidate("races")
     db.refresh(race)
     return race
 
 
 @router.put("/{race_id}", response_model=RaceResponse)
-def update_race(race_id: str, race_data: RaceUpdate, db: Session = Depends(get_db)):
+def update_race(race_id: UUIDParam, race_data: RaceUpdate, db: Session = Depends(get_db)):
     """
     Update a race.
     """
@@ -69,13 +361,20 @@ def update_race(race_id: str, race_data: RaceUpdate, db: Session = Depends(get_d
     for key, value in update_data.items():
         setattr(race, key, value)
 
+    # Cumulative standings depend on the round order
+    if "round" in update_data:
+        db.flush()
+        update_standings(db, race.season_id)
+
     db.commit()
+    response_cache.invalidate("races", "standings")
+    entity_cache.invalidate(("race", race_id))
     db.refresh(race)
     return race
 
 
 @router.delete("/{race_id}", status_code=204)
-def delete_race(race_id: str, db: Session = Depends(get_db)):
+def delete_race(race_id: UUIDParam, db: Session = Depends(get_db)):
     """
     Delete a race.
     """
@@ -83,6 +382,124 @@ def delete_race(race_id: str, db: Session = Depends(get_db)):
     if not race:
         raise HTTPException(status_code=404, detail=f"Race {race_id} not found")
 
+    season_id, race_round = race.season_id, race.round
     db.delete(race)
+    db.flush()
+    # Later rounds no longer include this race's points
+    update_standings(db, season_id, from_round=race_round)
     db.commit()
+    response_cache.invalidate("races", "standings")
+    entity_cache.invalidate(("race", race_id))
     return None
+
+
+@router.post("/{race_id}/results:bulk", response_model=BulkUpsertResponse)
+def bulk_upsert_race_results(
+    race_id: UUIDParam,
+    results_data: List[ResultCreate],
+    replace: bool = False,
+    db: Session = Depends(get_db),
+):
+    """
+    Insert or update the results of a race in bulk, keyed by driver.
+    With `replace=true`, results of drivers not in the payload are deleted.
+    """
+    race = db.query(Race).filter(Race.id == race_id).first()
+    if not race:
+        raise HTTPException(status_code=404, detail=f"Race {race_id} not found")
+
+    try:
+        counts = bulk_upsert_results(db, race_id, [row.model_dump() for row in results_data], replace=replace)
+        update_standings_for_race(db, race)
+        db.commit()
+    except DuplicateRows as exc:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(exc))
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Unknown driver or constructor in results")
+    response_cache.invalidate("results", "standings")
+    return BulkUpsertResponse(race_id=race_id, **counts)
+
+
+@router.post("/{race_id}/qualifying:bulk", response_model=BulkUpsertResponse)
+def bulk_upsert_race_qualifying(
+    race_id: UUIDParam,
+    qualifying_data: List[QualifyingCreate],
+    replace: bool = False,
+    db: Session = Depends(get_db),
+):
+    """
+    Insert or update the qualifying classification of a race in bulk, keyed by driver.
+    With `replace=true`, rows of drivers not in the payload are deleted.
+    """
+    race = db.query(Race).filter(Race.id == race_id).first()
+    if not race:
+        raise HTTPException(status_code=404, detail=f"Race {race_id} not found")
+
+    try:
+        counts = bulk_upsert_qualifying(db, race_id, [row.model_dump() for row in qualifying_data], replace=replace)
+        db.commit()
+    except DuplicateRows as exc:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(exc))
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Unknown driver or constructor in qualifying")
+    response_cache.invalidate("results")
+    return BulkUpsertResponse(race_id=race_id, **counts)
+
+
+@async_router.get("/", response_model=List[RaceResponse])
+@conditional(Race)
+@response_cache.cached("races", "seasons", response_model=List[RaceResponse])
+async def get_races_async(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+    fmt: str = Depends(response_format),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Async variant of get_races"""
+    races, next_cursor = await keyset_paginate_async(
+        db, select(Race), _ORDER, limit, after=after, skip=skip, descending=True
+    )
+    return page_response(races, next_cursor, response, RaceResponse, fmt)
+
+
+@async_router.get("/batch", response_model=BatchResponse[RaceResponse])
+@conditional(Race)
+@serialized(BatchResponse[RaceResponse])
+async def batch_get_races_async(ids: str, db: AsyncSession = Depends(get_async_db)):
+    """Async variant of batch_get_races"""
+    return await batch_get_async(db, Race.id, parse_ids(ids, canonical_uuid), RaceResponse, "race")
+
+
+@async_router.get("/{race_id}", response_model=RaceResponse)
+@conditional(_RACE, last_modified=True)
+@provides_validators
+@serialized(RaceResponse)
+async def get_race_async(race_id: UUIDParam, db: AsyncSession = Depends(get_async_db)):
+    """Async variant of get_race"""
+    return await get_entity_async(db, Race.id, race_id, RaceResponse, "race")
+
+
+@async_router.get("/season/{year}", response_model=List[RaceCalendarResponse])
+@conditional(*_CALENDAR_SOURCES)
+@response_cache.cached(
+    "races", "seasons", "results", response_model=List[RaceCalendarResponse], ttl=season_ttl
+)
+@inline_validators
+async def get_races_by_season_async(
+    year: int,
+    include: Optional[Literal["results_summary"]] = None,
+    fmt: str = Depends(response_format),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Async variant of get_races_by_season"""
+    include_summary = include == "results_summary"
+    validators = validator_columns()
+    statement = _season_calendar_statement(year, include_summary).add_columns(*validators)
+    rows = (await db.execute(statement)).all()
+    return _season_calendar(year, rows, validators, include_summary, fmt)
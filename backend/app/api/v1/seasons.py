@@ -1,32 +1,134 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-
-from app.api.deps import get_db
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+from typing import List, Optional
+
+from app.api.deps import get_async_db, get_db
+from app.api.v1.races import _season_races
+from app.utils.batch import batch_get, batch_get_async, parse_ids
+from app.utils.cache import entity_cache, response_cache, season_ttl
+from app.utils.conditional import conditional, provides_validators
+from app.utils.entities import get_entity, get_entity_async
+from app.utils.formats import response_format
+from app.utils.pagination import keyset_paginate, keyset_paginate_async, page_response
+from app.utils.serialization import serialized
+from app.models.constructor import Constructor
+from app.models.driver import Driver
+from app.models.race import Race
 from app.models.season import Season
+from app.models.standing import DriverStanding, ConstructorStanding
+from app.schemas.batch import BatchResponse
 from app.schemas.season import SeasonResponse, SeasonCreate, SeasonUpdate
+from app.schemas.standing import DriverStandingsResponse, ConstructorStandingsResponse
+from app.services.standings import standings_race
 
 router = APIRouter()
 
+# Async read handlers, mounted ahead of `router` when DB_ASYNC is enabled
+async_router = APIRouter()
+
+# Sort key of the season list, latest first
+_ORDER = [Season.year, Season.id]
+
+# Validator source of a single season
+_SEASON = (Season, lambda year, **_: Season.year == year)
+
 
 @router.get("/", response_model=List[SeasonResponse])
-def get_seasons(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@conditional(Season)
+@response_cache.cached("seasons", response_model=List[SeasonResponse])
+def get_seasons(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+    fmt: str = Depends(response_format),
+    db: Session = Depends(get_db),
+):
     """
     Get all seasons.
+
+    Pass the cursor from the X-Next-Cursor response header as `after` to fetch
+    the next page by keyset instead of `skip`. Use `format=arrow|parquet` (or
+    the matching Accept header) for a columnar response.
+    """
+    seasons, next_cursor = keyset_paginate(db, select(Season), _ORDER, limit, after=after, skip=skip, descending=True)
+    return page_response(seasons, next_cursor, response, SeasonResponse, fmt)
+
+
+@router.get("/batch", response_model=BatchResponse[SeasonResponse])
+@conditional(Season)
+@serialized(BatchResponse[SeasonResponse])
+def batch_get_seasons(ids: str, db: Session = Depends(get_db)):
+    """
+    Get several seasons by year in one query. `ids` is comma-separated; items keep
+    the request order and unknown ids are listed in `missing`.
     """
-    seasons = db.query(Season).order_by(Season.year.desc()).offset(skip).limit(limit).all()
-    return seasons
+    return batch_get(db, Season.year, parse_ids(ids, int), SeasonResponse, "season")
 
 
 @router.get("/{year}", response_model=SeasonResponse)
+@conditional(_SEASON, last_modified=True)
+@provides_validators
+@serialized(SeasonResponse)
 def get_season(year: int, db: Session = Depends(get_db)):
     """
     Get a specific season by year.
     """
-    season = db.query(Season).filter(Season.year == year).first()
-    if not season:
-        raise HTTPException(status_code=404, detail=f"Season {year} not found")
-    return season
+    return get_entity(db, Season.year, year, SeasonResponse, "season")
+
+
+def _standings_race_or_404(db: Session, year: int, round: Optional[int]):
+    race = standings_race(db, year, round)
+    if not race:
+        after = f" after round {round}" if round is not None else ""
+        raise HTTPException(status_code=404, detail=f"No standings for season {year}{after}")
+    return race
+
+
+@router.get("/{year}/standings/drivers", response_model=DriverStandingsResponse)
+@conditional(
+    (Race, lambda year, **_: Race.id.in_(_season_races(year))),
+    (DriverStanding, lambda year, **_: DriverStanding.race_id.in_(_season_races(year))),
+    Driver,
+)
+@response_cache.cached("standings", "drivers", "seasons", response_model=DriverStandingsResponse, ttl=season_ttl)
+def get_driver_standings(year: int, round: Optional[int] = None, db: Session = Depends(get_db)):
+    """
+    Get the driver standings of a season after a round (latest round by default).
+    """
+    race = _standings_race_or_404(db, year, round)
+    standings = (
+        db.query(DriverStanding)
+        .options(joinedload(DriverStanding.driver))
+        .filter(DriverStanding.race_id == race.id)
+        .order_by(DriverStanding.position)
+        .all()
+    )
+    return DriverStandingsResponse(season=year, round=race.round, standings=standings)
+
+
+@router.get("/{year}/standings/constructors", response_model=ConstructorStandingsResponse)
+@conditional(
+    (Race, lambda year, **_: Race.id.in_(_season_races(year))),
+    (ConstructorStanding, lambda year, **_: ConstructorStanding.race_id.in_(_season_races(year))),
+    Constructor,
+)
+@response_cache.cached("standings", "constructors", "seasons", response_model=ConstructorStandingsResponse, ttl=season_ttl)
+def get_constructor_standings(year: int, round: Optional[int] = None, db: Session = Depends(get_db)):
+    """
+    Get the constructor standings of a season after a round (latest round by default).
+    """
+    race = _standings_race_or_404(db, year, round)
+    standings = (
+        db.query(ConstructorStanding)
+        .options(joinedload(ConstructorStanding.constructor))
+        .filter(ConstructorStanding.race_id == race.id)
+        .order_by(ConstructorStanding.position)
+        .all()
+    )
+    return ConstructorStandingsResponse(season=year, round=race.round, standings=standings)
 
 
 @router.post("/", response_model=SeasonResponse, status_code=201)
@@ -42,6 +144,7 @@ def create_season(season_data: SeasonCreate, db: Session = Depends(get_db)):
     season = Season(**season_data.model_dump())
     db.add(season)
     db.commit()
+    response_cache.invalidate("seasons")
     db.refresh(season)
     return season
 
@@ -60,6 +163,8 @@ def update_season(year: int, season_data: SeasonUpdate, db: Session = Depends(ge
         setattr(season, key, value)
 
     db.commit()
+    response_cache.invalidate("seasons")
+    entity_cache.invalidate(("season", year))
     db.refresh(season)
     return season
 
@@ -73,6 +178,47 @@ def delete_season(year: int, db: Session = Depends(get_db)):
     if not season:
         raise HTTPException(status_code=404, detail=f"Season {year} not found")
 
+    # Races are deleted with the season, drop them from the entity cache too
+    race_keys = [("race", race.id) for race in season.races]
+
     db.delete(season)
     db.commit()
+    # Its races, results, laps and standings go with it
+    response_cache.invalidate("seasons", "races", "results", "laps", "standings")
+    entity_cache.invalidate(("season", year), *race_keys)
     return None
+
+
+@async_router.get("/", response_model=List[SeasonResponse])
+@conditional(Season)
+@response_cache.cached("seasons", response_model=List[SeasonResponse])
+async def get_seasons_async(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+    fmt: str = Depends(response_format),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Async variant of get_seasons"""
+    seasons, next_cursor = await keyset_paginate_async(
+        db, select(Season), _ORDER, limit, after=after, skip=skip, descending=True
+    )
+    return page_response(seasons, next_cursor, response, SeasonResponse, fmt)
+
+
+@async_router.get("/batch", response_model=BatchResponse[SeasonResponse])
+@conditional(Season)
+@serialized(BatchResponse[SeasonResponse])
+async def batch_get_seasons_async(ids: str, db: AsyncSession = Depends(get_async_db)):
+    """Async variant of batch_get_seasons"""
+    return await batch_get_async(db, Season.year, parse_ids(ids, int), SeasonResponse, "season")
+
+
+@async_router.get("/{year}", response_model=SeasonResponse)
+@conditional(_SEASON, last_modified=True)
+@provides_validators
+@serialized(SeasonResponse)
+async def get_season_async(year: int, db: AsyncSession = Depends(get_async_db)):
+    """Async variant of get_season"""
+    return await get_entity_async(db, Season.year, year, SeasonResponse, "season")
@@ -0,0 +1,50 @@
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.api.deps import UUIDParam, get_db
+from app.models.race import Race
+from app.models.season import Season
+from app.schemas.telemetry import TelemetryResponse
+from app.services.telemetry_store import CHANNELS, DRIVER_ID_PATTERN, TelemetryNotFound, read_driver_telemetry
+
+router = APIRouter()
+
+
+@router.get("/{race_id}/telemetry/{driver_id}", response_model=TelemetryResponse)
+def get_driver_telemetry(
+    race_id: UUIDParam,
+    driver_id: str = Path(pattern=DRIVER_ID_PATTERN),
+    lap: Optional[int] = None,
+    points: Optional[int] = Query(None, ge=2, le=100000, description="Maximum number of samples to return"),
+    db: Session = Depends(get_db),
+):
+    """
+    Get a driver's car telemetry for a race, optionally for a single lap.
+    With `points`, the samples are downsampled (min/max per bucket) to at most
+    that many, e.g. for charting a whole race.
+    """
+    race = (
+        db.query(Race.round, Season.year)
+        .join(Season, Season.id == Race.season_id)
+        .filter(Race.id == race_id)
+        .first()
+    )
+    if not race:
+        raise HTTPException(status_code=404, detail=f"Race {race_id} not found")
+
+    try:
+        data = read_driver_telemetry(race.year, race.round, driver_id, lap=lap, points=points)
+    except TelemetryNotFound as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+
+    # orjson encodes the numpy arrays directly; memory-mapped slices are
+    # viewed as plain arrays since orjson only accepts exact ndarray types
+    return ORJSONResponse({
+        "race_id": race_id,
+        "driver_id": driver_id,
+        "lap": lap,
+        **{channel: data[channel].view(np.ndarray) for channel in CHANNELS},
+    })
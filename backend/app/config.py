@@ -12,11 +12,67 @@ class Settings(BaseSettings):
     DB_PORT: int = 5432
     DB_NAME: str = "apexdata_db"
 
+    # Serve read endpoints with async handlers on an asyncpg engine
+    DB_ASYNC: bool = False
+
+    # Connection pool, per worker process (and per engine when DB_ASYNC is on):
+    # keep workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW) below Postgres max_connections
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0  # Seconds to wait for a connection before failing
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced; -1 disables
+    DB_POOL_PRE_PING: bool = True
+
+    # SQL profiling (Server-Timing headers, per-route metrics, slow query log)
+    SQL_PROFILING: bool = True
+    SQL_SLOW_QUERY_MS: float = 200.0
+
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
 
+    # Response cache
+    CACHE_BACKEND: str = "redis"  # "redis", "memory" or "none"
+    CACHE_TTL: int = 300  # Seconds; default and current season TTL
+    CACHE_HISTORICAL_TTL: int = 7 * 24 * 3600  # Seconds; completed seasons
+    CACHE_SOCKET_TIMEOUT: float = 0.25
+    CACHE_RETRY_SECONDS: int = 30
+
+    # Response cache warm-up, at startup and after ingestion jobs
+    CACHE_WARMUP_ON_STARTUP: bool = True
+    CACHE_WARMUP_SECONDS: float = 10.0  # Time budget per warm-up
+    CACHE_WARMUP_MAX_ENTRIES: int = 200  # Responses warmed at most, hottest first
+    CACHE_WARMUP_SEASONS: int = 3  # Latest seasons whose calendar and standings are warmed
+
+    # In-process entity cache (per worker)
+    ENTITY_CACHE_SIZE: int = 2048
+    ENTITY_CACHE_TTL: int = 300  # Seconds
+
+    # Race analytics memoized per worker, keyed by race and lap data version
+    ANALYSIS_CACHE_SIZE: int = 64
+    ANALYSIS_CACHE_TTL: int = 3600  # Seconds
+
     # FastF1
     FASTF1_CACHE_DIR: str = "./fastf1_cache"
+    FASTF1_OFFLINE: bool = False  # Only read sessions from the local cache
+
+    # Telemetry (columnar per-driver files, kept outside Postgres)
+    TELEMETRY_DIR: str = "./telemetry_store"
+    TELEMETRY_LOD_LEVELS: list[int] = [500, 2000, 8000]  # Downsampled sizes precomputed per driver
+
+    # Ingestion
+    INGESTION_WORKERS: int = 4
+    INGESTION_CHECKPOINT_FILE: str = "./fastf1_cache/ingestion_checkpoint.json"
+    BULK_BATCH_SIZE: int = 1000  # Rows per INSERT ... ON CONFLICT statement
+
+    # Background jobs (Celery; broker and results on REDIS_URL)
+    JOBS_EAGER: bool = False  # Run jobs inline and keep their state in memory (tests, no broker)
+    JOBS_CONCURRENCY: dict[str, int] = {"ingest_seasons": 1, "recompute_standings": 2, "warm_cache": 1}
+    JOBS_RETRY_SECONDS: int = 30  # Delay before a job waiting for a free slot is retried
+    JOBS_SLOT_TTL: int = 6 * 3600  # Seconds; renewed on progress, frees the slot of a worker that died mid-job
+    JOBS_RESULT_TTL: int = 7 * 24 * 3600  # Seconds job state and results are kept
+
+    # Exports
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched per server-side cursor round-trip
 
     # API
     API_V1_PREFIX: str = "/api/v1"
@@ -37,5 +93,10 @@ class Settings(BaseSettings):
         """Construct database URL with properly encoded password"""
         return f"postgresql://{self.DB_USER}:{quote_plus(self.DB_PASSWORD)}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        """Database URL for the asyncpg driver"""
+        return f"postgresql+asyncpg://{self.DB_USER}:{quote_plus(self.DB_PASSWORD)}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+
 
 settings = Settings()
@@ -0,0 +1,75 @@
+"""
+Instrumented connection pools.
+
+The engines use these QueuePool subclasses to time every checkout, i.e. how
+long a request waited for a connection, and to count pool timeouts. Together
+with the pool's own size/checked-out/overflow counters they are exposed on
+/metrics, which is what sizing uvicorn workers x DB_POOL_SIZE against the
+Postgres max_connections needs.
+"""
+import threading
+import time
+from typing import Dict, List
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.utils.metrics import Histogram, MetricFamily, register_collector
+
+checkout_wait = Histogram()
+
+_pools: Dict[str, Pool] = {}
+_timeouts: Dict[str, int] = {}
+_lock = threading.Lock()
+
+
+class _InstrumentedPoolMixin:
+    metrics_name = "default"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with _lock:
+                _timeouts[self.metrics_name] = _timeouts.get(self.metrics_name, 0) + 1
+            raise
+        finally:
+            checkout_wait.observe(time.perf_counter() - start, {"pool": self.metrics_name})
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    metrics_name = "sync"
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    metrics_name = "async"
+
+
+def track_pool(pool: Pool) -> None:
+    """Expose a pool's counters on /metrics under its metrics name"""
+    _pools[getattr(pool, "metrics_name", "default")] = pool
+
+
+def _collect() -> List[MetricFamily]:
+    size = MetricFamily("apexdata_db_pool_size", "gauge", "Configured number of persistent connections")
+    checked_out = MetricFamily("apexdata_db_pool_checked_out", "gauge", "Connections currently in use")
+    overflow = MetricFamily("apexdata_db_pool_overflow", "gauge", "Connections open beyond the pool size")
+    idle = MetricFamily("apexdata_db_pool_idle", "gauge", "Idle connections in the pool")
+    timeouts = MetricFamily("apexdata_db_pool_timeouts_total", "counter", "Checkouts that hit DB_POOL_TIMEOUT")
+
+    for name, pool in _pools.items():
+        labels = {"pool": name}
+        if isinstance(pool, QueuePool):
+            size.add(pool.size(), labels)
+            checked_out.add(pool.checkedout(), labels)
+            overflow.add(max(pool.overflow(), 0), labels)
+            idle.add(pool.checkedin(), labels)
+        with _lock:
+            timeouts.add(_timeouts.get(name, 0), labels)
+
+    wait = checkout_wait.family("apexdata_db_pool_checkout_seconds", "Time spent waiting for a pooled connection")
+    return [size, checked_out, overflow, idle, timeouts, wait]
+
+
+register_collector(_collect)
@@ -0,0 +1,57 @@
+"""
+Custom column types.
+"""
+import uuid
+
+from sqlalchemy import String
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.types import TypeDecorator
+
+# Never generated by uuid4, so it matches no row
+NIL_UUID = str(uuid.UUID(int=0))
+
+
+def canonical_uuid(value: str) -> str:
+    """
+    The canonical (lowercase, hyphenated) form of a UUID string, as stored
+    and returned; values that are not UUIDs are returned unchanged.
+    """
+    try:
+        return str(uuid.UUID(value))
+    except ValueError:
+        return value
+
+
+class UUIDString(TypeDecorator):
+    """
+    Surrogate key stored as a native 16-byte `uuid` on PostgreSQL (String(36)
+    elsewhere) but handled as its canonical string in Python, so identifiers
+    in the API and in application code are unchanged.
+
+    Values that are not valid UUIDs bind as the nil UUID: looking up a
+    malformed id finds nothing, as it did with text keys, instead of failing
+    the cast in the database.
+    """
+
+    impl = String(36)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=False))
+        return dialect.type_descriptor(String(36))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return str(value if isinstance(value, uuid.UUID) else uuid.UUID(str(value)))
+        except ValueError:
+            return NIL_UUID
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else str(value)
+
+    @property
+    def python_type(self):
+        return str
@@ -1,13 +1,27 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, PlainTextResponse
 from app.config import settings
-from app.api.v1 import seasons, drivers, constructors, races
+from app.utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, render_metrics
+from app.utils.profiling import SQLProfilingMiddleware
+from app.services.warmup import warm_up
+from app.api.v1 import seasons, drivers, constructors, races, telemetry, analysis, export, jobs
 from pathlib import Path
 
 # Import all models to ensure they are registered with SQLAlchemy
 from app.db import base  # noqa: F401
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Fill the response cache before serving, within the warm-up budget"""
+    if settings.CACHE_WARMUP_ON_STARTUP:
+        await warm_up(app)
+    yield
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -15,6 +29,8 @@ app = FastAPI(
     description="F1 Data API powered by FastF1",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -26,11 +42,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Include routers
-app.include_router(seasons.router, prefix=f"{settings.API_V1_PREFIX}/seasons", tags=["seasons"])
-app.include_router(drivers.router, prefix=f"{settings.API_V1_PREFIX}/drivers", tags=["drivers"])
-app.include_router(constructors.router, prefix=f"{settings.API_V1_PREFIX}/constructors", tags=["constructors"])
-app.include_router(races.router, prefix=f"{settings.API_V1_PREFIX}/races", tags=["races"])
+# Per-request SQL statistics (Server-Timing header, /metrics)
+if settings.SQL_PROFILING:
+    app.add_middleware(SQLProfilingMiddleware)
+
+
+def include_routers(app: FastAPI, async_reads: bool) -> None:
+    """
+    Mount the v1 API. With `async_reads` (DB_ASYNC), the async read handlers
+    take precedence; writes fall through to the sync routers.
+    """
+    if async_reads:
+        app.include_router(seasons.async_router, prefix=f"{settings.API_V1_PREFIX}/seasons", tags=["seasons"])
+        app.include_router(drivers.async_router, prefix=f"{settings.API_V1_PREFIX}/drivers", tags=["drivers"])
+        app.include_router(constructors.async_router, prefix=f"{settings.API_V1_PREFIX}/constructors", tags=["constructors"])
+        app.include_router(races.async_router, prefix=f"{settings.API_V1_PREFIX}/races", tags=["races"])
+
+    app.include_router(seasons.router, prefix=f"{settings.API_V1_PREFIX}/seasons", tags=["seasons"])
+    app.include_router(drivers.router, prefix=f"{settings.API_V1_PREFIX}/drivers", tags=["drivers"])
+    app.include_router(constructors.router, prefix=f"{settings.API_V1_PREFIX}/constructors", tags=["constructors"])
+    app.include_router(races.router, prefix=f"{settings.API_V1_PREFIX}/races", tags=["races"])
+    app.include_router(telemetry.router, prefix=f"{settings.API_V1_PREFIX}/races", tags=["telemetry"])
+    app.include_router(analysis.router, prefix=f"{settings.API_V1_PREFIX}/races", tags=["analysis"])
+    app.include_router(export.router, prefix=f"{settings.API_V1_PREFIX}/export", tags=["export"])
+    app.include_router(jobs.router, prefix=f"{settings.API_V1_PREFIX}/jobs", tags=["jobs"])
+
+
+include_routers(app, async_reads=settings.DB_ASYNC)
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -44,3 +82,9 @@ def root():
 def health_check():
     """Health check endpoint"""
     return {"status": "healthy"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics():
+    """Prometheus metrics: connection pool usage and cache statistics"""
+    return PlainTextResponse(render_metrics(), media_type=METRICS_CONTENT_TYPE)
@@ -1,17 +1,22 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
 
 from app.db.database import Base
+from app.db.types import UUIDString
 
 
 class Constructor(Base):
     """Constructor model representing a Formula 1 team/constructor"""
 
     __tablename__ = "constructors"
+    __table_args__ = (
+        # Keyset pagination order for the constructor list
+        Index("ix_constructors_name_id", "name", "id"),
+    )
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, default=lambda: str(uuid.uuid4()))
     constructor_id = Column(String, unique=True, nullable=False, index=True)
     name = Column(String, nullable=False)
     nationality = Column(String, nullable=False)
@@ -23,6 +28,7 @@ class Constructor(Base):
 
     # Relationships
     results = relationship("RaceResult", back_populates="constructor")
+    qualifying = relationship("Qualifying", back_populates="constructor")
 
     def __repr__(self):
         return f"<Constructor(name={self.name})>"
@@ -1,17 +1,22 @@
-from sqlalchemy import Column, String, Integer, DateTime, Date
+from sqlalchemy import Column, String, Integer, DateTime, Date, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
 
 from app.db.database import Base
+from app.db.types import UUIDString
 
 
 class Driver(Base):
     """Driver model representing a Formula 1 driver"""
 
     __tablename__ = "drivers"
+    __table_args__ = (
+        # Keyset pagination order for the driver list
+        Index("ix_drivers_family_name_id", "family_name", "id"),
+    )
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, default=lambda: str(uuid.uuid4()))
     driver_id = Column(String, unique=True, nullable=False, index=True)
     permanent_number = Column(Integer, nullable=True)
     code = Column(String(3), nullable=True, index=True)
@@ -28,6 +33,7 @@ class Driver(Base):
     # Relationships
     results = relationship("RaceResult", back_populates="driver")
     qualifying = relationship("Qualifying", back_populates="driver")
+    laps = relationship("Lap", back_populates="driver")
 
     def __repr__(self):
         return f"<Driver(code={self.code}, name={self.given_name} {self.family_name})>"
@@ -0,0 +1,54 @@
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, PrimaryKeyConstraint
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from app.db.database import Base
+from app.db.types import UUIDString
+
+
+class Lap(Base):
+    """Lap model representing one lap of a driver in a race"""
+
+    __tablename__ = "laps"
+    __table_args__ = (
+        # Natural key. The partition key must be part of it; the leading
+        # (race_id, driver_id, lap) columns serve the per-race, per-driver and
+        # lap range lookups as well as the race_id foreign key
+        PrimaryKeyConstraint("race_id", "driver_id", "lap", "season_year", name="pk_laps"),
+        # On PostgreSQL, one partition per season (laps_<year>), created on ingestion
+        {"postgresql_partition_by": "LIST (season_year)"},
+    )
+
+    # Partition key, denormalized from the race's season
+    season_year = Column(Integer, nullable=False)
+
+    # Foreign Keys
+    race_id = Column(UUIDString, ForeignKey("races.id", ondelete="CASCADE"), nullable=False)
+    driver_id = Column(UUIDString, ForeignKey("drivers.id", ondelete="RESTRICT"), nullable=False)
+
+    # Lap Information
+    lap = Column(Integer, nullable=False)  # Lap number
+    position = Column(Integer, nullable=True)  # Position at the end of the lap
+    lap_time_ms = Column(Integer, nullable=True)
+    sector_1_ms = Column(Integer, nullable=True)
+    sector_2_ms = Column(Integer, nullable=True)
+    sector_3_ms = Column(Integer, nullable=True)
+    session_time_ms = Column(Integer, nullable=True)  # Session time when the lap was completed
+
+    # Tyres & Pit Stops
+    stint = Column(Integer, nullable=True)
+    compound = Column(String, nullable=True)  # "SOFT", "MEDIUM", "HARD", "INTERMEDIATE", "WET"
+    tyre_life = Column(Integer, nullable=True)  # Laps driven on the tyre set
+    pit_in = Column(Boolean, nullable=False, default=False)  # Entered the pit lane at the end of the lap
+    pit_out = Column(Boolean, nullable=False, default=False)  # Left the pit lane on this lap
+
+    # Metadata
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # Relationships
+    race = relationship("Race", back_populates="laps")
+    driver = relationship("Driver", back_populates="laps")
+
+    def __repr__(self):
+        return f"<Lap(lap={self.lap}, driver={self.driver_id}, time_ms={self.lap_time_ms})>"
@@ -1,22 +1,31 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
 
 from app.db.database import Base
+from app.db.types import UUIDString
 
 
 class Qualifying(Base):
     """Qualifying model representing qualifying session results"""
 
     __tablename__ = "qualifying"
+    __table_args__ = (
+        # Qualifying classification and per-driver history lookups; the leading
+        # columns also serve the race_id / driver_id foreign keys
+        Index("ix_qualifying_race_id_position", "race_id", "position"),
+        Index("ix_qualifying_driver_id_race_id", "driver_id", "race_id"),
+        # Natural key, target of bulk upserts
+        UniqueConstraint("race_id", "driver_id", name="uq_qualifying_race_id_driver_id"),
+    )
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, default=lambda: str(uuid.uuid4()))
 
     # Foreign Keys
-    race_id = Column(String, ForeignKey("races.id", ondelete="CASCADE"), nullable=False)
-    driver_id = Column(String, ForeignKey("drivers.id", ondelete="RESTRICT"), nullable=False)
-    constructor_id = Column(String, ForeignKey("constructors.id", ondelete="RESTRICT"), nullable=False)
+    race_id = Column(UUIDString, ForeignKey("races.id", ondelete="CASCADE"), nullable=False)
+    driver_id = Column(UUIDString, ForeignKey("drivers.id", ondelete="RESTRICT"), nullable=False)
+    constructor_id = Column(UUIDString, ForeignKey("constructors.id", ondelete="RESTRICT"), nullable=False, index=True)
 
     # Qualifying Information
     number = Column(Integer, nullable=False)  # Car number
@@ -24,6 +33,9 @@ class Qualifying(Base):
     q1 = Column(String, nullable=True)  # Q1 time
     q2 = Column(String, nullable=True)  # Q2 time
     q3 = Column(String, nullable=True)  # Q3 time
+    q1_ms = Column(Integer, nullable=True)  # Q1 time in milliseconds
+    q2_ms = Column(Integer, nullable=True)  # Q2 time in milliseconds
+    q3_ms = Column(Integer, nullable=True, index=True)  # Q3 time in milliseconds
 
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -32,6 +44,7 @@ class Qualifying(Base):
     # Relationships
     race = relationship("Race", back_populates="qualifying")
     driver = relationship("Driver", back_populates="qualifying")
+    constructor = relationship("Constructor", back_populates="qualifying")
 
     def __repr__(self):
         return f"<Qualifying(position={self.position}, driver={self.driver_id})>"
@@ -1,20 +1,27 @@
-from sqlalchemy import Column, String, Integer, DateTime, Date, Time, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, Date, Time, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
 
 from app.db.database import Base
+from app.db.types import UUIDString
 
 
 class Race(Base):
     """Race model representing a Formula 1 Grand Prix"""
 
     __tablename__ = "races"
+    __table_args__ = (
+        # Keyset pagination order for the race list
+        Index("ix_races_date_id", "date", "id"),
+        # Season calendar lookups; also serves the season_id foreign key
+        Index("ix_races_season_id_round", "season_id", "round"),
+    )
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, default=lambda: str(uuid.uuid4()))
 
     # Foreign Keys
-    season_id = Column(String, ForeignKey("seasons.id", ondelete="CASCADE"), nullable=False)
+    season_id = Column(UUIDString, ForeignKey("seasons.id", ondelete="CASCADE"), nullable=False)
 
     # Race Information
     round = Column(Integer, nullable=False)
@@ -39,6 +46,8 @@ class Race(Base):
     season = relationship("Season", back_populates="races")
     results = relationship("RaceResult", back_populates="race", cascade="all, delete-orphan")
     qualifying = relationship("Qualifying", back_populates="race", cascade="all, delete-orphan")
+    # Deleted by the database's ON DELETE CASCADE, without loading them
+    laps = relationship("Lap", back_populates="race", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<Race(name={self.race_name}, round={self.round})>"
@@ -1,22 +1,31 @@
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
 
 from app.db.database import Base
+from app.db.types import UUIDString
 
 
 class RaceResult(Base):
     """RaceResult model representing race results"""
 
     __tablename__ = "results"
+    __table_args__ = (
+        # Race classification and per-driver history lookups; the leading
+        # columns also serve the race_id / driver_id foreign keys
+        Index("ix_results_race_id_position_order", "race_id", "position_order"),
+        Index("ix_results_driver_id_race_id", "driver_id", "race_id"),
+        # Natural key, target of bulk upserts
+        UniqueConstraint("race_id", "driver_id", name="uq_results_race_id_driver_id"),
+    )
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, default=lambda: str(uuid.uuid4()))
 
     # Foreign Keys
-    race_id = Column(String, ForeignKey("races.id", ondelete="CASCADE"), nullable=False)
-    driver_id = Column(String, ForeignKey("drivers.id", ondelete="RESTRICT"), nullable=False)
-    constructor_id = Column(String, ForeignKey("constructors.id", ondelete="RESTRICT"), nullable=False)
+    race_id = Column(UUIDString, ForeignKey("races.id", ondelete="CASCADE"), nullable=False)
+    driver_id = Column(UUIDString, ForeignKey("drivers.id", ondelete="RESTRICT"), nullable=False)
+    constructor_id = Column(UUIDString, ForeignKey("constructors.id", ondelete="RESTRICT"), nullable=False, index=True)
 
     # Result Information
     number = Column(Integer, nullable=False)  # Car number
@@ -27,10 +36,11 @@ class RaceResult(Base):
     points = Column(Float, nullable=False, default=0.0)
     laps = Column(Integer, nullable=False)
     time = Column(String, nullable=True)  # Race time for winner, gap for others
-    milliseconds = Column(Integer, nullable=True)
+    milliseconds = Column(Integer, nullable=True)  # Total race time in milliseconds
     fastest_lap = Column(Integer, nullable=True)  # Lap number of fastest lap
     rank = Column(Integer, nullable=True)  # Rank of fastest lap
     fastest_lap_time = Column(String, nullable=True)
+    fastest_lap_time_ms = Column(Integer, nullable=True, index=True)  # fastest_lap_time in milliseconds
     fastest_lap_speed = Column(Float, nullable=True)
     status = Column(String, nullable=False)  # "Finished", "+1 Lap", "Accident", etc.
 
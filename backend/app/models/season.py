@@ -4,6 +4,7 @@ from datetime import datetime
 import uuid
 
 from app.db.database import Base
+from app.db.types import UUIDString
 
 
 class Season(Base):
@@ -11,7 +12,7 @@ class Season(Base):
 
     __tablename__ = "seasons"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, default=lambda: str(uuid.uuid4()))
     year = Column(Integer, unique=True, nullable=False, index=True)
     wikipedia_url = Column(String, nullable=True)
 
@@ -0,0 +1,69 @@
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from datetime import datetime
+import uuid
+
+from app.db.database import Base
+from app.db.types import UUIDString
+
+
+class DriverStanding(Base):
+    """Driver championship standing after a race (cumulative over the season)"""
+
+    __tablename__ = "driver_standings"
+    __table_args__ = (
+        UniqueConstraint("race_id", "driver_id", name="uq_driver_standings_race_id_driver_id"),
+    )
+
+    id = Column(UUIDString, primary_key=True, default=lambda: str(uuid.uuid4()))
+
+    # Foreign Keys
+    race_id = Column(UUIDString, ForeignKey("races.id", ondelete="CASCADE"), nullable=False)
+    driver_id = Column(UUIDString, ForeignKey("drivers.id", ondelete="RESTRICT"), nullable=False, index=True)
+
+    # Standing Information
+    position = Column(Integer, nullable=False)
+    points = Column(Float, nullable=False, default=0.0)
+    wins = Column(Integer, nullable=False, default=0)
+
+    # Metadata
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # Relationships
+    race = relationship("Race")
+    driver = relationship("Driver")
+
+    def __repr__(self):
+        return f"<DriverStanding(position={self.position}, driver={self.driver_id})>"
+
+
+class ConstructorStanding(Base):
+    """Constructor championship standing after a race (cumulative over the season)"""
+
+    __tablename__ = "constructor_standings"
+    __table_args__ = (
+        UniqueConstraint("race_id", "constructor_id", name="uq_constructor_standings_race_id_constructor_id"),
+    )
+
+    id = Column(UUIDString, primary_key=True, default=lambda: str(uuid.uuid4()))
+
+    # Foreign Keys
+    race_id = Column(UUIDString, ForeignKey("races.id", ondelete="CASCADE"), nullable=False)
+    constructor_id = Column(UUIDString, ForeignKey("constructors.id", ondelete="RESTRICT"), nullable=False, index=True)
+
+    # Standing Information
+    position = Column(Integer, nullable=False)
+    points = Column(Float, nullable=False, default=0.0)
+    wins = Column(Integer, nullable=False, default=0)
+
+    # Metadata
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # Relationships
+    race = relationship("Race")
+    constructor = relationship("Constructor")
+
+    def __repr__(self):
+        return f"<ConstructorStanding(position={self.position}, constructor={self.constructor_id})>"
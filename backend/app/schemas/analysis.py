@@ -0,0 +1,64 @@
+from pydantic import BaseModel
+
+
+class DriverPace(BaseModel):
+    """Schema for a driver's race pace over representative laps"""
+    driver_id: str
+    laps: int
+    median_ms: float
+    mean_ms: float
+    best_ms: int
+    delta_ms: float  # Median lap time behind the fastest driver
+
+
+class RacePaceResponse(BaseModel):
+    """Schema for the race pace of every driver, fastest first"""
+    race_id: str
+    drivers: list[DriverPace]
+
+
+class StintAnalysis(BaseModel):
+    """Schema for a stint and the fit of its lap times against tyre age"""
+    driver_id: str
+    stint: int
+    compound: str | None = None
+    start_lap: int
+    end_lap: int
+    laps: int
+    fit_laps: int  # Representative laps used by the fit
+    degradation_ms_per_lap: float | None = None  # Fuel-corrected lap time lost per lap of tyre age
+    base_lap_ms: float | None = None  # Fitted fuel-corrected lap time on new tyres
+
+
+class RaceStintsResponse(BaseModel):
+    """Schema for the stints of every driver"""
+    race_id: str
+    stints: list[StintAnalysis]
+
+
+class DriverGaps(BaseModel):
+    """Schema for a driver's gap to the leader at the end of each lap"""
+    driver_id: str
+    gap_ms: list[int | None]
+
+
+class RaceGapsResponse(BaseModel):
+    """Schema for the gaps to the leader, drivers in classification order"""
+    race_id: str
+    laps: list[int]
+    drivers: list[DriverGaps]
+
+
+class UndercutWindow(BaseModel):
+    """Schema for a lap on which pitting first could pass the car ahead"""
+    lap: int
+    driver_id: str
+    ahead_driver_id: str
+    interval_ms: int
+    estimated_gain_ms: int  # Lap time the car ahead loses to its worn tyres
+
+
+class RaceUndercutsResponse(BaseModel):
+    """Schema for the undercut windows of a race"""
+    race_id: str
+    windows: list[UndercutWindow]
@@ -0,0 +1,11 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class BatchResponse(BaseModel, Generic[T]):
+    """Schema for a batch lookup: found entities in request order and the ids not found"""
+    items: list[T]
+    missing: list[str] = []
@@ -0,0 +1,57 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Annotated, Any, List, Literal, Optional, Union
+
+
+class IngestSeasonsParams(BaseModel):
+    """Parameters of a season ingestion job"""
+    years: List[int] = Field(min_length=1)
+    telemetry: bool = False
+    resume: bool = True
+
+
+class RecomputeStandingsParams(BaseModel):
+    """Parameters of a standings recomputation job"""
+    years: List[int] = Field(min_length=1)
+
+
+class WarmCacheParams(BaseModel):
+    """Parameters of a cache warming job; API paths to request, defaults when omitted"""
+    paths: Optional[List[str]] = None
+
+
+class IngestSeasonsJob(BaseModel):
+    type: Literal["ingest_seasons"]
+    params: IngestSeasonsParams
+
+
+class RecomputeStandingsJob(BaseModel):
+    type: Literal["recompute_standings"]
+    params: RecomputeStandingsParams
+
+
+class WarmCacheJob(BaseModel):
+    type: Literal["warm_cache"]
+    params: WarmCacheParams = WarmCacheParams()
+
+
+# Schema for submitting a job, discriminated by its type
+JobCreate = Annotated[Union[IngestSeasonsJob, RecomputeStandingsJob, WarmCacheJob], Field(discriminator="type")]
+
+
+class JobProgress(BaseModel):
+    """Schema for the progress of a running job"""
+    current: int
+    total: int
+
+
+class JobResponse(BaseModel):
+    """Schema for a job and its state"""
+    id: str
+    type: str
+    status: Literal["queued", "running", "succeeded", "failed"]
+    params: dict[str, Any]
+    submitted_at: datetime
+    progress: Optional[JobProgress] = None
+    result: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+
+
+class LapResponse(BaseModel):
+    """Schema for one lap of a driver in a race"""
+    race_id: str
+    driver_id: str  # Natural key, e.g. "hamilton"
+    driver_uuid: str
+    lap: int
+    position: int | None = None
+    lap_time_ms: int | None = None
+    sector_1_ms: int | None = None
+    sector_2_ms: int | None = None
+    sector_3_ms: int | None = None
+    session_time_ms: int | None = None
+    stint: int | None = None
+    compound: str | None = None
+    tyre_life: int | None = None
+    pit_in: bool
+    pit_out: bool
+
+    model_config = {"from_attributes": True}
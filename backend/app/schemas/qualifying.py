@@ -0,0 +1,40 @@
+from pydantic import BaseModel
+from datetime import datetime
+
+from app.schemas.driver import DriverResponse
+from app.schemas.constructor import ConstructorResponse
+
+
+class QualifyingBase(BaseModel):
+    """Base schema for Qualifying"""
+    driver_id: str
+    constructor_id: str
+    number: int
+    position: int
+    q1: str | None = None
+    q2: str | None = None
+    q3: str | None = None
+    q1_ms: int | None = None
+    q2_ms: int | None = None
+    q3_ms: int | None = None
+
+
+class QualifyingCreate(QualifyingBase):
+    """Schema for creating or upserting a Qualifying row (race taken from the path)"""
+    pass
+
+
+class QualifyingResponse(QualifyingBase):
+    """Schema for Qualifying response"""
+    id: str
+    race_id: str
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class QualifyingDetailResponse(QualifyingResponse):
+    """Schema for Qualifying response with nested driver and constructor"""
+    driver: DriverResponse
+    constructor: ConstructorResponse
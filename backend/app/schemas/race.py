@@ -3,6 +3,9 @@ from datetime import datetime, date
 from datetime import time as time_type
 from typing import Optional
 
+from app.schemas.result import ResultDetailResponse
+from app.schemas.qualifying import QualifyingDetailResponse
+
 
 class RaceBase(BaseModel):
     """Base schema for Race"""
@@ -43,3 +46,21 @@ class RaceResponse(RaceBase):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class RaceResultsSummary(BaseModel):
+    """Schema for the headline results of a race (natural keys of winner and pole sitter)"""
+    winner_driver_id: Optional[str] = None
+    winner_constructor_id: Optional[str] = None
+    pole_driver_id: Optional[str] = None
+
+
+class RaceCalendarResponse(RaceResponse):
+    """Schema for a race in a season calendar, optionally with its results summary"""
+    results_summary: Optional[RaceResultsSummary] = None
+
+
+class RaceFullResponse(RaceResponse):
+    """Schema for a race with its full classification and qualifying"""
+    results: list[ResultDetailResponse] = []
+    qualifying: list[QualifyingDetailResponse] = []
@@ -0,0 +1,54 @@
+from pydantic import BaseModel
+from datetime import datetime
+
+from app.schemas.driver import DriverResponse
+from app.schemas.constructor import ConstructorResponse
+
+
+class ResultBase(BaseModel):
+    """Base schema for RaceResult"""
+    driver_id: str
+    constructor_id: str
+    number: int
+    grid: int
+    position: int | None = None
+    position_text: str
+    position_order: int
+    points: float = 0.0
+    laps: int
+    time: str | None = None
+    milliseconds: int | None = None
+    fastest_lap: int | None = None
+    rank: int | None = None
+    fastest_lap_time: str | None = None
+    fastest_lap_time_ms: int | None = None
+    fastest_lap_speed: float | None = None
+    status: str
+
+
+class ResultCreate(ResultBase):
+    """Schema for creating or upserting a RaceResult (race taken from the path)"""
+    pass
+
+
+class ResultResponse(ResultBase):
+    """Schema for RaceResult response"""
+    id: str
+    race_id: str
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ResultDetailResponse(ResultResponse):
+    """Schema for RaceResult response with nested driver and constructor"""
+    driver: DriverResponse
+    constructor: ConstructorResponse
+
+
+class BulkUpsertResponse(BaseModel):
+    """Schema for the outcome of a bulk upsert"""
+    race_id: str
+    upserted: int
+    deleted: int = 0
@@ -0,0 +1,38 @@
+from pydantic import BaseModel
+
+from app.schemas.driver import DriverResponse
+from app.schemas.constructor import ConstructorResponse
+
+
+class DriverStandingResponse(BaseModel):
+    """Schema for a driver championship standing"""
+    position: int
+    points: float
+    wins: int
+    driver: DriverResponse
+
+    model_config = {"from_attributes": True}
+
+
+class ConstructorStandingResponse(BaseModel):
+    """Schema for a constructor championship standing"""
+    position: int
+    points: float
+    wins: int
+    constructor: ConstructorResponse
+
+    model_config = {"from_attributes": True}
+
+
+class DriverStandingsResponse(BaseModel):
+    """Schema for the driver standings of a season after a round"""
+    season: int
+    round: int
+    standings: list[DriverStandingResponse]
+
+
+class ConstructorStandingsResponse(BaseModel):
+    """Schema for the constructor standings of a season after a round"""
+    season: int
+    round: int
+    standings: list[ConstructorStandingResponse]
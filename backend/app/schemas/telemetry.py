@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class TelemetryResponse(BaseModel):
+    """Schema for a driver's car telemetry, one array per channel"""
+    race_id: str
+    driver_id: str
+    lap: int | None = None
+    time_ms: list[int]
+    speed: list[float]
+    rpm: list[float]
+    gear: list[int]
+    throttle: list[float]
+    brake: list[int]
+    drs: list[int]
@@ -0,0 +1,239 @@
+"""
+Race analytics computed from lap data.
+
+A race's laps are loaded into a pandas frame with a single query, and every
+analysis is a handful of vectorized operations on that frame (group-bys,
+pivots, shifts) rather than a loop over laps or drivers:
+
+- pace: each driver's median lap time on representative laps and the delta
+  to the fastest driver;
+- stints: each stint's laps, compound and a least-squares fit of lap time
+  against tyre age (the degradation in ms per lap);
+- gaps: every driver's gap to the leader at the end of each lap;
+- undercuts: laps where the car behind was within the estimated gain of
+  pitting first, i.e. the time the car ahead loses per lap to its worn tyres.
+
+RaceAnalysis objects are memoized per race in a per-worker LRU cache, keyed by
+the race and the count and latest update of its laps, so re-ingested laps are
+picked up immediately and the frame is only rebuilt when they change.
+"""
+from functools import cached_property
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.driver import Driver
+from app.models.lap import Lap
+from app.models.race import Race
+from app.models.season import Season
+from app.utils.cache import LRUCache
+
+# Laps slower than this multiple of the race's median (safety car, incidents)
+# are not representative of pace
+PACE_THRESHOLD = 1.07
+
+# Lap time gained per lap as fuel burns off; added back before fitting tyre
+# degradation so that the slope reflects the tyres only
+FUEL_CORRECTION_MS_PER_LAP = 60.0
+
+# Clean laps needed to fit a stint's degradation
+MIN_FIT_LAPS = 3
+
+_NUMERIC_COLUMNS = ["lap", "position", "lap_time_ms", "session_time_ms", "stint", "tyre_life"]
+
+analysis_cache = LRUCache(settings.ANALYSIS_CACHE_SIZE, settings.ANALYSIS_CACHE_TTL)
+
+
+def _records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Frame rows as dicts of plain Python values, NaN as None"""
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+class RaceAnalysis:
+    """Analyses of one race from its laps frame; each is computed on first access"""
+
+    def __init__(self, race_id: str, laps: pd.DataFrame):
+        self.race_id = race_id
+        self.laps = laps.sort_values(["driver_id", "lap"], ignore_index=True)
+
+    @cached_property
+    def clean(self) -> pd.Series:
+        """Mask of representative laps: timed, not the opening lap, not in or out of the pits, not neutralized"""
+        laps = self.laps
+        timed = laps["lap_time_ms"].notna() & (laps["lap"] > 1) & ~laps["pit_in"] & ~laps["pit_out"]
+        if not timed.any():
+            return timed
+        threshold = laps.loc[timed, "lap_time_ms"].median() * PACE_THRESHOLD
+        return timed & (laps["lap_time_ms"] <= threshold)
+
+    @cached_property
+    def pace(self) -> List[Dict[str, Any]]:
+        times = self.laps.loc[self.clean].groupby("driver_id")["lap_time_ms"]
+        pace = times.agg(laps="count", median_ms="median", mean_ms="mean", best_ms="min")
+        if pace.empty:
+            return []
+        pace["delta_ms"] = pace["median_ms"] - pace["median_ms"].min()
+        pace = pace.sort_values("median_ms").reset_index()
+        return _records(pace.round({"median_ms": 1, "mean_ms": 1, "delta_ms": 1}))
+
+    @cached_property
+    def stint_fits(self) -> pd.DataFrame:
+        laps = self.laps.dropna(subset=["stint"])
+        groups = laps.groupby(["driver_id", "stint"])
+        stints = groups.agg(
+            compound=("compound", "first"),
+            start_lap=("lap", "min"),
+            end_lap=("lap", "max"),
+            laps=("lap", "count"),
+        )
+
+        # Least squares of lap time against tyre age per stint, from the sums
+        # of x, y, xy and x² of its clean laps
+        clean = self.clean.loc[laps.index]
+        fit = laps.loc[clean]
+        age = fit["tyre_life"].fillna(fit["lap"] - groups["lap"].transform("min").loc[fit.index] + 1)
+        corrected = fit["lap_time_ms"] + FUEL_CORRECTION_MS_PER_LAP * (fit["lap"] - 1)
+        sums = pd.DataFrame({
+            "driver_id": fit["driver_id"],
+            "stint": fit["stint"],
+            "n": 1.0,
+            "x": age,
+            "y": corrected,
+            "xy": age * corrected,
+            "xx": age * age,
+        }).groupby(["driver_id", "stint"]).sum()
+        sums = sums.reindex(stints.index, fill_value=0.0)
+
+        denominator = sums["n"] * sums["xx"] - sums["x"] ** 2
+        fitted = (sums["n"] >= MIN_FIT_LAPS) & (denominator > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = (sums["n"] * sums["xy"] - sums["x"] * sums["y"]) / denominator
+            intercept = (sums["y"] - slope * sums["x"]) / sums["n"]
+        stints["fit_laps"] = sums["n"].astype(int)
+        stints["degradation_ms_per_lap"] = slope.where(fitted).round(1)
+        stints["base_lap_ms"] = intercept.where(fitted).round(1)
+        return stints.reset_index()
+
+    @cached_property
+    def stints(self) -> List[Dict[str, Any]]:
+        return _records(self.stint_fits)
+
+    @cached_property
+    def gap_table(self) -> pd.DataFrame:
+        """Gap to the leader (ms), one row per lap and one column per driver"""
+        times = self.laps.pivot_table(index="lap", columns="driver_id", values="session_time_ms", aggfunc="min")
+        gaps = times.sub(times.min(axis=1), axis=0)
+        # Classification order: most laps completed, then smallest final gap
+        completed = gaps.notna().sum()
+        final_gap = gaps.ffill().iloc[-1] if len(gaps) else pd.Series(dtype=float)
+        order = pd.DataFrame({"completed": completed, "final_gap": final_gap}).sort_values(
+            ["completed", "final_gap"], ascending=[False, True]
+        )
+        return gaps[order.index]
+
+    @cached_property
+    def gaps(self) -> Dict[str, Any]:
+        table = self.gap_table
+        values = table.to_numpy(dtype=float).T
+        return {
+            "laps": [int(lap) for lap in table.index],
+            "drivers": [
+                {"driver_id": driver_id, "gap_ms": [None if np.isnan(gap) else int(gap) for gap in column]}
+                for driver_id, column in zip(table.columns, values)
+            ],
+        }
+
+    @cached_property
+    def undercuts(self) -> List[Dict[str, Any]]:
+        laps = self.laps.dropna(subset=["session_time_ms"])
+        fits = self.stint_fits.set_index(["driver_id", "stint"])["degradation_ms_per_lap"]
+        laps = laps.join(fits, on=["driver_id", "stint"])
+
+        # Pair every car with the car ahead on the road at the end of the same lap
+        laps = laps.sort_values(["lap", "session_time_ms"], ignore_index=True)
+        ahead = laps.groupby("lap")[["driver_id", "session_time_ms", "tyre_life", "degradation_ms_per_lap", "pit_in"]].shift(1)
+
+        interval = laps["session_time_ms"] - ahead["session_time_ms"]
+        # Time the car ahead loses on the lap after the car behind pits onto new tyres
+        gain = ahead["degradation_ms_per_lap"] * ahead["tyre_life"]
+        # Neither car pitting on the lap; the leader has no car ahead (NaN)
+        window = (
+            ~laps["pit_in"]
+            & ahead["pit_in"].eq(False)
+            & (gain > 0)
+            & (interval < gain)
+        )
+        windows = pd.DataFrame({
+            "lap": laps["lap"],
+            "driver_id": laps["driver_id"],
+            "ahead_driver_id": ahead["driver_id"],
+            "interval_ms": interval.round(),
+            "estimated_gain_ms": gain.round(),
+        })[window]
+        return _records(windows.astype({"lap": int, "interval_ms": int, "estimated_gain_ms": int}))
+
+
+def race_laps_clause(race_id: str):
+    """
+    Filter on the laps of a race for queries without the season year at hand
+    (e.g. validators): the year comes from a scalar subquery, so PostgreSQL
+    still scans a single laps partition
+    """
+    season_year = (
+        select(Season.year).join(Race, Race.season_id == Season.id).where(Race.id == race_id).scalar_subquery()
+    )
+    return and_(Lap.season_year == season_year, Lap.race_id == race_id)
+
+
+def load_laps(db: Session, race_id: str, season_year: int) -> pd.DataFrame:
+    """All laps of a race in one query, with drivers by their driver_id"""
+    statement = (
+        select(
+            Driver.driver_id,
+            Lap.lap,
+            Lap.position,
+            Lap.lap_time_ms,
+            Lap.session_time_ms,
+            Lap.stint,
+            Lap.compound,
+            Lap.tyre_life,
+            Lap.pit_in,
+            Lap.pit_out,
+        )
+        .join(Driver, Driver.id == Lap.driver_id)
+        .where(Lap.season_year == season_year, Lap.race_id == race_id)
+    )
+    result = db.execute(statement)
+    frame = pd.DataFrame.from_records(result.all(), columns=list(result.keys()))
+    frame[_NUMERIC_COLUMNS] = frame[_NUMERIC_COLUMNS].astype("float64")
+    frame[["pit_in", "pit_out"]] = frame[["pit_in", "pit_out"]].astype(bool)
+    return frame
+
+
+def race_analysis(db: Session, race_id: str) -> Optional[RaceAnalysis]:
+    """Memoized analysis of a race, or None if the race does not exist"""
+    season_year = (
+        db.query(Season.year)
+        .join(Race, Race.season_id == Season.id)
+        .filter(Race.id == race_id)
+        .scalar()
+    )
+    if season_year is None:
+        return None
+
+    count, updated_at = (
+        db.query(func.count(), func.max(Lap.updated_at))
+        .select_from(Lap)
+        .filter(Lap.season_year == season_year, Lap.race_id == race_id)
+        .one()
+    )
+    key = (race_id, count, updated_at)
+    analysis = analysis_cache.get(key)
+    if analysis is None:
+        analysis = RaceAnalysis(race_id, load_laps(db, race_id, season_year))
+        analysis_cache.set(key, analysis)
+    return analysis
@@ -0,0 +1,208 @@
+"""
+Bulk upserts of race results, qualifying and laps.
+
+Rows are written with multi-row INSERT ... ON CONFLICT (<natural key>) DO
+UPDATE statements in batches of BULK_BATCH_SIZE, so a full season is a
+handful of round-trips instead of one per row. On databases without ON
+CONFLICT, existing keys are updated with one executemany UPDATE and the
+other rows inserted.
+"""
+import uuid
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Sequence, Type
+
+import pandas as pd
+from sqlalchemy import and_, bindparam, select, text, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db.types import UUIDString, canonical_uuid
+from app.models.lap import Lap
+from app.models.qualifying import Qualifying
+from app.models.result import RaceResult
+from app.utils.laptime import parse_lap_times
+
+# Numeric millisecond columns derived from their lap time strings when not given
+_DERIVED_MILLISECONDS = {
+    RaceResult: {"fastest_lap_time_ms": "fastest_lap_time"},
+    Qualifying: {"q1_ms": "q1", "q2_ms": "q2", "q3_ms": "q3"},
+}
+
+# Natural key of each table, target of ON CONFLICT
+_KEYS = {
+    RaceResult: ("race_id", "driver_id"),
+    Qualifying: ("race_id", "driver_id"),
+    Lap: ("race_id", "driver_id", "lap", "season_year"),
+}
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT
+_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+class DuplicateRows(ValueError):
+    """The rows contain the same natural key more than once"""
+
+
+def _with_milliseconds(model: Type, rows: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fill missing millisecond columns by parsing the time strings of all rows at once"""
+    rows = [dict(row) for row in rows]
+    for ms_column, text_column in _DERIVED_MILLISECONDS.get(model, {}).items():
+        parsed = parse_lap_times(row.get(text_column) for row in rows)
+        for row, value in zip(rows, parsed):
+            if row.get(ms_column) is None:
+                row[ms_column] = None if pd.isna(value) else int(value)
+    return rows
+
+
+def _upsert(
+    db: Session,
+    model: Type,
+    race_id: str,
+    rows: Sequence[Dict[str, Any]],
+    replace: bool,
+) -> Dict[str, int]:
+    rows = _with_milliseconds(model, rows)
+    key = _KEYS[model]
+    has_id = "id" in model.__table__.columns
+    now = datetime.utcnow()
+    records: List[Dict[str, Any]] = [
+        {**row, **({"id": str(uuid.uuid4())} if has_id else {}), "race_id": race_id, "created_at": now, "updated_at": now}
+        for row in rows
+    ]
+    # Keys compare as stored: another spelling of the same UUID is the same key
+    uuid_columns = [column.name for column in model.__table__.columns if isinstance(column.type, UUIDString)]
+    for record in records:
+        for name in uuid_columns:
+            if isinstance(record.get(name), str):
+                record[name] = canonical_uuid(record[name])
+
+    # ON CONFLICT cannot update the same row twice in one statement
+    columns = [name for name in key if name not in ("race_id", "season_year")]
+    counts = Counter(tuple(record.get(name) for name in columns) for record in records)
+    duplicates = [values for values, count in counts.items() if count > 1]
+    if duplicates:
+        shown = ", ".join("/".join(str(value) for value in values) for values in duplicates[:5])
+        raise DuplicateRows(f"Duplicate {'/'.join(columns)} in rows: {shown}")
+
+    # Columns overwritten when a row with the same natural key already exists
+    update_columns = [
+        column.name for column in model.__table__.columns
+        if column.name not in ("id", "created_at", *key)
+    ]
+
+    insert = _INSERTS.get(db.get_bind().dialect.name)
+    for start in range(0, len(records), settings.BULK_BATCH_SIZE):
+        batch = records[start:start + settings.BULK_BATCH_SIZE]
+        if insert is None:
+            _update_then_insert(db, model, race_id, key, batch, update_columns)
+            continue
+        statement = insert(model.__table__).values(batch)
+        statement = statement.on_conflict_do_update(
+            index_elements=list(key),
+            set_={name: statement.excluded[name] for name in update_columns if name in batch[0]},
+        )
+        db.execute(statement)
+
+    deleted = 0
+    if replace:
+        # Rows of the race whose key (within the race) is missing from `rows`
+        columns = [name for name in key if name not in ("race_id", "season_year")]
+        if len(columns) == 1:
+            stale = getattr(model, columns[0]).notin_([record[columns[0]] for record in records])
+        else:
+            stale = tuple_(*(getattr(model, name) for name in columns)).notin_(
+                [tuple(record[name] for name in columns) for record in records]
+            )
+        deleted = (
+            db.query(model)
+            .filter(model.race_id == race_id, stale)
+            .delete(synchronize_session=False)
+        )
+
+    return {"upserted": len(records), "deleted": deleted}
+
+
+def _update_then_insert(
+    db: Session,
+    model: Type,
+    race_id: str,
+    key: Sequence[str],
+    batch: List[Dict[str, Any]],
+    update_columns: List[str],
+) -> None:
+    """Portable upsert of a batch: update the rows whose key exists, insert the others"""
+    table = model.__table__
+    existing = set(db.execute(select(*(table.c[name] for name in key)).where(table.c.race_id == race_id)).all())
+    updates = [record for record in batch if tuple(record[name] for name in key) in existing]
+    inserts = [record for record in batch if tuple(record[name] for name in key) not in existing]
+
+    if updates:
+        # SET columns bind by name, so the key is bound under prefixed names
+        statement = update(table).where(and_(*(table.c[name] == bindparam(f"key_{name}") for name in key)))
+        db.execute(statement, [
+            {
+                **{name: record[name] for name in update_columns if name in record},
+                **{f"key_{name}": record[name] for name in key},
+            }
+            for record in updates
+        ])
+    if inserts:
+        db.execute(table.insert(), inserts)
+
+
+def bulk_upsert_results(
+    db: Session,
+    race_id: str,
+    rows: Sequence[Dict[str, Any]],
+    replace: bool = False,
+) -> Dict[str, int]:
+    """
+    Insert or update the results of a race keyed by (race_id, driver_id).
+    With `replace`, results of drivers missing from `rows` are deleted.
+    The caller commits.
+    """
+    return _upsert(db, RaceResult, race_id, rows, replace)
+
+
+def bulk_upsert_qualifying(
+    db: Session,
+    race_id: str,
+    rows: Sequence[Dict[str, Any]],
+    replace: bool = False,
+) -> Dict[str, int]:
+    """
+    Insert or update the qualifying classification of a race keyed by
+    (race_id, driver_id). With `replace`, rows of drivers missing from `rows`
+    are deleted. The caller commits.
+    """
+    return _upsert(db, Qualifying, race_id, rows, replace)
+
+
+def ensure_lap_partition(db: Session, season_year: int) -> None:
+    """Create the laps partition of a season if missing (PostgreSQL only; elsewhere laps is a plain table)"""
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    year = int(season_year)
+    db.execute(text(f"CREATE TABLE IF NOT EXISTS laps_{year} PARTITION OF laps FOR VALUES IN ({year})"))
+
+
+def bulk_upsert_laps(
+    db: Session,
+    race_id: str,
+    season_year: int,
+    rows: Sequence[Dict[str, Any]],
+    replace: bool = False,
+) -> Dict[str, int]:
+    """
+    Insert or update the laps of a race keyed by (race_id, driver_id, lap),
+    creating the season's partition first. With `replace`, laps missing from
+    `rows` are deleted. The caller commits.
+    """
+    ensure_lap_partition(db, season_year)
+    rows = [{**row, "season_year": season_year} for row in rows]
+    return _upsert(db, Lap, race_id, rows, replace)
@@ -0,0 +1,425 @@
+"""
+FastF1 ingestion service.
+
+Loads race weekends through FastF1 (reading from FASTF1_CACHE_DIR, so a
+pre-populated cache works offline) and populates seasons, races, drivers,
+constructors, results, qualifying and laps (the latter three via bulk upserts).
+
+Sessions are parsed in a process pool, one event per task; rows are written by
+the parent process, one transaction per event. Completed events are recorded in
+a checkpoint file so an interrupted backfill resumes where it stopped.
+
+Usage:
+    python -m app.services.ingestion 2021 2022 2023 --workers 4 [--telemetry]
+"""
+import argparse
+import json
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db.database import SessionLocal
+from app.models.constructor import Constructor
+from app.models.driver import Driver
+from app.models.race import Race
+from app.models.season import Season
+from app.services.bulk import bulk_upsert_laps, bulk_upsert_qualifying, bulk_upsert_results
+from app.services.standings import update_standings_for_race
+from app.services.telemetry_store import car_data_to_channels, write_driver_telemetry
+from app.utils.cache import response_cache
+from app.utils.laptime import format_gap, format_lap_time, format_race_time, to_milliseconds
+
+logger = logging.getLogger(__name__)
+
+
+def _value(value: Any) -> Any:
+    """Convert pandas missing values to None"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return value
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_")
+
+
+def _enable_fastf1_cache(cache_dir: str, offline: bool) -> None:
+    import fastf1
+
+    os.makedirs(cache_dir, exist_ok=True)
+    fastf1.Cache.enable_cache(cache_dir)
+    fastf1.Cache.offline_mode(offline)
+    fastf1.set_log_level("WARNING")
+
+
+def _driver_record(row: pd.Series) -> Dict[str, Any]:
+    number = _value(row["DriverNumber"])
+    return {
+        "driver_id": _value(row["DriverId"]) or _slug(row["Abbreviation"] or row["FullName"]),
+        "permanent_number": int(number) if number else None,
+        "code": _value(row["Abbreviation"]),
+        "given_name": _value(row["FirstName"]) or "",
+        "family_name": _value(row["LastName"]) or "",
+        "nationality": _value(row["CountryCode"]) or "Unknown",
+    }
+
+
+def _constructor_record(row: pd.Series) -> Dict[str, Any]:
+    return {
+        "constructor_id": _value(row["TeamId"]) or _slug(row["TeamName"]),
+        "name": _value(row["TeamName"]) or "",
+    }
+
+
+def _race_results(session) -> List[Dict[str, Any]]:
+    results = session.results
+    laps = session.laps
+
+    laps_completed = laps.groupby("DriverNumber")["LapNumber"].max()
+    fastest = laps.dropna(subset=["LapTime"]).sort_values("LapTime").drop_duplicates("DriverNumber")
+    fastest_rank = {number: rank for rank, number in enumerate(fastest["DriverNumber"], start=1)}
+    fastest_by_driver = fastest.set_index("DriverNumber")
+
+    winner_ms = to_milliseconds(results.iloc[0]["Time"]) if len(results) else None
+    records = []
+    for position_order, (_, row) in enumerate(results.iterrows(), start=1):
+        number = row["DriverNumber"]
+        position = _value(row["Position"])
+        time_ms = to_milliseconds(row["Time"])
+        if position_order == 1:
+            milliseconds, time_text = time_ms, format_race_time(time_ms)
+        elif time_ms is not None and winner_ms is not None:
+            milliseconds, time_text = winner_ms + time_ms, format_gap(time_ms)
+        else:
+            milliseconds, time_text = None, None
+
+        fastest_lap = fastest_by_driver.loc[number] if number in fastest_by_driver.index else None
+        records.append({
+            "driver": _driver_record(row),
+            "constructor": _constructor_record(row),
+            "number": int(number),
+            "grid": int(_value(row["GridPosition"]) or 0),
+            "position": int(position) if position else None,
+            "position_text": _value(row["ClassifiedPosition"]) or "",
+            "position_order": position_order,
+            "points": float(_value(row["Points"]) or 0.0),
+            "laps": int(_value(laps_completed.get(number)) or 0),
+            "time": time_text,
+            "milliseconds": milliseconds,
+            "fastest_lap": int(fastest_lap["LapNumber"]) if fastest_lap is not None else None,
+            "rank": fastest_rank.get(number),
+            "fastest_lap_time": format_lap_time(to_milliseconds(fastest_lap["LapTime"])) if fastest_lap is not None else None,
+            "status": _value(row["Status"]) or "",
+        })
+    return records
+
+
+def _qualifying_results(session) -> List[Dict[str, Any]]:
+    records = []
+    for position_order, (_, row) in enumerate(session.results.iterrows(), start=1):
+        position = _value(row["Position"])
+        records.append({
+            "driver": _driver_record(row),
+            "constructor": _constructor_record(row),
+            "number": int(row["DriverNumber"]),
+            "position": int(position) if position else position_order,
+            "q1": format_lap_time(to_milliseconds(row["Q1"])),
+            "q2": format_lap_time(to_milliseconds(row["Q2"])),
+            "q3": format_lap_time(to_milliseconds(row["Q3"])),
+        })
+    return records
+
+
+def _race_laps(session) -> List[Dict[str, Any]]:
+    """Lap-by-lap rows of a race, keyed by car number (resolved to the driver when stored)"""
+    laps = session.laps.dropna(subset=["LapNumber", "DriverNumber"])
+
+    def milliseconds(column: str) -> pd.Series:
+        return (laps[column].dt.total_seconds() * 1000).round().astype("Int64")
+
+    frame = pd.DataFrame({
+        "number": pd.to_numeric(laps["DriverNumber"]).astype(int),
+        "lap": laps["LapNumber"].astype(int),
+        "position": laps["Position"].astype("Int64"),
+        "lap_time_ms": milliseconds("LapTime"),
+        "sector_1_ms": milliseconds("Sector1Time"),
+        "sector_2_ms": milliseconds("Sector2Time"),
+        "sector_3_ms": milliseconds("Sector3Time"),
+        "session_time_ms": milliseconds("Time"),
+        "stint": laps["Stint"].astype("Int64"),
+        "compound": laps["Compound"],
+        "tyre_life": laps["TyreLife"].astype("Int64"),
+        "pit_in": laps["PitInTime"].notna(),
+        "pit_out": laps["PitOutTime"].notna(),
+    })
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+def _store_telemetry(session, year: int, round_number: int) -> None:
+    """Write every driver's race car data to the telemetry store"""
+    for _, row in session.results.iterrows():
+        number = row["DriverNumber"]
+        if number not in session.car_data:
+            continue
+        channels = car_data_to_channels(session.car_data[number], session.laps.pick_drivers(number))
+        write_driver_telemetry(year, round_number, _driver_record(row)["driver_id"], channels)
+
+
+def load_event(
+    year: int,
+    round_number: int,
+    cache_dir: str,
+    offline: bool,
+    telemetry: bool = False,
+) -> Dict[str, Any]:
+    """
+    Load one race weekend through FastF1 and return it as plain, picklable data.
+    With `telemetry`, race car data is written straight to the telemetry store.
+    Runs in a worker process.
+    """
+    import fastf1
+
+    _enable_fastf1_cache(cache_dir, offline)
+    event = fastf1.get_event(year, round_number)
+    race_start = event.get_session_date("Race", utc=True)
+
+    race_session = event.get_session("Race")
+    race_session.load(laps=True, telemetry=telemetry, weather=False, messages=False)
+    if telemetry:
+        _store_telemetry(race_session, year, round_number)
+
+    qualifying = []
+    try:
+        qualifying_session = event.get_session("Qualifying")
+        qualifying_session.load(laps=False, telemetry=False, weather=False, messages=False)
+        qualifying = _qualifying_results(qualifying_session)
+    except ValueError:
+        logger.info("No qualifying session for %s round %s", year, round_number)
+
+    return {
+        "year": year,
+        "race": {
+            "round": round_number,
+            "race_name": event["EventName"],
+            "circuit_id": _slug(event["Location"]),
+            "circuit_name": event["Location"],
+            "locality": event["Location"],
+            "country": event["Country"],
+            "date": race_start.date(),
+            "time": race_start.time(),
+        },
+        "results": _race_results(race_session),
+        "qualifying": qualifying,
+        "laps": _race_laps(race_session),
+    }
+
+
+def event_rounds(year: int, cache_dir: str, offline: bool) -> List[int]:
+    """List the championship rounds of a season (testing events excluded)"""
+    import fastf1
+
+    _enable_fastf1_cache(cache_dir, offline)
+    schedule = fastf1.get_event_schedule(year, include_testing=False)
+    return [int(round_number) for round_number in schedule["RoundNumber"] if round_number > 0]
+
+
+class Checkpoint:
+    """Set of completed (year, round) events persisted to a JSON file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.completed: Set[str] = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.completed = set(json.load(f).get("completed", []))
+
+    @staticmethod
+    def _key(year: int, round_number: int) -> str:
+        return f"{year}-{round_number:02d}"
+
+    def is_done(self, year: int, round_number: int) -> bool:
+        return self._key(year, round_number) in self.completed
+
+    def mark_done(self, year: int, round_number: int) -> None:
+        self.completed.add(self._key(year, round_number))
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first so a crash never leaves a truncated checkpoint
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"completed": sorted(self.completed)}, f)
+        os.replace(tmp_path, self.path)
+
+
+def _get_or_create_driver(db: Session, record: Dict[str, Any]) -> Driver:
+    driver = db.query(Driver).filter(Driver.driver_id == record["driver_id"]).first()
+    if not driver:
+        driver = Driver(**record)
+        db.add(driver)
+        db.flush()
+    return driver
+
+
+def _get_or_create_constructor(db: Session, record: Dict[str, Any]) -> Constructor:
+    constructor = db.query(Constructor).filter(Constructor.constructor_id == record["constructor_id"]).first()
+    if not constructor:
+        constructor = Constructor(nationality="Unknown", **record)
+        db.add(constructor)
+        db.flush()
+    return constructor
+
+
+def _resolve_entities(db: Session, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Replace embedded driver/constructor records with their primary keys"""
+    rows = []
+    for record in records:
+        row = dict(record)
+        row["driver_id"] = _get_or_create_driver(db, row.pop("driver")).id
+        row["constructor_id"] = _get_or_create_constructor(db, row.pop("constructor")).id
+        rows.append(row)
+    return rows
+
+
+def store_event(db: Session, payload: Dict[str, Any]) -> Race:
+    """
+    Insert or update a loaded event and upsert its results, qualifying and
+    laps, dropping rows of drivers no longer classified. Commits once for the
+    whole event.
+    """
+    season = db.query(Season).filter(Season.year == payload["year"]).first()
+    if not season:
+        season = Season(year=payload["year"])
+        db.add(season)
+        db.flush()
+
+    race_data = payload["race"]
+    race = db.query(Race).filter(Race.season_id == season.id, Race.round == race_data["round"]).first()
+    if not race:
+        race = Race(season_id=season.id, **race_data)
+        db.add(race)
+        db.flush()
+    else:
+        for key, value in race_data.items():
+            setattr(race, key, value)
+
+    results = _resolve_entities(db, payload["results"])
+    bulk_upsert_results(db, race.id, results, replace=True)
+    bulk_upsert_qualifying(db, race.id, _resolve_entities(db, payload["qualifying"]), replace=True)
+
+    # Laps carry the car number; laps of cars without a result are dropped
+    driver_ids = {row["number"]: row["driver_id"] for row in results}
+    laps = [
+        {**{k: v for k, v in lap.items() if k != "number"}, "driver_id": driver_ids[lap["number"]]}
+        for lap in payload["laps"]
+        if lap["number"] in driver_ids
+    ]
+    bulk_upsert_laps(db, race.id, payload["year"], laps, replace=True)
+    update_standings_for_race(db, race)
+
+    db.commit()
+    return race
+
+
+def _store_loaded(future, year: int, round_number: int) -> bool:
+    """Store the payload of a finished load_event task; False if loading or storing failed"""
+    try:
+        payload = future.result()
+    except Exception:
+        # Leave the event out of the checkpoint so the next run retries it
+        logger.exception("Failed to load %s round %s", year, round_number)
+        return False
+
+    db = SessionLocal()
+    try:
+        store_event(db, payload)
+        return True
+    except Exception:
+        db.rollback()
+        logger.exception("Failed to store %s round %s", year, round_number)
+        return False
+    finally:
+        db.close()
+
+
+def ingest_seasons(
+    years: Iterable[int],
+    workers: Optional[int] = None,
+    resume: bool = True,
+    offline: Optional[bool] = None,
+    telemetry: bool = False,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """
+    Ingest every race weekend of the given seasons. Returns the number of
+    events stored. With `resume`, events already in the checkpoint are skipped;
+    with `telemetry`, race car data is also written to the telemetry store.
+    `progress` is called with (events processed, events pending) as each
+    event completes, whether it was stored or failed.
+    """
+    workers = workers or settings.INGESTION_WORKERS
+    offline = settings.FASTF1_OFFLINE if offline is None else offline
+    cache_dir = settings.FASTF1_CACHE_DIR
+    checkpoint = Checkpoint(settings.INGESTION_CHECKPOINT_FILE)
+    if not resume:
+        checkpoint.completed.clear()
+
+    pending = [
+        (year, round_number)
+        for year in years
+        for round_number in event_rounds(year, cache_dir, offline)
+        if not checkpoint.is_done(year, round_number)
+    ]
+    logger.info("Ingesting %d events with %d workers", len(pending), workers)
+    if progress:
+        progress(0, len(pending))
+
+    stored = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(load_event, year, round_number, cache_dir, offline, telemetry): (year, round_number)
+            for year, round_number in pending
+        }
+        for processed, future in enumerate(as_completed(futures), start=1):
+            year, round_number = futures[future]
+            if _store_loaded(future, year, round_number):
+                checkpoint.mark_done(year, round_number)
+                stored += 1
+                logger.info("Stored %s round %s (%d/%d)", year, round_number, stored, len(pending))
+            if progress:
+                progress(processed, len(pending))
+
+    if stored:
+        # Entity caches live in each API worker; entries expire after ENTITY_CACHE_TTL
+        response_cache.invalidate("seasons", "races", "drivers", "constructors", "results", "standings", "laps")
+    return stored
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ingest F1 seasons from FastF1")
+    parser.add_argument("years", type=int, nargs="+", help="Seasons to ingest")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and reload every event")
+    parser.add_argument("--offline", action="store_true", help="Only use the local FastF1 cache")
+    parser.add_argument("--telemetry", action="store_true", help="Also store race car telemetry")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    stored = ingest_seasons(
+        args.years,
+        workers=args.workers,
+        resume=not args.restart,
+        offline=args.offline or None,
+        telemetry=args.telemetry,
+    )
+    logger.info("Done, %d events stored", stored)
+
+
+if __name__ == "__main__":
+    main()
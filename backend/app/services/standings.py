@@ -0,0 +1,165 @@
+"""
+Championship standings.
+
+Standings are stored per race as cumulative tables (driver_standings and
+constructor_standings). When the results of a race change, only that race and
+the later rounds of its season are rebuilt, starting from the totals of the
+earlier rounds (one grouped query over their results); a full recompute is the
+same walk from round one. Earlier rounds that have results but no standings
+yet are rebuilt too, so the stored tables never skip a round.
+
+Positions are decided by points, then by count-back: most wins, then most
+second places, and so on down the finishing positions.
+"""
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.race import Race
+from app.models.result import RaceResult
+from app.models.season import Season
+from app.models.standing import ConstructorStanding, DriverStanding
+
+# Running totals per driver/constructor: key -> [points, finishing position -> count]
+Totals = Dict[str, list]
+
+
+def _totals() -> Totals:
+    return defaultdict(lambda: [0.0, Counter()])
+
+
+def _add(totals: Totals, key: str, points: float, position: Optional[int], count: int = 1) -> None:
+    totals[key][0] += points
+    if position is not None:
+        totals[key][1][position] += count
+
+
+def _ranked(totals: Totals) -> List[Tuple[str, float, int, int]]:
+    """
+    Rank by points then count-back; entries with identical records are
+    ordered by key to keep the order stable. Returns (key, points, wins, position)
+    """
+    depth = max((max(placings, default=0) for _, placings in totals.values()), default=0)
+    order = sorted(
+        totals.items(),
+        key=lambda item: (-item[1][0], *(-item[1][1][place] for place in range(1, depth + 1)), item[0]),
+    )
+    return [
+        (key, points, placings[1], position)
+        for position, (key, (points, placings)) in enumerate(order, start=1)
+    ]
+
+
+def _earlier_totals(db: Session, race_ids: List[str]) -> Tuple[Totals, Totals]:
+    """Driver and constructor totals over the results of the given races"""
+    driver_totals, constructor_totals = _totals(), _totals()
+    if not race_ids:
+        return driver_totals, constructor_totals
+    rows = (
+        db.query(RaceResult.driver_id, RaceResult.constructor_id, RaceResult.position,
+                 func.sum(RaceResult.points), func.count())
+        .filter(RaceResult.race_id.in_(race_ids))
+        .group_by(RaceResult.driver_id, RaceResult.constructor_id, RaceResult.position)
+    )
+    for driver_id, constructor_id, position, points, count in rows:
+        _add(driver_totals, driver_id, points, position, count)
+        _add(constructor_totals, constructor_id, points, position, count)
+    return driver_totals, constructor_totals
+
+
+def _write(db: Session, model: Type, key_column: str, race_id: str, totals: Totals, now: datetime) -> None:
+    db.query(model).filter(model.race_id == race_id).delete(synchronize_session=False)
+    db.bulk_insert_mappings(model, [
+        {"race_id": race_id, key_column: key, "points": points, "wins": wins, "position": position,
+         "created_at": now, "updated_at": now}
+        for key, points, wins, position in _ranked(totals)
+    ])
+
+
+def update_standings(db: Session, season_id: str, from_round: int = 1) -> int:
+    """
+    Rebuild the standings of a season from `from_round` onward, or from the
+    first earlier round whose results have no standings yet. Races without
+    results get no standings. Returns the number of races rebuilt. The
+    caller commits.
+    """
+    races = db.query(Race).filter(Race.season_id == season_id).order_by(Race.round).all()
+    race_ids = [race.id for race in races]
+    with_results = {
+        race_id for (race_id,) in
+        db.query(RaceResult.race_id).filter(RaceResult.race_id.in_(race_ids)).distinct()
+    } if race_ids else set()
+    with_standings = {
+        race_id for (race_id,) in
+        db.query(DriverStanding.race_id).filter(DriverStanding.race_id.in_(race_ids)).distinct()
+    } if race_ids else set()
+
+    missing = [race.round for race in races if race.id in with_results and race.id not in with_standings]
+    if missing:
+        from_round = min(from_round, missing[0])
+
+    previous = [race.id for race in races if race.round < from_round and race.id in with_results]
+    pending = [race for race in races if race.round >= from_round]
+    driver_totals, constructor_totals = _earlier_totals(db, previous)
+
+    pending_ids = [race.id for race in pending]
+    results_by_race = defaultdict(list)
+    if pending_ids:
+        rows = (
+            db.query(RaceResult.race_id, RaceResult.driver_id, RaceResult.constructor_id,
+                     RaceResult.points, RaceResult.position)
+            .filter(RaceResult.race_id.in_(pending_ids))
+        )
+        for row in rows:
+            results_by_race[row.race_id].append(row)
+
+    now = datetime.utcnow()
+    rebuilt = 0
+    for race in pending:
+        results = results_by_race.get(race.id)
+        if not results:
+            db.query(DriverStanding).filter(DriverStanding.race_id == race.id).delete(synchronize_session=False)
+            db.query(ConstructorStanding).filter(ConstructorStanding.race_id == race.id).delete(synchronize_session=False)
+            continue
+
+        for result in results:
+            _add(driver_totals, result.driver_id, result.points, result.position)
+            _add(constructor_totals, result.constructor_id, result.points, result.position)
+
+        _write(db, DriverStanding, "driver_id", race.id, driver_totals, now)
+        _write(db, ConstructorStanding, "constructor_id", race.id, constructor_totals, now)
+        rebuilt += 1
+
+    return rebuilt
+
+
+def update_standings_for_race(db: Session, race: Race) -> int:
+    """Rebuild standings after the results of `race` changed. The caller commits."""
+    return update_standings(db, race.season_id, from_round=race.round)
+
+
+def recompute_season(db: Session, year: int) -> int:
+    """Rebuild all standings of a season from scratch. The caller commits."""
+    season = db.query(Season).filter(Season.year == year).first()
+    if not season:
+        return 0
+    return update_standings(db, season.id, from_round=1)
+
+
+def standings_race(db: Session, year: int, round: Optional[int] = None) -> Optional[Race]:
+    """
+    Return the race whose standings describe the season after `round`
+    (latest race with standings when `round` is None), or None.
+    """
+    has_standings = db.query(DriverStanding.id).filter(DriverStanding.race_id == Race.id).exists()
+    query = (
+        db.query(Race)
+        .join(Season, Season.id == Race.season_id)
+        .filter(Season.year == year, has_standings)
+    )
+    if round is not None:
+        query = query.filter(Race.round <= round)
+    return query.order_by(Race.round.desc()).first()
@@ -0,0 +1,252 @@
+"""
+Columnar telemetry store.
+
+Car telemetry is kept out of Postgres. Each driver's samples for a race are
+stored under TELEMETRY_DIR/<year>/<round>/<driver_id>/ as one .npy file per
+channel, plus a lap index (lap numbers and the sample offset where each lap
+starts). Reads memory-map the channel files, so serving one lap only touches
+the bytes of that lap.
+
+Each <driver_id> entry is a symlink to a version directory next to it
+(.<driver_id>.<random>). A write fills a new version and swaps the link with
+a rename, so readers see the old or the new data, never a missing or partial
+directory; the replaced version is kept until the following write for readers
+still using it.
+
+For charting whole races, a level-of-detail pyramid is built at write time:
+for every size in TELEMETRY_LOD_LEVELS the samples holding the minimum and
+maximum speed of each bucket are kept (in lod/<size>/), which preserves the
+peaks and troughs a line chart needs. A request for N points is served from the
+largest stored level not above N, so its cost does not depend on race length.
+"""
+import os
+import re
+import shutil
+import tempfile
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.config import settings
+
+# Channel name -> on-disk dtype
+CHANNELS: Dict[str, np.dtype] = {
+    "time_ms": np.dtype("<i4"),  # Session time in milliseconds
+    "speed": np.dtype("<f4"),  # km/h
+    "rpm": np.dtype("<f4"),
+    "gear": np.dtype("i1"),
+    "throttle": np.dtype("<f4"),  # 0-100 %
+    "brake": np.dtype("u1"),  # 0/1
+    "drs": np.dtype("u1"),
+}
+
+# FastF1 car data column for each channel (time_ms is derived from SessionTime)
+FASTF1_COLUMNS = {
+    "speed": "Speed",
+    "rpm": "RPM",
+    "gear": "nGear",
+    "throttle": "Throttle",
+    "brake": "Brake",
+    "drs": "DRS",
+}
+
+
+# Channel whose extremes select the samples kept by the downsampling
+LOD_CHANNEL = "speed"
+
+# Driver ids (e.g. max_verstappen) are path components of the store
+DRIVER_ID_PATTERN = r"^[A-Za-z0-9_-]+$"
+
+
+class TelemetryNotFound(LookupError):
+    """No telemetry stored for the requested race, driver or lap"""
+
+
+def driver_dir(year: int, round_number: int, driver_id: str, root: Optional[str] = None) -> str:
+    if not re.match(DRIVER_ID_PATTERN, driver_id):
+        raise ValueError(f"Invalid driver id {driver_id!r}")
+    return os.path.join(root or settings.TELEMETRY_DIR, str(year), f"{round_number:02d}", driver_id)
+
+
+def car_data_to_channels(car_data: pd.DataFrame, laps: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Convert one driver's FastF1 car data into channel arrays, tagging every
+    sample with its lap number from the lap start times. Samples before the
+    first lap are dropped. Returns the channels plus a "lap" array.
+    """
+    session_ms = car_data["SessionTime"].dt.total_seconds().to_numpy() * 1000
+    laps = laps.dropna(subset=["LapStartTime", "LapNumber"]).sort_values("LapStartTime")
+    lap_start_ms = laps["LapStartTime"].dt.total_seconds().to_numpy() * 1000
+    lap_numbers = laps["LapNumber"].to_numpy(dtype=np.int16)
+
+    lap_index = np.searchsorted(lap_start_ms, session_ms, side="right") - 1
+    keep = lap_index >= 0
+
+    channels = {"time_ms": np.rint(session_ms[keep]).astype(CHANNELS["time_ms"])}
+    for channel, column in FASTF1_COLUMNS.items():
+        values = pd.to_numeric(car_data[column], errors="coerce").fillna(0).to_numpy()
+        channels[channel] = values[keep].astype(CHANNELS[channel])
+    channels["lap"] = lap_numbers[lap_index[keep]]
+    return channels
+
+
+def minmax_downsample(values: np.ndarray, points: int) -> np.ndarray:
+    """
+    Indices of at most `points` samples: the minimum and maximum of `values`
+    in each of points // 2 equally sized buckets, in time order.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    if n <= points:
+        return np.arange(n)
+
+    buckets = max(points // 2, 1)
+    size = -(-n // buckets)  # ceil(n / buckets)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = values
+    grid = padded.reshape(buckets, size)
+
+    # Buckets made only of padding can appear when n is just above a multiple of size
+    valid = ~np.all(np.isnan(grid), axis=1)
+    grid = np.where(np.isnan(grid), -np.inf, grid)
+    maxima = np.argmax(grid, axis=1)
+    grid = np.where(np.isinf(grid), np.inf, grid)
+    minima = np.argmin(grid, axis=1)
+
+    offsets = np.arange(buckets) * size
+    indices = np.concatenate([(offsets + minima)[valid], (offsets + maxima)[valid]])
+    return np.unique(indices)
+
+
+def _write_lod(staging: str, channels: Dict[str, np.ndarray]) -> None:
+    values = np.asarray(channels[LOD_CHANNEL])
+    for points in settings.TELEMETRY_LOD_LEVELS:
+        if len(values) <= points:
+            continue
+        indices = minmax_downsample(values, points)
+        level_dir = os.path.join(staging, "lod", str(points))
+        os.makedirs(level_dir)
+        for channel, dtype in CHANNELS.items():
+            np.save(os.path.join(level_dir, f"{channel}.npy"), np.asarray(channels[channel], dtype=dtype)[indices])
+
+
+def _swap_in(staging: str, target: str) -> None:
+    """Point the `target` link at the `staging` version; keep the replaced version, remove older ones"""
+    parent, name = os.path.split(target)
+    previous = os.path.realpath(target) if os.path.islink(target) else None
+    if previous is None and os.path.isdir(target):
+        # Store written before versioned directories: move the data aside once
+        previous = tempfile.mkdtemp(prefix=f".{name}.", dir=parent)
+        os.rmdir(previous)
+        os.rename(target, previous)
+
+    link = f"{staging}.link"
+    os.symlink(os.path.basename(staging), link)
+    os.replace(link, target)
+
+    for entry in os.listdir(parent):
+        path = os.path.join(parent, entry)
+        if entry.startswith(f".{name}.") and os.path.isdir(path) and path not in (staging, previous):
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def write_driver_telemetry(
+    year: int,
+    round_number: int,
+    driver_id: str,
+    channels: Dict[str, np.ndarray],
+    root: Optional[str] = None,
+) -> str:
+    """
+    Write one driver's telemetry for a race. `channels` holds equally long
+    arrays for every channel in CHANNELS plus "lap"; samples must be in time
+    order. Builds the level-of-detail pyramid and replaces any previous data
+    atomically. Returns the directory (the link to the new version).
+    """
+    target = driver_dir(year, round_number, driver_id, root)
+    parent = os.path.dirname(target)
+    os.makedirs(parent, exist_ok=True)
+
+    laps = np.asarray(channels["lap"])
+    # Lap boundaries: first sample index of each lap plus the total length
+    starts = np.flatnonzero(np.r_[True, laps[1:] != laps[:-1]]) if len(laps) else np.array([], dtype=np.int64)
+    offsets = np.r_[starts, len(laps)].astype(np.int64)
+
+    staging = tempfile.mkdtemp(prefix=f".{driver_id}.", dir=parent)
+    try:
+        for channel, dtype in CHANNELS.items():
+            np.save(os.path.join(staging, f"{channel}.npy"), np.asarray(channels[channel], dtype=dtype))
+        np.save(os.path.join(staging, "lap_numbers.npy"), laps[starts].astype(np.int16))
+        np.save(os.path.join(staging, "lap_offsets.npy"), offsets)
+        _write_lod(staging, channels)
+        _swap_in(staging, target)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return target
+
+
+def _stored_levels(source: str) -> list:
+    lod_dir = os.path.join(source, "lod")
+    if not os.path.isdir(lod_dir):
+        return []
+    return sorted(int(name) for name in os.listdir(lod_dir) if name.isdigit())
+
+
+def read_driver_telemetry(
+    year: int,
+    round_number: int,
+    driver_id: str,
+    lap: Optional[int] = None,
+    channels: Optional[Iterable[str]] = None,
+    points: Optional[int] = None,
+    root: Optional[str] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Read one driver's telemetry for a race, optionally a single lap and a
+    subset of channels. Arrays are slices of memory-mapped files.
+
+    With `points`, at most that many samples are returned: whole-race reads
+    use the largest precomputed level that fits; single laps, and requests
+    below the smallest level, are downsampled on the fly.
+    """
+    # Resolved once, so every file is read from the same version
+    source = os.path.realpath(driver_dir(year, round_number, driver_id, root))
+    if not os.path.isdir(source):
+        raise TelemetryNotFound(f"No telemetry for driver {driver_id}")
+
+    channels = list(channels or CHANNELS)
+    for channel in channels:
+        if channel not in CHANNELS:
+            raise ValueError(f"Unknown telemetry channel {channel}")
+
+    start, stop = 0, None
+    if lap is not None:
+        lap_numbers = np.load(os.path.join(source, "lap_numbers.npy"))
+        offsets = np.load(os.path.join(source, "lap_offsets.npy"))
+        matches = np.flatnonzero(lap_numbers == lap)
+        if not len(matches):
+            raise TelemetryNotFound(f"No telemetry for driver {driver_id} on lap {lap}")
+        start, stop = int(offsets[matches[0]]), int(offsets[matches[0] + 1])
+    elif points is not None:
+        levels = _stored_levels(source)
+        total = len(np.load(os.path.join(source, f"{LOD_CHANNEL}.npy"), mmap_mode="r"))
+        if levels and points < total:
+            fitting = [level for level in levels if level <= points]
+            source = os.path.join(source, "lod", str(fitting[-1] if fitting else levels[0]))
+
+    data = {}
+    for channel in channels:
+        values = np.load(os.path.join(source, f"{channel}.npy"), mmap_mode="r")
+        data[channel] = values[start:stop]
+
+    if points is not None:
+        speed = data.get(LOD_CHANNEL)
+        if speed is None:
+            speed = np.load(os.path.join(source, f"{LOD_CHANNEL}.npy"), mmap_mode="r")[start:stop]
+        if len(speed) > points:
+            indices = minmax_downsample(speed, points)
+            data = {channel: values[indices] for channel, values in data.items()}
+    return data
+
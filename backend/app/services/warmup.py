@@ -0,0 +1,163 @@
+"""
+Response cache warm-up.
+
+Cached responses are keyed by endpoint and resolved parameters, so the only
+reliable way to fill the cache is to serve the real requests. Paths are
+requested in-process through the ASGI application, without a network
+round-trip, and their responses stored by the cache decorators as usual.
+
+`warm_up` runs at startup (see the lifespan in app.main) and after ingestion
+jobs: it serves the hottest responses, most requested first, until the
+CACHE_WARMUP_SECONDS / CACHE_WARMUP_MAX_ENTRIES budget is spent.
+"""
+import logging
+import time
+from typing import Callable, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.db.database import SessionLocal
+from app.models.race import Race
+from app.models.season import Season
+from app.utils.cache import response_cache
+
+logger = logging.getLogger(__name__)
+
+
+def default_paths() -> List[str]:
+    """Entity list paths, warmed first"""
+    return [f"{settings.API_V1_PREFIX}/{resource}/" for resource in ("seasons", "drivers", "constructors")]
+
+
+def hot_paths(db: Session) -> List[str]:
+    """
+    Paths worth warming, hottest first: the entity lists, the calendar and
+    standings of the CACHE_WARMUP_SEASONS latest seasons, then the race pages
+    of the latest season.
+    """
+    prefix = settings.API_V1_PREFIX
+    paths = default_paths()
+
+    years = [
+        year for (year,) in
+        db.query(Season.year).order_by(Season.year.desc()).limit(settings.CACHE_WARMUP_SEASONS)
+    ]
+    for year in years:
+        paths += [
+            f"{prefix}/races/season/{year}",
+            f"{prefix}/seasons/{year}/standings/drivers",
+            f"{prefix}/seasons/{year}/standings/constructors",
+        ]
+
+    if years:
+        races = (
+            db.query(Race.id)
+            .join(Season, Season.id == Race.season_id)
+            .filter(Season.year == years[0])
+            .order_by(Race.round)
+        )
+        paths += [f"{prefix}/races/{race_id}/full" for (race_id,) in races]
+    return paths
+
+
+def _hot_paths() -> List[str]:
+    db = SessionLocal()
+    try:
+        return hot_paths(db)
+    finally:
+        db.close()
+
+
+async def _get(app, path: str) -> int:
+    """Serve GET `path` through the ASGI app and return the status code"""
+    url = urlsplit(path)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": url.path,
+        "raw_path": url.path.encode("utf-8"),
+        "query_string": url.query.encode("utf-8"),
+        "root_path": "",
+        "headers": [(b"host", b"warmup"), (b"accept", b"application/json")],
+        "client": None,
+        "server": ("warmup", 80),
+    }
+    status = 500
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def warm_paths(
+    app,
+    paths: Iterable[str],
+    progress: Optional[Callable[[int, int], None]] = None,
+    budget: Optional[float] = None,
+) -> List[str]:
+    """
+    Request every path once so its response lands in the cache, stopping
+    once `budget` seconds have passed or the cache backend fails. Returns the
+    paths served successfully; failures are logged and skipped.
+    """
+    paths = list(paths)
+    deadline = time.monotonic() + budget if budget is not None else None
+    warmed = []
+    for done, path in enumerate(paths, start=1):
+        if deadline is not None and time.monotonic() >= deadline:
+            logger.info("Cache warm-up budget spent after %d of %d paths", done - 1, len(paths))
+            break
+        if not response_cache.enabled:
+            logger.warning("Response cache unavailable, cache warm-up stopped")
+            break
+        try:
+            status = await _get(app, path)
+        except Exception:
+            logger.exception("Cache warm-up of %s failed", path)
+        else:
+            if status == 200:
+                warmed.append(path)
+            else:
+                # e.g. standings of a season without results
+                logger.info("Cache warm-up of %s returned %s", path, status)
+        if progress:
+            progress(done, len(paths))
+    return warmed
+
+
+async def warm_up(app, progress: Optional[Callable[[int, int], None]] = None) -> List[str]:
+    """
+    Warm the hottest responses within the configured budget. Does nothing
+    when the response cache is disabled. Never raises.
+    """
+    if not response_cache.enabled:
+        return []
+
+    started = time.monotonic()
+    try:
+        paths = await run_in_threadpool(_hot_paths)
+        warmed = await warm_paths(
+            app,
+            paths[:settings.CACHE_WARMUP_MAX_ENTRIES],
+            progress,
+            budget=settings.CACHE_WARMUP_SECONDS - (time.monotonic() - started),
+        )
+    except Exception:
+        logger.exception("Cache warm-up failed")
+        return []
+
+    logger.info("Warmed %d cached responses in %.1fs", len(warmed), time.monotonic() - started)
+    return warmed
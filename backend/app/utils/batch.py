@@ -0,0 +1,95 @@
+from typing import Any, List, Type
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from app.utils.cache import entity_cache
+
+# Upper bound on the number of ids accepted by a batch lookup
+MAX_BATCH_IDS = 100
+
+
+def parse_ids(ids: str, key_type: type = str) -> List[Any]:
+    """
+    Split a comma-separated `ids` parameter into distinct keys in request
+    order. Raises a 400 error on empty, oversized or mistyped input.
+    """
+    keys = []
+    for raw in ids.split(","):
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            key = key_type(raw)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid id {raw}")
+        if key not in keys:
+            keys.append(key)
+
+    if not keys:
+        raise HTTPException(status_code=400, detail="No ids given")
+    if len(keys) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_IDS} ids per request")
+    return keys
+
+
+def _cached(keys: List[Any], cache_kind: str) -> dict:
+    found = {}
+    for key in keys:
+        cached = entity_cache.get((cache_kind, key))
+        if cached is not None:
+            found[key] = cached
+    return found
+
+
+def _collect(rows, found: dict, key_column: InstrumentedAttribute, schema: Type[BaseModel], cache_kind: str) -> None:
+    for row in rows:
+        key = getattr(row, key_column.key)
+        found[key] = schema.model_validate(row)
+        entity_cache.set((cache_kind, key), found[key])
+
+
+def _ordered(keys: List[Any], found: dict) -> dict:
+    return {
+        "items": [found[key] for key in keys if key in found],
+        "missing": [str(key) for key in keys if key not in found],
+    }
+
+
+def batch_get(
+    db: Session,
+    key_column: InstrumentedAttribute,
+    keys: List[Any],
+    schema: Type[BaseModel],
+    cache_kind: str,
+) -> dict:
+    """
+    Resolve `keys` to response models in request order. Entities found in the
+    entity cache are reused; the rest are fetched with a single IN query and
+    cached. Returns {"items": [...], "missing": [...]}.
+    """
+    found = _cached(keys, cache_kind)
+    pending = [key for key in keys if key not in found]
+    if pending:
+        rows = db.query(key_column.class_).filter(key_column.in_(pending))
+        _collect(rows, found, key_column, schema, cache_kind)
+    return _ordered(keys, found)
+
+
+async def batch_get_async(
+    db: AsyncSession,
+    key_column: InstrumentedAttribute,
+    keys: List[Any],
+    schema: Type[BaseModel],
+    cache_kind: str,
+) -> dict:
+    """Async variant of batch_get"""
+    found = _cached(keys, cache_kind)
+    pending = [key for key in keys if key not in found]
+    if pending:
+        rows = await db.scalars(select(key_column.class_).where(key_column.in_(pending)))
+        _collect(rows, found, key_column, schema, cache_kind)
+    return _ordered(keys, found)
@@ -0,0 +1,396 @@
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Dict, Optional, Union
+
+import redis
+from fastapi import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.utils.conditional import (
+    has_inline_validators, provides_validators, reuse_validators, validator_headers, validator_headers_async,
+)
+from app.utils.metrics import MetricFamily, register_collector
+from app.utils.serialization import dump_json, injected_headers, json_response
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryCacheBackend:
+    """
+    In-process stand-in for Redis implementing the handful of commands the
+    response cache and the job queue use. Selected with CACHE_BACKEND=memory for tests and local
+    development without a Redis server.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _live(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._live(key)
+
+    def mget(self, keys: list) -> list:
+        with self._lock:
+            return [self._live(key) for key in keys]
+
+    def set(self, key: str, value: Any, ex: Optional[int] = None, nx: bool = False) -> bool:
+        with self._lock:
+            if nx and self._live(key) is not None:
+                return False
+            expires_at = time.monotonic() + ex if ex else None
+            self._data[key] = (value, expires_at)
+        return True
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = int(self._live(key) or 0) + 1
+            self._data[key] = (value, None)
+            return value
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(self._data.pop(key, None) is not None for key in keys)
+
+    def flushdb(self) -> bool:
+        with self._lock:
+            self._data.clear()
+        return True
+
+    # Lease operations, run as Lua scripts on Redis (see app.worker)
+
+    def renew_lease(self, key: str, owner: str, ttl: int) -> bool:
+        """Extend `owner`'s lease on `key`, or take it if free; False if another owner holds it"""
+        with self._lock:
+            if self._live(key) not in (None, owner):
+                return False
+            self._data[key] = (owner, time.monotonic() + ttl)
+        return True
+
+    def release_lease(self, key: str, owner: str) -> bool:
+        """Delete `key` if `owner` holds it"""
+        with self._lock:
+            if self._live(key) != owner:
+                return False
+            del self._data[key]
+        return True
+
+
+class ResponseCache:
+    """
+    Cache of serialized JSON responses for read-only endpoints.
+
+    Entries are grouped into namespaces (e.g. "races", "seasons"). Every
+    namespace has a generation counter that is part of the cache key, so
+    invalidating a namespace is a single INCR and stale entries simply expire.
+    Cache errors never fail a request: on a backend error the cache is bypassed
+    for CACHE_RETRY_SECONDS. Invalidations that could not reach the backend are
+    kept and applied before the cache is used again, so responses cached
+    before an outage are not served once it ends.
+    """
+
+    def __init__(self, client: Optional[Any], prefix: str = "apexdata"):
+        self.client = client
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._disabled_until = 0.0
+        self._pending_invalidations: set = set()
+
+    @classmethod
+    def from_settings(cls) -> "ResponseCache":
+        if settings.CACHE_BACKEND == "redis":
+            client = redis.Redis.from_url(
+                settings.REDIS_URL,
+                socket_timeout=settings.CACHE_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.CACHE_SOCKET_TIMEOUT,
+            )
+        elif settings.CACHE_BACKEND == "memory":
+            client = MemoryCacheBackend()
+        else:
+            client = None
+        return cls(client)
+
+    @property
+    def enabled(self) -> bool:
+        return self.client is not None and time.monotonic() >= self._disabled_until
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _backend_error(self, exc: Exception) -> None:
+        self._count("errors")
+        self._disabled_until = time.monotonic() + settings.CACHE_RETRY_SECONDS
+        logger.warning("Response cache unavailable, bypassing for %ss: %s", settings.CACHE_RETRY_SECONDS, exc)
+
+    def _generation_key(self, namespace: str) -> str:
+        return f"{self.prefix}:gen:{namespace}"
+
+    def build_key(self, name: str, namespaces: tuple, params: Dict[str, Any]) -> str:
+        """Build the cache key for an endpoint call from its namespaces' generations and parameters"""
+        generations = self.client.mget([self._generation_key(ns) for ns in namespaces])
+        generation = ".".join(str(int(gen or 0)) for gen in generations)
+        digest = hashlib.sha1(repr(sorted(params.items())).encode("utf-8")).hexdigest()
+        return f"{self.prefix}:resp:{name}:{generation}:{digest}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        value = self.client.get(key)
+        self._count("hits" if value is not None else "misses")
+        return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self.client.set(key, value, ex=ttl)
+
+    def invalidate(self, *namespaces: str) -> None:
+        """
+        Invalidate every cached response depending on any of the namespaces.
+        Also attempted while the cache is bypassed; on failure the namespaces
+        are invalidated again before the next lookup.
+        """
+        if self.client is None:
+            return
+        with self._lock:
+            self._pending_invalidations.update(namespaces)
+        self._flush_invalidations()
+
+    def _flush_invalidations(self) -> bool:
+        """Bump the generations of pending invalidations; False if the backend failed"""
+        with self._lock:
+            pending, self._pending_invalidations = self._pending_invalidations, set()
+        done = set()
+        try:
+            for namespace in sorted(pending):
+                self.client.incr(self._generation_key(namespace))
+                done.add(namespace)
+        except redis.RedisError as exc:
+            with self._lock:
+                self._pending_invalidations.update(pending - done)
+            self._backend_error(exc)
+            return False
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "errors": self.errors}
+
+    def _lookup(self, name: str, namespaces: tuple, params: Dict[str, Any]) -> tuple:
+        """Return (key, cached response); key is None when the backend failed"""
+        if self._pending_invalidations and not self._flush_invalidations():
+            return None, None
+        try:
+            key = self.build_key(name, namespaces, params)
+            cached_value = self.get(key)
+        except redis.RedisError as exc:
+            self._backend_error(exc)
+            return None, None
+
+        if cached_value is None:
+            return key, None
+
+        raw_headers, _, body = cached_value.partition(b"\n")
+        headers = json.loads(raw_headers)
+        headers["X-Cache"] = "HIT"
+        return key, json_response(body, headers)
+
+    def _store(self, key: str, body: bytes, headers: Dict[str, str], ttl: int) -> Response:
+        try:
+            self.set(key, json.dumps(headers).encode("utf-8") + b"\n" + body, ttl)
+        except redis.RedisError as exc:
+            self._backend_error(exc)
+
+        return json_response(body, {**headers, "X-Cache": "MISS"})
+
+    def cached(
+        self,
+        *namespaces: str,
+        response_model: Any,
+        ttl: Union[int, Callable[..., int], None] = None,
+    ):
+        """
+        Decorator caching the JSON response of a read-only endpoint.
+
+        The endpoint's path and query parameters form the key; namespaces list
+        the resources the response depends on. `ttl` is a number of seconds or
+        a callable receiving the endpoint's parameters. Headers set on an
+        injected `Response` (e.g. pagination cursors) are cached along with
+        the body. Works on both plain and `async def` endpoints; for the latter
+        the cache round-trips run in the threadpool. Responses are serialized
+        directly (see app.utils.serialization), also when the cache is bypassed.
+        Under `conditional`, the ETag/Last-Modified validators are fetched
+        before the endpoint runs (or by an `inline_validators` endpoint along
+        with its rows) and stored with the entry, so hits need no database
+        query.
+        """
+
+        def decorator(func):
+            name = f"{func.__module__}.{func.__name__}"
+            inline = has_inline_validators(func)
+
+            def cache_params(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+                return {k: v for k, v in kwargs.items() if not isinstance(v, (Response, Session, AsyncSession))}
+
+            def serialize(result, params, kwargs, validators) -> tuple:
+                expires = ttl(**params) if callable(ttl) else (ttl or settings.CACHE_TTL)
+                return dump_json(result, response_model), {**injected_headers(kwargs), **validators}, expires
+
+            def uncached(result, kwargs):
+                if isinstance(result, Response):
+                    return result
+                return json_response(dump_json(result, response_model), injected_headers(kwargs))
+
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        if not inline:
+                            await validator_headers_async()
+                        return uncached(await func(*args, **kwargs), kwargs)
+
+                    params = cache_params(kwargs)
+                    key, hit = await run_in_threadpool(self._lookup, name, namespaces, params)
+                    if hit is not None:
+                        reuse_validators(hit.headers)
+                        return hit
+
+                    # Validators first: they must not describe newer data than the body
+                    validators = None if inline else await validator_headers_async()
+                    result = await func(*args, **kwargs)
+                    if validators is None:
+                        validators = await validator_headers_async()
+                    if key is None or isinstance(result, Response):
+                        return uncached(result, kwargs)
+                    entry = serialize(result, params, kwargs, validators)
+                    return await run_in_threadpool(self._store, key, *entry)
+
+                return provides_validators(async_wrapper)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    if not inline:
+                        validator_headers()
+                    return uncached(func(*args, **kwargs), kwargs)
+
+                params = cache_params(kwargs)
+                key, hit = self._lookup(name, namespaces, params)
+                if hit is not None:
+                    reuse_validators(hit.headers)
+                    return hit
+
+                # Validators first: they must not describe newer data than the body
+                validators = None if inline else validator_headers()
+                result = func(*args, **kwargs)
+                if validators is None:
+                    validators = validator_headers()
+                if key is None or isinstance(result, Response):
+                    return uncached(result, kwargs)
+                return self._store(key, *serialize(result, params, kwargs, validators))
+
+            return provides_validators(wrapper)
+
+        return decorator
+
+
+class LRUCache:
+    """
+    Bounded, thread-safe LRU cache with a per-entry TTL.
+
+    The cache lives in the worker process, so writes handled by another worker
+    are only picked up once the entry expires; the TTL bounds that staleness.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Any, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, *keys: Any) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._data)}
+
+
+def season_ttl(year: int, **_: Any) -> int:
+    """Completed seasons never change, so they are cached much longer than the current one"""
+    if year < date.today().year:
+        return settings.CACHE_HISTORICAL_TTL
+    return settings.CACHE_TTL
+
+
+response_cache = ResponseCache.from_settings()
+
+# Single-entity lookups keyed by (kind, natural key), e.g. ("driver", "hamilton")
+entity_cache = LRUCache(settings.ENTITY_CACHE_SIZE, settings.ENTITY_CACHE_TTL)
+
+
+def _collect_cache_metrics() -> list:
+    requests = MetricFamily("apexdata_cache_requests_total", "counter", "Cache lookups by cache and outcome")
+    errors = MetricFamily("apexdata_cache_errors_total", "counter", "Response cache backend errors")
+    size = MetricFamily("apexdata_cache_entries", "gauge", "Entries held by the in-process entity cache")
+
+    response_stats = response_cache.stats()
+    entity_stats = entity_cache.stats()
+    for cache, stats in (("response", response_stats), ("entity", entity_stats)):
+        requests.add(stats["hits"], {"cache": cache, "result": "hit"})
+        requests.add(stats["misses"], {"cache": cache, "result": "miss"})
+    errors.add(response_stats["errors"])
+    size.add(entity_stats["size"])
+    return [requests, errors, size]
+
+
+register_collector(_collect_cache_metrics)
@@ -0,0 +1,311 @@
+"""
+HTTP conditional requests.
+
+GET endpoints decorated with `conditional` carry an ETag derived from the rows
+they depend on: a single aggregate query returns max(updated_at) and count(*)
+for every source table, without loading rows. A request whose If-None-Match
+matches is answered with 304 before the endpoint runs, i.e. before any cache
+lookup or serialization. Deleted rows change the count and thus the ETag, but
+not max(updated_at), so Last-Modified (and If-Modified-Since) is only used by
+single-row endpoints (`last_modified=True`), whose row cannot disappear
+without the endpoint answering 404.
+
+Only conditional requests pay for the aggregate query up front. Endpoints
+marked with `provides_validators` supply the validators of other requests
+themselves: the response cache fetches them with `validator_headers()` before
+loading the data on a miss, stores them with the entry and hands them back
+with `reuse_validators()` on a hit; single-entity lookups derive them from the
+entity with `entity_validators()`. Cache hits thus touch no database
+connection. Endpoints marked with `inline_validators` select the aggregates
+as extra columns of their own query (`validator_columns()`, then
+`columns_validators()`), so a cache miss is a single round-trip. Other
+endpoints get their validators computed before they run.
+"""
+import functools
+import hashlib
+import inspect
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from fastapi import Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# A source is a model (whole table) or (model, where) with `where` building a
+# filter clause from the endpoint's parameters
+Source = Union[type, Tuple[type, Callable[..., Any]]]
+
+_REQUEST_PARAM = "conditional_request"
+_RESPONSE_PARAM = "conditional_response"
+
+# Marker attributes of endpoints supplying their own validators, and of those
+# selecting them within their own query
+_PROVIDES_VALIDATORS = "provides_validators"
+_INLINE_VALIDATORS = "inline_validators"
+
+
+class _Validators:
+    """Validator headers of the current request, computed at most once"""
+
+    def __init__(self, compute: Callable[[], Any], from_row: Callable[[tuple], Dict[str, str]], statement):
+        self.compute = compute
+        self.from_row = from_row
+        self.statement = statement
+        self.headers: Optional[Dict[str, str]] = None
+
+
+_current: ContextVar[Optional[_Validators]] = ContextVar("conditional_validators", default=None)
+
+
+def provides_validators(endpoint):
+    """Mark an endpoint (or a cache decorator) as supplying the validators of unconditional requests"""
+    setattr(endpoint, _PROVIDES_VALIDATORS, True)
+    return endpoint
+
+
+def inline_validators(endpoint):
+    """
+    Mark an endpoint as selecting `validator_columns()` along with its rows:
+    the response cache then leaves the validators to it instead of querying
+    them before it runs
+    """
+    setattr(endpoint, _INLINE_VALIDATORS, True)
+    return endpoint
+
+
+def has_inline_validators(endpoint) -> bool:
+    return getattr(endpoint, _INLINE_VALIDATORS, False)
+
+
+def validator_headers() -> Dict[str, str]:
+    """ETag/Last-Modified headers of the current conditional GET; {} outside one"""
+    current = _current.get()
+    if current is None:
+        return {}
+    if current.headers is None:
+        current.headers = current.compute()
+    return current.headers
+
+
+async def validator_headers_async() -> Dict[str, str]:
+    """`validator_headers` for async endpoints"""
+    current = _current.get()
+    if current is None:
+        return {}
+    if current.headers is None:
+        current.headers = await current.compute()
+    return current.headers
+
+
+def entity_validators(updated_at: datetime) -> None:
+    """
+    Validators of an endpoint whose single source is one row, from that row's
+    updated_at: the (max(updated_at), count) the aggregate query would return
+    """
+    current = _current.get()
+    if current is not None and current.headers is None:
+        current.headers = current.from_row((updated_at, 1))
+
+
+def validator_columns() -> list:
+    """
+    The aggregate columns of the current conditional GET, as scalar subqueries
+    to add to the endpoint's own select; [] outside one or once computed
+    """
+    current = _current.get()
+    if current is None or current.headers is not None:
+        return []
+    return list(current.statement.selected_columns)
+
+
+def columns_validators(values) -> None:
+    """Validators from the values of `validator_columns()` in a result row"""
+    current = _current.get()
+    if current is not None and current.headers is None:
+        current.headers = current.from_row(tuple(values))
+
+
+def reuse_validators(headers: Dict[str, str]) -> None:
+    """Use the validators stored with a cache entry, unless already computed for this request"""
+    current = _current.get()
+    if current is not None and current.headers is None and "ETag" in headers:
+        current.headers = {name: headers[name] for name in ("ETag", "Last-Modified") if name in headers}
+
+
+def _validators_statement(sources: List[Tuple[type, Optional[Callable[..., Any]]]], params: Dict[str, Any]):
+    columns = []
+    for model, where in sources:
+        max_updated = select(func.max(model.updated_at))
+        count = select(func.count()).select_from(model)
+        if where is not None:
+            clause = where(**params)
+            max_updated, count = max_updated.where(clause), count.where(clause)
+        columns += [max_updated.scalar_subquery(), count.scalar_subquery()]
+    return select(*columns)
+
+
+def _representation(request: Request, params: Dict[str, Any]) -> str:
+    """
+    The route and the endpoint's resolved parameters (e.g. `fmt` negotiated
+    from the Accept header), as in the response cache key: the same response
+    whatever the spelling of the query string or the unrelated headers
+    """
+    route = request.scope.get("route")
+    resolved = {k: v for k, v in params.items() if not isinstance(v, Request)}
+    return f"{getattr(route, 'path_format', request.url.path)}|{sorted(resolved.items())!r}"
+
+
+def _validators(row, representation: str, last_modified: bool) -> Tuple[str, Optional[datetime]]:
+    """Build (etag, last_modified) from the aggregate row and the requested representation"""
+    fingerprint = "|".join([
+        representation,
+        *(value.isoformat() if isinstance(value, datetime) else str(value) for value in row),
+    ])
+    etag = 'W/"' + hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:32] + '"'
+
+    timestamps = [value for value in row[::2] if value is not None] if last_modified else []
+    return etag, max(timestamps).replace(tzinfo=timezone.utc, microsecond=0) if timestamps else None
+
+
+def _is_conditional(request: Request) -> bool:
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def _not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        # Weak comparison, as required for GET. "*" is not honoured: the
+        # validators are known before the endpoint has found the resource
+        return etag.removeprefix("W/") in (tag.removeprefix("W/") for tag in tags)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and last_modified is not None:
+        try:
+            return last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+
+def _injected_param(signature: inspect.Signature, annotation: type) -> Optional[str]:
+    for name, param in signature.parameters.items():
+        if isinstance(param.annotation, type) and issubclass(param.annotation, annotation):
+            return name
+    return None
+
+
+def conditional(*sources: Source, last_modified: bool = False):
+    """
+    Decorator adding ETag validators and 304 handling to a GET endpoint with a
+    `db` session (plain or async). Place it between the route decorator and
+    the cache decorator, e.g.
+
+        @router.get("/{year}")
+        @conditional((Season, lambda year, **_: Season.year == year), last_modified=True)
+        @serialized(SeasonResponse)
+        def get_season(year: int, db: Session = Depends(get_db)): ...
+
+    Pass `last_modified=True` only when the sources are a single row: the
+    endpoint then also sends Last-Modified and honours If-Modified-Since.
+    """
+    normalized = [source if isinstance(source, tuple) else (source, None) for source in sources]
+
+    def decorator(endpoint):
+        # FastAPI injects at most one Request and one Response per endpoint, so
+        # reuse the endpoint's own parameters when it declares them
+        signature = inspect.signature(endpoint)
+        request_param = _injected_param(signature, Request) or _REQUEST_PARAM
+        response_param = _injected_param(signature, Response) or _RESPONSE_PARAM
+        added = [
+            inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, annotation=annotation)
+            for name, annotation in ((request_param, Request), (response_param, Response))
+            if name not in signature.parameters
+        ]
+
+        def split(kwargs: Dict[str, Any]) -> tuple:
+            request = kwargs[request_param] if request_param in signature.parameters else kwargs.pop(request_param)
+            response = kwargs[response_param] if response_param in signature.parameters else kwargs.pop(response_param)
+            db = next(v for v in kwargs.values() if isinstance(v, (Session, AsyncSession)))
+            params = {k: v for k, v in kwargs.items() if not isinstance(v, (Response, Session, AsyncSession))}
+            return request, response, params, db
+
+        def finish(result, headers: Dict[str, str], response: Response):
+            target = result if isinstance(result, Response) else response
+            target.headers.update(headers)
+            return result
+
+        # Validators computed up front, before any cache is looked at
+        eager = lambda request: _is_conditional(request) or not getattr(endpoint, _PROVIDES_VALIDATORS, False)
+
+        if inspect.iscoroutinefunction(endpoint):
+            @functools.wraps(endpoint)
+            async def wrapper(*args, **kwargs):
+                request, response, params, db = split(kwargs)
+
+                statement = _validators_statement(normalized, params)
+                representation = _representation(request, params)
+                build = lambda row: _validators(row, representation, last_modified)
+
+                async def compute() -> Dict[str, str]:
+                    row = (await db.execute(statement)).one()
+                    return _headers(*build(row))
+
+                validators = _Validators(compute, lambda row: _headers(*build(row)), statement)
+                if eager(request):
+                    row = (await db.execute(statement)).one()
+                    etag, modified = build(row)
+                    validators.headers = _headers(etag, modified)
+                    if _not_modified(request, etag, modified):
+                        return Response(status_code=304, headers=validators.headers)
+
+                token = _current.set(validators)
+                try:
+                    result = await endpoint(*args, **kwargs)
+                    headers = await validator_headers_async()
+                finally:
+                    _current.reset(token)
+                return finish(result, headers, response)
+        else:
+            @functools.wraps(endpoint)
+            def wrapper(*args, **kwargs):
+                request, response, params, db = split(kwargs)
+
+                statement = _validators_statement(normalized, params)
+                representation = _representation(request, params)
+                build = lambda row: _validators(row, representation, last_modified)
+
+                def compute() -> Dict[str, str]:
+                    row = db.execute(statement).one()
+                    return _headers(*build(row))
+
+                validators = _Validators(compute, lambda row: _headers(*build(row)), statement)
+                if eager(request):
+                    row = db.execute(statement).one()
+                    etag, modified = build(row)
+                    validators.headers = _headers(etag, modified)
+                    if _not_modified(request, etag, modified):
+                        return Response(status_code=304, headers=validators.headers)
+
+                token = _current.set(validators)
+                try:
+                    result = endpoint(*args, **kwargs)
+                    headers = validator_headers()
+                finally:
+                    _current.reset(token)
+                return finish(result, headers, response)
+
+        wrapper.__signature__ = signature.replace(parameters=[*signature.parameters.values(), *added])
+        return wrapper
+
+    return decorator
@@ -0,0 +1,66 @@
+"""
+Single-entity lookups by natural key through the per-worker entity cache,
+shared by the sync and async read handlers. The cached response model also
+supplies the ETag/Last-Modified validators (see app.utils.conditional).
+"""
+from typing import Any, Optional, Type
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from app.utils.cache import entity_cache
+from app.utils.conditional import entity_validators
+
+
+def _cached(cache_kind: str, key: Any) -> Optional[BaseModel]:
+    cached = entity_cache.get((cache_kind, key))
+    if cached is not None:
+        entity_validators(cached.updated_at)
+    return cached
+
+
+def _found(row, key_column: InstrumentedAttribute, key: Any, schema: Type[BaseModel], cache_kind: str) -> BaseModel:
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"{key_column.class_.__name__} {key} not found")
+
+    response = schema.model_validate(row)
+    entity_cache.set((cache_kind, key), response)
+    entity_validators(response.updated_at)
+    return response
+
+
+def get_entity(
+    db: Session,
+    key_column: InstrumentedAttribute,
+    key: Any,
+    schema: Type[BaseModel],
+    cache_kind: str,
+) -> BaseModel:
+    """
+    The entity whose `key_column` equals `key` as a `schema` response model,
+    from the entity cache or else loaded and cached. Raises a 404 error if
+    there is no such entity.
+    """
+    cached = _cached(cache_kind, key)
+    if cached is not None:
+        return cached
+    row = db.scalar(select(key_column.class_).where(key_column == key))
+    return _found(row, key_column, key, schema, cache_kind)
+
+
+async def get_entity_async(
+    db: AsyncSession,
+    key_column: InstrumentedAttribute,
+    key: Any,
+    schema: Type[BaseModel],
+    cache_kind: str,
+) -> BaseModel:
+    """Async variant of get_entity"""
+    cached = _cached(cache_kind, key)
+    if cached is not None:
+        return cached
+    row = await db.scalar(select(key_column.class_).where(key_column == key))
+    return _found(row, key_column, key, schema, cache_kind)
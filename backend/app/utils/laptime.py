@@ -0,0 +1,64 @@
+from datetime import timedelta
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+# "83.456", "1:23.456" or "1:34:50.616"
+_LAP_TIME_PATTERN = r"^(?:(?:(\d+):)?(\d{1,2}):)?(\d{1,2}(?:\.\d+)?)$"
+
+
+def to_milliseconds(value) -> Optional[int]:
+    """Convert a timedelta (or pandas Timedelta/NaT) to integer milliseconds"""
+    if value is None or pd.isna(value):
+        return None
+    if isinstance(value, timedelta):
+        return int(round(value.total_seconds() * 1000))
+    return int(round(pd.Timedelta(value).total_seconds() * 1000))
+
+
+def format_lap_time(milliseconds: Optional[int]) -> Optional[str]:
+    """Format milliseconds as a lap time, e.g. 83456 -> "1:23.456" """
+    if milliseconds is None:
+        return None
+    minutes, rest = divmod(int(milliseconds), 60_000)
+    seconds, millis = divmod(rest, 1000)
+    return f"{minutes}:{seconds:02d}.{millis:03d}"
+
+
+def format_race_time(milliseconds: Optional[int]) -> Optional[str]:
+    """Format milliseconds as a total race time, e.g. 5690616 -> "1:34:50.616" """
+    if milliseconds is None:
+        return None
+    hours, rest = divmod(int(milliseconds), 3_600_000)
+    minutes, rest = divmod(rest, 60_000)
+    seconds, millis = divmod(rest, 1000)
+    return f"{hours}:{minutes:02d}:{seconds:02d}.{millis:03d}"
+
+
+def format_gap(milliseconds: Optional[int]) -> Optional[str]:
+    """Format a gap to the winner, e.g. 5123 -> "+5.123", 65123 -> "+1:05.123" """
+    if milliseconds is None:
+        return None
+    if milliseconds >= 60_000:
+        return f"+{format_lap_time(milliseconds)}"
+    seconds, millis = divmod(int(milliseconds), 1000)
+    return f"+{seconds}.{millis:03d}"
+
+
+def parse_lap_times(values: Iterable[Optional[str]]) -> pd.Series:
+    """
+    Parse lap/race time strings into integer milliseconds, vectorized.
+
+    Accepts "SS.mmm", "M:SS.mmm" and "H:MM:SS.mmm"; missing or unparseable
+    values become <NA>. Returns a nullable Int64 series aligned with the input.
+    """
+    text = pd.Series(list(values), dtype="string").str.strip()
+    parts = text.str.extract(_LAP_TIME_PATTERN).apply(pd.to_numeric)
+    hours = parts[0].fillna(0).to_numpy(dtype=float)
+    minutes = parts[1].fillna(0).to_numpy(dtype=float)
+    seconds = parts[2].to_numpy(dtype=float)
+
+    milliseconds = np.rint(((hours * 60 + minutes) * 60 + seconds) * 1000)
+    return pd.Series(milliseconds, dtype="Float64").astype("Int64")
+
@@ -0,0 +1,97 @@
+"""
+Minimal Prometheus text exposition.
+
+Modules register collectors returning metric families; GET /metrics renders
+them all in the text format (version 0.0.4).
+"""
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Default latency buckets in seconds
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Dict[str, str]
+Sample = Tuple[str, Labels, float]
+
+_collectors: List[Callable[[], Iterable["MetricFamily"]]] = []
+
+
+class MetricFamily:
+    """A named metric with its type, help text and samples"""
+
+    def __init__(self, name: str, metric_type: str, help_text: str):
+        self.name = name
+        self.type = metric_type
+        self.help = help_text
+        self.samples: List[Sample] = []
+
+    def add(self, value: float, labels: Optional[Labels] = None, suffix: str = "") -> "MetricFamily":
+        self.samples.append((self.name + suffix, labels or {}, value))
+        return self
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        for name, labels, value in self.samples:
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Histogram:
+    """Thread-safe cumulative histogram, kept per label set"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[Tuple[str, str], ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Optional[Labels] = None) -> None:
+        key = tuple(sorted((labels or {}).items()))
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.setdefault(key, [[0] * (len(self.buckets) + 1), 0.0, 0])
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def family(self, name: str, help_text: str) -> MetricFamily:
+        family = MetricFamily(name, "histogram", help_text)
+        with self._lock:
+            snapshot = [(dict(key), list(counts), total, count) for key, (counts, total, count) in self._series.items()]
+        for labels, counts, total, count in snapshot:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, float("inf")), counts):
+                cumulative += bucket_count
+                family.add(cumulative, {**labels, "le": _format_value(bound)}, "_bucket")
+            family.add(total, labels, "_sum")
+            family.add(count, labels, "_count")
+        return family
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def register_collector(collector: Callable[[], Iterable[MetricFamily]]) -> None:
+    """Register a callable returning metric families, evaluated on every scrape"""
+    _collectors.append(collector)
+
+
+def render_metrics() -> str:
+    return "\n".join(family.render() for collector in _collectors for family in collector()) + "\n"
@@ -0,0 +1,145 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException, Response
+from pydantic import BaseModel
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from app.utils.formats import JSON, tabular_response
+
+# Header carrying the cursor of the next page on list endpoints
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the sort key values of the last row of a page into an opaque cursor.
+    """
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_value(value: Any, python_type: type) -> Any:
+    """A cursor value as the column's Python type; raises ValueError on a mismatch"""
+    if python_type in (date, datetime):
+        if not isinstance(value, str):
+            raise ValueError(f"expected an ISO {python_type.__name__}")
+        return python_type.fromisoformat(value)
+    if python_type is float and isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    # bool is an int subclass: true/false is no integer key
+    if not isinstance(value, python_type) or (isinstance(value, bool) and python_type is not bool):
+        raise ValueError(f"expected {python_type.__name__}")
+    return value
+
+
+def decode_cursor(cursor: str, columns: Sequence[InstrumentedAttribute]) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor back into typed sort key values.
+    Raises a 400 error if the cursor is malformed or does not match the columns.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("cursor does not match sort columns")
+
+        return [_decode_value(value, column.type.python_type) for column, value in zip(columns, values)]
+    except (ValueError, TypeError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def _keyset_statement(
+    statement: Select,
+    columns: Sequence[InstrumentedAttribute],
+    limit: int,
+    after: Optional[str],
+    skip: int,
+    descending: bool,
+) -> Select:
+    order_by = [column.desc() if descending else column.asc() for column in columns]
+    statement = statement.order_by(*order_by)
+
+    if after is not None:
+        key = tuple_(*columns)
+        values = tuple_(*decode_cursor(after, columns))
+        statement = statement.where(key < values if descending else key > values)
+    elif skip:
+        statement = statement.offset(skip)
+
+    # Fetch one extra row to know whether another page exists
+    return statement.limit(limit + 1)
+
+
+def _page(rows: list, columns: Sequence[InstrumentedAttribute], limit: int) -> Tuple[list, Optional[str]]:
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    next_cursor = encode_cursor([getattr(last, column.key) for column in columns])
+    return rows, next_cursor
+
+
+def keyset_paginate(
+    db: Session,
+    statement: Select,
+    columns: Sequence[InstrumentedAttribute],
+    limit: int,
+    after: Optional[str] = None,
+    skip: int = 0,
+    descending: bool = False,
+) -> Tuple[list, Optional[str]]:
+    """
+    Fetch one page of a `select()` of a single entity ordered by the given columns.
+
+    The last column must be unique (the primary key) so the ordering is total.
+    When a cursor is given, rows are located with a row-value comparison on the
+    sort columns instead of OFFSET, so every page costs the same regardless of
+    depth. Returns the rows and the cursor of the next page (None on the last page).
+    """
+    if limit <= 0:
+        return [], None
+
+    statement = _keyset_statement(statement, columns, limit, after, skip, descending)
+    return _page(list(db.scalars(statement).all()), columns, limit)
+
+
+async def keyset_paginate_async(
+    db: AsyncSession,
+    statement: Select,
+    columns: Sequence[InstrumentedAttribute],
+    limit: int,
+    after: Optional[str] = None,
+    skip: int = 0,
+    descending: bool = False,
+) -> Tuple[list, Optional[str]]:
+    """Async variant of keyset_paginate"""
+    if limit <= 0:
+        return [], None
+
+    statement = _keyset_statement(statement, columns, limit, after, skip, descending)
+    rows = (await db.scalars(statement)).all()
+    return _page(list(rows), columns, limit)
+
+
+def page_response(rows: list, next_cursor: Optional[str], response: Response, schema: Type[BaseModel], fmt: str):
+    """
+    A page of a list endpoint: the rows, with the next page's cursor in the
+    X-Next-Cursor header, or a columnar response for `format=arrow|parquet`
+    """
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if fmt != JSON:
+        return tabular_response(rows, schema, fmt, response.headers)
+    return rows
@@ -0,0 +1,136 @@
+"""
+Per-request SQL profiling.
+
+Cursor execution hooks on every engine count statements and accumulate their
+time into the profile of the current request (a context variable set by
+SQLProfilingMiddleware). Each response gets a Server-Timing header with the
+DB time and query count, statements slower than SQL_SLOW_QUERY_MS are logged
+with their route, and per-route aggregates are exposed on /metrics, so N+1
+patterns show up as routes with a high queries-per-request count.
+"""
+import logging
+import time
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+from app.utils.metrics import Histogram, MetricFamily, register_collector
+
+logger = logging.getLogger(__name__)
+
+QUERY_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100, 250)
+
+
+class RequestProfile:
+    """SQL statistics of one request"""
+
+    __slots__ = ("route", "queries", "db_time")
+
+    def __init__(self, route: str):
+        self.route = route
+        self.queries = 0
+        self.db_time = 0.0
+
+
+_profile: ContextVar[Optional[RequestProfile]] = ContextVar("sql_profile", default=None)
+
+queries_per_request = Histogram(QUERY_BUCKETS)
+db_seconds_per_request = Histogram()
+request_seconds = Histogram()
+
+
+# The start time is kept on the statement's execution context, which is
+# discarded with it, whether the statement completes or fails
+_START_ATTRIBUTE = "_apexdata_query_start"
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    setattr(context, _START_ATTRIBUTE, time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _record(statement, context)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    # Failed statements spent database time too
+    if exception_context.execution_context is not None:
+        _record(exception_context.statement, exception_context.execution_context)
+
+
+def _record(statement: Optional[str], context) -> None:
+    start = getattr(context, _START_ATTRIBUTE, None)
+    if start is None:
+        return
+    delattr(context, _START_ATTRIBUTE)
+    elapsed = time.perf_counter() - start
+
+    profile = _profile.get()
+    if profile is not None:
+        profile.queries += 1
+        profile.db_time += elapsed
+
+    if elapsed * 1000 >= settings.SQL_SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query (%.1f ms) on %s: %s",
+            elapsed * 1000,
+            profile.route if profile is not None else "-",
+            " ".join((statement or "").split())[:1000],
+        )
+
+
+class SQLProfilingMiddleware:
+    """ASGI middleware opening a RequestProfile per HTTP request and reporting it"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(scope["path"])
+        token = _profile.set(profile)
+        start = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                # The router stores the matched route in the scope
+                route = scope.get("route")
+                if route is not None:
+                    profile.route = route.path
+                total = (time.perf_counter() - start) * 1000
+                timing = (
+                    f'db;dur={profile.db_time * 1000:.1f};desc="{profile.queries} queries", '
+                    f"app;dur={total:.1f}"
+                )
+                message.setdefault("headers", []).append((b"server-timing", timing.encode("latin-1")))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _profile.reset(token)
+            if scope.get("route") is not None:
+                labels = {"route": scope["route"].path, "method": scope["method"]}
+                queries_per_request.observe(profile.queries, labels)
+                db_seconds_per_request.observe(profile.db_time, labels)
+                request_seconds.observe(time.perf_counter() - start, labels)
+
+
+def _collect() -> List[MetricFamily]:
+    return [
+        request_seconds.family("apexdata_http_request_seconds", "Request duration by route"),
+        queries_per_request.family("apexdata_db_queries_per_request", "SQL statements executed per request by route"),
+        db_seconds_per_request.family("apexdata_db_seconds_per_request", "Time spent in SQL per request by route"),
+    ]
+
+
+register_collector(_collect)
@@ -0,0 +1,71 @@
+"""
+Fast JSON serialization.
+
+By default FastAPI validates an endpoint's return value against its
+response_model, converts it with jsonable_encoder and encodes the result with
+the json module. Endpoints decorated with `serialized` (and the response
+cache) skip that path: ORM rows are validated into the response model and
+dumped to bytes by pydantic-core in one pass through a cached TypeAdapter.
+"""
+import functools
+import inspect
+from typing import Any, Dict, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+@functools.lru_cache(maxsize=None)
+def type_adapter(response_model: Any) -> TypeAdapter:
+    """TypeAdapter for a response model, built once per model"""
+    return TypeAdapter(response_model)
+
+
+def dump_json(value: Any, response_model: Any) -> bytes:
+    """Serialize ORM rows or models as `response_model` straight to JSON bytes"""
+    adapter = type_adapter(response_model)
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+
+def injected_headers(kwargs: Dict[str, Any]) -> Dict[str, str]:
+    """Headers set on the `Response` injected into an endpoint, if any"""
+    for value in kwargs.values():
+        if isinstance(value, Response):
+            return {k: v for k, v in value.headers.items() if k not in ("content-length", "content-type")}
+    return {}
+
+
+def json_response(body: bytes, headers: Optional[Dict[str, str]] = None, status_code: int = 200) -> Response:
+    return Response(content=body, status_code=status_code, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+def serialized(response_model: Any):
+    """
+    Decorator returning the endpoint's result as pre-serialized JSON. Keep the
+    same `response_model` on the route for the OpenAPI schema. Results that
+    already are a `Response` pass through; headers set on an injected
+    `Response` are kept.
+    """
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                result = await func(*args, **kwargs)
+                if isinstance(result, Response):
+                    return result
+                return json_response(dump_json(result, response_model), injected_headers(kwargs))
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
+            return json_response(dump_json(result, response_model), injected_headers(kwargs))
+
+        return wrapper
+
+    return decorator
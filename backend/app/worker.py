@@ -0,0 +1,261 @@
+"""
+Background jobs.
+
+Celery application running season ingestion, standings recomputation and
+cache warming outside the request cycle. Jobs are submitted and polled
+through /api/v1/jobs. Start workers with
+
+    celery -A app.worker worker
+    celery -A app.worker worker -Q ingestion --pool threads --concurrency 1
+
+Ingestion jobs go to their own queue: they parse sessions in a process pool,
+which prefork worker processes cannot host.
+
+Every job type has a concurrency limit (JOBS_CONCURRENCY). A running job holds
+one of its type's slots, a lease in Redis renewed whenever the job reports
+progress; a job finding no free slot is retried after JOBS_RETRY_SECONDS, so
+the limit holds however many workers run.
+
+With JOBS_EAGER, jobs run inline in the submitting process and their state is
+kept in memory, so no broker or worker is needed. A job exceeding the limit
+then fails instead of waiting.
+"""
+import asyncio
+import json
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import redis
+from celery import Celery, states
+from celery.result import AsyncResult
+from kombu.exceptions import OperationalError
+
+from app.config import settings
+from app.db import base  # noqa: F401
+from app.db.database import SessionLocal
+from app.services.ingestion import ingest_seasons
+from app.services.standings import recompute_season
+from app.services.warmup import warm_paths, warm_up
+from app.utils.cache import MemoryCacheBackend, response_cache
+
+logger = logging.getLogger(__name__)
+
+# Custom state reported while a job runs, with {"current": ..., "total": ...}
+PROGRESS = "PROGRESS"
+
+celery_app = Celery("apexdata")
+if settings.JOBS_EAGER:
+    celery_app.conf.update(
+        broker_url="memory://",
+        result_backend="cache+memory://",
+        task_always_eager=True,
+        task_store_eager_result=True,
+    )
+else:
+    celery_app.conf.update(broker_url=settings.REDIS_URL, result_backend=settings.REDIS_URL)
+celery_app.conf.update(
+    task_track_started=True,
+    result_expires=settings.JOBS_RESULT_TTL,
+    worker_prefetch_multiplier=1,
+    task_routes={"apexdata.jobs.ingest_seasons": {"queue": "ingestion"}},
+)
+
+# Job records and concurrency slots
+_store = MemoryCacheBackend() if settings.JOBS_EAGER else redis.Redis.from_url(settings.REDIS_URL)
+_PREFIX = "apexdata:jobs"
+
+# Compare-and-renew and compare-and-delete of a slot lease, atomic on the
+# Redis server: a lease that expires between the check and the write must not
+# renew or release another job's slot
+_RENEW_LEASE = """
+local owner = redis.call('GET', KEYS[1])
+if owner == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+    return 1
+end
+if owner then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return 1
+"""
+_RELEASE_LEASE = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def _lease_commands(store) -> tuple:
+    """(renew(key, owner, ttl), release(key, owner)) for the job store"""
+    if isinstance(store, MemoryCacheBackend):
+        return store.renew_lease, store.release_lease
+    renew, release = store.register_script(_RENEW_LEASE), store.register_script(_RELEASE_LEASE)
+    return (
+        lambda key, owner, ttl: bool(renew(keys=[key], args=[owner, ttl])),
+        lambda key, owner: bool(release(keys=[key], args=[owner])),
+    )
+
+
+_renew_lease, _release_lease = _lease_commands(_store)
+
+# Job type -> Celery task
+JOBS: Dict[str, Any] = {}
+
+_STATUSES = {
+    states.PENDING: "queued",
+    states.RECEIVED: "queued",
+    states.RETRY: "queued",
+    states.STARTED: "running",
+    PROGRESS: "running",
+    states.SUCCESS: "succeeded",
+    states.FAILURE: "failed",
+    states.REVOKED: "failed",
+}
+
+
+class JobLimitReached(RuntimeError):
+    """Every slot of the job's type is taken"""
+
+
+class JobQueueUnavailable(RuntimeError):
+    """The broker or the job store cannot be reached"""
+
+
+def _decode(value: Any) -> Any:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _acquire_slot(job_type: str, job_id: str) -> Optional[str]:
+    """Take a free slot of `job_type` for the job; returns its key, or None when all are taken"""
+    for slot in range(settings.JOBS_CONCURRENCY.get(job_type, 1)):
+        key = f"{_PREFIX}:slot:{job_type}:{slot}"
+        if _store.set(key, job_id, nx=True, ex=settings.JOBS_SLOT_TTL) or _decode(_store.get(key)) == job_id:
+            return key
+    return None
+
+
+def _renew_slot(key: str, job_id: str) -> None:
+    """Extend the job's lease on its slot, taking it back if it lapsed while still free"""
+    if not _renew_lease(key, job_id, settings.JOBS_SLOT_TTL):
+        logger.warning("Job %s lost its slot %s to another job", job_id, key)
+
+
+def _release_slot(key: str, job_id: str) -> None:
+    _release_lease(key, job_id)
+
+
+def job(job_type: str):
+    """
+    Register `func(progress, **params)` as the Celery task of a job type.
+    `progress(current, total)` reports how far the job got.
+    """
+    def decorator(func: Callable[..., Dict[str, Any]]):
+        @celery_app.task(name=f"apexdata.jobs.{job_type}", bind=True)
+        def task(self, **params):
+            job_id = self.request.id
+            slot = _acquire_slot(job_type, job_id)
+            if slot is None:
+                if self.request.is_eager:
+                    raise JobLimitReached(f"Too many {job_type} jobs running")
+                raise self.retry(countdown=settings.JOBS_RETRY_SECONDS, max_retries=None)
+
+            def progress(current: int, total: int) -> None:
+                _renew_slot(slot, job_id)
+                self.update_state(state=PROGRESS, meta={"current": current, "total": total})
+
+            try:
+                return func(progress, **params)
+            finally:
+                _release_slot(slot, job_id)
+
+        JOBS[job_type] = task
+        return task
+
+    return decorator
+
+
+def _warm_up(paths: Optional[List[str]] = None, progress: Optional[Callable[[int, int], None]] = None) -> List[str]:
+    # Imported here: the application mounts the jobs API, which imports this module
+    from app.main import app
+
+    if paths:
+        return asyncio.run(warm_paths(app, paths, progress))
+    return asyncio.run(warm_up(app, progress))
+
+
+@job("ingest_seasons")
+def ingest_seasons_job(progress, years: List[int], telemetry: bool = False, resume: bool = True) -> Dict[str, Any]:
+    """Ingest whole seasons from FastF1, then warm the response cache"""
+    stored = ingest_seasons(years, resume=resume, telemetry=telemetry, progress=progress)
+    warmed = _warm_up() if stored else []
+    return {"events": stored, "warmed": len(warmed)}
+
+
+@job("recompute_standings")
+def recompute_standings_job(progress, years: List[int]) -> Dict[str, Any]:
+    """Rebuild the standings of the given seasons from scratch"""
+    races = 0
+    progress(0, len(years))
+    for done, year in enumerate(years, start=1):
+        db = SessionLocal()
+        try:
+            races += recompute_season(db, year)
+            db.commit()
+        finally:
+            db.close()
+        progress(done, len(years))
+
+    response_cache.invalidate("standings")
+    return {"races": races}
+
+
+@job("warm_cache")
+def warm_cache_job(progress, paths: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Fill the response cache by serving the given API paths in-process, or by
+    default the hottest responses within the warm-up budget
+    """
+    return {"warmed": len(_warm_up(paths, progress))}
+
+
+def submit_job(job_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Queue a job (or, with JOBS_EAGER, run it) and return its state"""
+    job_id = str(uuid.uuid4())
+    record = {"id": job_id, "type": job_type, "params": params, "submitted_at": datetime.utcnow().isoformat()}
+    key = f"{_PREFIX}:job:{job_id}"
+    try:
+        _store.set(key, json.dumps(record), ex=settings.JOBS_RESULT_TTL)
+        JOBS[job_type].apply_async(kwargs=params, task_id=job_id)
+    except (redis.RedisError, OperationalError) as exc:
+        logger.warning("Could not queue %s job: %s", job_type, exc)
+        try:
+            _store.delete(key)
+        except redis.RedisError:
+            pass
+        raise JobQueueUnavailable("Job queue unavailable") from exc
+    return job_status(job_id)
+
+
+def job_status(job_id: str) -> Optional[Dict[str, Any]]:
+    """State, progress and result of a job, or None if no such job was submitted"""
+    try:
+        raw = _store.get(f"{_PREFIX}:job:{job_id}")
+        if raw is None:
+            return None
+        result = AsyncResult(job_id, app=celery_app)
+        state, info = result.state, result.info
+    except redis.RedisError as exc:
+        raise JobQueueUnavailable("Job queue unavailable") from exc
+
+    status = {**json.loads(raw), "status": _STATUSES.get(state, "queued")}
+    if state == PROGRESS and isinstance(info, dict):
+        status["progress"] = info
+    elif state == states.SUCCESS:
+        status["result"] = info
+    elif state == states.FAILURE:
+        status["error"] = str(info) or type(info).__name__
+    return status
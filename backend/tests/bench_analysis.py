@@ -0,0 +1,52 @@
+"""
+Timings of the race analyses on a synthetic 70-lap, 20-car race: loading the
+laps frame, computing each analysis from it, and serving each endpoint with
+and without the memoized RaceAnalysis.
+"""
+import pytest
+from sqlalchemy import select
+
+from app.models.driver import Driver
+from app.models.race import Race
+from app.services.analysis import RaceAnalysis, analysis_cache, load_laps
+from app.utils.cache import response_cache
+from tests.benchmark import report, timed
+from tests.factories import create_history, create_race_laps
+
+pytestmark = pytest.mark.bench
+
+ANALYSES = ("pace", "stints", "gaps", "undercuts")
+
+
+def test_race_analyses(client, db, monkeypatch):
+    create_history(db, seasons=1, rounds=1, drivers=20, first_year=2024)
+    race = db.scalars(select(Race)).one()
+    create_race_laps(db, race, list(db.scalars(select(Driver.id))), laps=70)
+    # Every request reaches the handler
+    monkeypatch.setattr(response_cache, "client", None)
+
+    frame = load_laps(db, race.id, 2024)
+    assert len(frame) == 20 * 70
+    rows = [{"step": "load laps", "median ms": timed(lambda: load_laps(db, race.id, 2024), repeat=10)}]
+    for name in ANALYSES:
+        rows.append({
+            "step": f"compute {name}",
+            "median ms": timed(lambda: getattr(RaceAnalysis(race.id, frame), name), repeat=10),
+        })
+
+    for name in ANALYSES:
+        path = f"/api/v1/races/{race.id}/analysis/{name}"
+        assert client.get(path).status_code == 200
+
+        def cold():
+            analysis_cache.clear()
+            client.get(path)
+
+        rows.append({"step": f"GET {name}", "median ms": timed(cold, repeat=10)})
+        rows.append({"step": f"GET {name} (memoized)", "median ms": timed(lambda: client.get(path), repeat=10)})
+
+    report("race analyses (70 laps, 20 cars)", rows)
+    pace = RaceAnalysis(race.id, frame).pace
+    assert len(pace) == 20 and pace[0]["delta_ms"] == 0
+    timings = {row["step"]: row["median ms"] for row in rows}
+    assert all(timings[f"GET {name} (memoized)"] < timings[f"GET {name}"] for name in ANALYSES)
@@ -0,0 +1,105 @@
+"""
+Load test of the sync and async (DB_ASYNC) read handlers: latency percentiles
+and throughput of concurrent uncached requests, served in-process over ASGI.
+On SQLite both modes are bound by the same single-file database, so this
+mainly measures the handlers' overhead (threadpool vs event loop); run it
+against PostgreSQL to see the effect on I/O wait.
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.api.deps import get_async_db, get_db
+from app.main import include_routers
+from app.utils.cache import entity_cache, response_cache
+from tests.benchmark import percentile, report
+from tests.factories import create_history
+
+pytestmark = pytest.mark.bench
+
+REQUESTS = 200
+CONCURRENCY = 32
+PATHS = [
+    "/api/v1/races/?limit=100",
+    "/api/v1/races/season/1985?include=results_summary",
+    "/api/v1/drivers/driver_7",
+]
+
+
+async def load(app: FastAPI, path: str) -> dict:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    latencies = []
+
+    async def request(client: httpx.AsyncClient) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append((time.perf_counter() - start) * 1000)
+            entity_cache.clear()
+            assert response.status_code == 200
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(request(client) for _ in range(REQUESTS)))
+        elapsed = time.perf_counter() - start
+    return {"p50 ms": percentile(latencies, 0.5), "p99 ms": percentile(latencies, 0.99), "req/s": REQUESTS / elapsed}
+
+
+def test_sync_and_async_handlers_under_load(engine, db, monkeypatch):
+    create_history(db, seasons=10, rounds=20, drivers=20)
+    # Every request reaches the database
+    monkeypatch.setattr(response_cache, "client", None)
+
+    sync_engine = create_engine(
+        engine.url, poolclass=QueuePool, pool_size=CONCURRENCY, connect_args={"check_same_thread": False}
+    )
+    sync_sessions = sessionmaker(bind=sync_engine, autoflush=False)
+
+    def override_get_db():
+        session = sync_sessions()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    sync_app = FastAPI(default_response_class=ORJSONResponse)
+    include_routers(sync_app, async_reads=False)
+    sync_app.dependency_overrides[get_db] = override_get_db
+
+    async def run() -> list:
+        async_engine = create_async_engine(
+            engine.url.set(drivername="sqlite+aiosqlite"), poolclass=AsyncAdaptedQueuePool, pool_size=CONCURRENCY
+        )
+        async_sessions = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+        async def override_get_async_db():
+            async with async_sessions() as session:
+                yield session
+
+        async_app = FastAPI(default_response_class=ORJSONResponse)
+        include_routers(async_app, async_reads=True)
+        async_app.dependency_overrides[get_async_db] = override_get_async_db
+
+        rows = []
+        try:
+            for path in PATHS:
+                for mode, app in (("sync", sync_app), ("async", async_app)):
+                    rows.append({"path": path, "mode": mode, **await load(app, path)})
+        finally:
+            await async_engine.dispose()
+        return rows
+
+    try:
+        rows = asyncio.run(run())
+    finally:
+        sync_engine.dispose()
+    report(f"sync vs async handlers ({REQUESTS} requests, {CONCURRENCY} concurrent, SQLite)", rows)
@@ -0,0 +1,83 @@
+"""
+Rows per second of writing a season of results one row at a time (add,
+commit, refresh, as the create handlers do) versus bulk upserts, with ON
+CONFLICT and with the portable update-then-insert fallback.
+"""
+import time
+
+import pytest
+from sqlalchemy import delete, select
+
+from app.models.constructor import Constructor
+from app.models.driver import Driver
+from app.models.race import Race
+from app.models.result import RaceResult
+from app.services import bulk
+from app.services.bulk import bulk_upsert_results
+from tests.benchmark import report
+from tests.factories import create_history
+
+pytestmark = pytest.mark.bench
+
+
+def season_rows(db) -> dict:
+    """Results of every race by race id, as bulk upsert rows"""
+    driver_ids = db.scalars(select(Driver.id).order_by(Driver.driver_id)).all()
+    constructor_ids = db.scalars(select(Constructor.id).order_by(Constructor.constructor_id)).all()
+    return {
+        race_id: [
+            {
+                "driver_id": driver_id, "constructor_id": constructor_ids[index // 2], "number": index + 1,
+                "grid": index + 1, "position": index + 1, "position_text": str(index + 1),
+                "position_order": index + 1, "points": max(25 - 2 * index, 0), "laps": 50, "status": "Finished",
+                "fastest_lap_time": "1:31.447",
+            }
+            for index, driver_id in enumerate(driver_ids)
+        ]
+        for race_id in db.scalars(select(Race.id))
+    }
+
+
+def per_row(db, rows_by_race: dict) -> None:
+    for race_id, rows in rows_by_race.items():
+        for row in rows:
+            result = RaceResult(race_id=race_id, **row)
+            db.add(result)
+            db.commit()
+            db.refresh(result)
+
+
+def bulk_upsert(db, rows_by_race: dict) -> None:
+    for race_id, rows in rows_by_race.items():
+        bulk_upsert_results(db, race_id, rows)
+    db.commit()
+
+
+def test_bulk_upsert_throughput(db, monkeypatch):
+    create_history(db, seasons=4, rounds=22, drivers=20)
+    rows_by_race = season_rows(db)
+    total = sum(len(rows) for rows in rows_by_race.values())
+
+    def measure(name, write, existing: bool) -> dict:
+        if not existing:
+            db.execute(delete(RaceResult))
+            db.commit()
+        start = time.perf_counter()
+        write(db, rows_by_race)
+        elapsed = time.perf_counter() - start
+        assert db.query(RaceResult).count() == total
+        return {"path": name, "existing rows": existing, "rows": total, "seconds": elapsed, "rows/s": total / elapsed}
+
+    rows = [
+        measure("per-row add/commit/refresh", per_row, existing=False),
+        measure("bulk ON CONFLICT", bulk_upsert, existing=False),
+        measure("bulk ON CONFLICT", bulk_upsert, existing=True),
+    ]
+    monkeypatch.setattr(bulk, "_INSERTS", {})
+    rows += [
+        measure("bulk update-then-insert", bulk_upsert, existing=False),
+        measure("bulk update-then-insert", bulk_upsert, existing=True),
+    ]
+
+    report("results writes (SQLite)", rows)
+    assert min(row["rows/s"] for row in rows[1:]) > rows[0]["rows/s"]
@@ -0,0 +1,59 @@
+"""
+Payload size, server time and client load time (into a pandas DataFrame) of
+the list endpoints as JSON, Arrow IPC and Parquet.
+"""
+import io
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from sqlalchemy import select
+
+from app.models.driver import Driver
+from app.models.race import Race
+from app.utils.cache import response_cache
+from tests.benchmark import report, timed
+from tests.factories import create_history, create_race_laps
+
+pytestmark = pytest.mark.bench
+
+LOADERS = {
+    "json": lambda response: pd.DataFrame(response.json()),
+    "arrow": lambda response: pa.ipc.open_stream(response.content).read_all().to_pandas(),
+    "parquet": lambda response: pq.read_table(io.BytesIO(response.content)).to_pandas(),
+}
+
+
+def test_columnar_formats(client, db, monkeypatch):
+    create_history(db, seasons=10, rounds=20, drivers=20)
+    race = db.scalars(select(Race).order_by(Race.date.desc()).limit(1)).one()
+    create_race_laps(db, race, list(db.scalars(select(Driver.id))), laps=70)
+    # Every request is served by the handler
+    monkeypatch.setattr(response_cache, "client", None)
+    paths = {
+        "races (500 rows)": "/api/v1/races/?limit=500",
+        "laps (1,400 rows)": f"/api/v1/races/{race.id}/laps",
+    }
+
+    rows = []
+    for name, path in paths.items():
+        frames = {}
+        for fmt, load in LOADERS.items():
+            url = f"{path}{'&' if '?' in path else '?'}format={fmt}"
+            response = client.get(url)
+            assert response.status_code == 200
+
+            start = time.perf_counter()
+            frames[fmt] = load(response)
+            load_ms = (time.perf_counter() - start) * 1000
+            rows.append({
+                "endpoint": name, "format": fmt, "bytes": len(response.content),
+                "request ms": timed(lambda: client.get(url), repeat=10), "load ms": load_ms,
+            })
+        assert all(len(frame) == len(frames["json"]) for frame in frames.values())
+
+    report("response formats", rows)
+    for json_row, arrow_row, parquet_row in zip(rows[::3], rows[1::3], rows[2::3]):
+        assert parquet_row["bytes"] < arrow_row["bytes"] < json_row["bytes"]
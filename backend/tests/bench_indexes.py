@@ -0,0 +1,43 @@
+"""
+Query plans and timings of the results lookups on a 25k-row results table,
+without the secondary indexes (as before migration 9e2d7d542f99) and with them.
+"""
+import pytest
+from sqlalchemy import select, text
+
+from app.models.driver import Driver
+from app.models.race import Race
+from tests.benchmark import report, timed
+from tests.factories import create_history
+
+pytestmark = pytest.mark.bench
+
+QUERIES = {
+    "race classification": "SELECT * FROM {table} WHERE race_id = :race_id ORDER BY position_order",
+    "driver history": "SELECT race_id, points FROM {table} WHERE driver_id = :driver_id",
+    "race cascade delete": "SELECT id FROM {table} WHERE race_id = :race_id",
+}
+
+
+def test_results_lookups_use_indexes(db):
+    create_history(db, seasons=50, rounds=25, drivers=20)
+    # The same rows without any index
+    db.execute(text("CREATE TABLE results_unindexed AS SELECT * FROM results"))
+    params = {
+        "race_id": db.scalar(select(Race.id).limit(1)),
+        "driver_id": db.scalar(select(Driver.id).limit(1)),
+    }
+
+    rows = []
+    for name, query in QUERIES.items():
+        for table in ("results_unindexed", "results"):
+            statement = text(query.format(table=table))
+            plan = " / ".join(row.detail for row in db.execute(text(f"EXPLAIN QUERY PLAN {statement}"), params))
+            elapsed = timed(lambda: db.execute(statement, params).all(), repeat=20)
+            rows.append({"query": name, "indexes": table == "results", "plan": plan, "median ms": elapsed})
+
+    report("results indexes (25,000 rows)", rows)
+    for before, after in zip(rows[::2], rows[1::2]):
+        assert before["plan"].startswith("SCAN")
+        assert "USING" in after["plan"] and "INDEX" in after["plan"]
+        assert after["median ms"] < before["median ms"]
@@ -0,0 +1,81 @@
+"""
+Index size and join latency of the results/races/drivers keys on a synthetic
+full-history dataset (75 seasons of 22 rounds, 20 drivers): 36-character text
+UUIDs, as SQLite stores UUIDString, against integer keys. On PostgreSQL
+UUIDString is the native 16-byte uuid, between the two.
+"""
+import pytest
+from sqlalchemy import text
+
+from tests.benchmark import report, timed
+from tests.factories import create_history
+
+pytestmark = pytest.mark.bench
+
+# Narrow copies of the tables with the same keys and indexes, per key type
+SCHEMA = """
+CREATE TABLE races_{keys} (id {type} PRIMARY KEY, uuid TEXT, season_id TEXT, round INTEGER);
+CREATE TABLE drivers_{keys} (id {type} PRIMARY KEY, uuid TEXT, driver_id TEXT);
+CREATE TABLE results_{keys} (id {type} PRIMARY KEY, race_id {type}, driver_id {type}, position_order INTEGER, points REAL);
+CREATE INDEX ix_results_{keys}_race ON results_{keys} (race_id, position_order);
+CREATE INDEX ix_results_{keys}_driver ON results_{keys} (driver_id, race_id);
+"""
+COPY = {
+    "text": """
+INSERT INTO races_text SELECT id, id, season_id, round FROM races;
+INSERT INTO drivers_text SELECT id, id, driver_id FROM drivers;
+INSERT INTO results_text SELECT id, race_id, driver_id, position_order, points FROM results;
+""",
+    "int": """
+INSERT INTO races_int (uuid, season_id, round) SELECT id, season_id, round FROM races;
+INSERT INTO drivers_int (uuid, driver_id) SELECT id, driver_id FROM drivers;
+INSERT INTO results_int (race_id, driver_id, position_order, points)
+SELECT ra.id, d.id, r.position_order, r.points
+FROM results r JOIN races_int ra ON ra.uuid = r.race_id JOIN drivers_int d ON d.uuid = r.driver_id;
+""",
+}
+QUERIES = {
+    "driver career": """
+SELECT ra.season_id, SUM(r.points) FROM results_{keys} r
+JOIN races_{keys} ra ON ra.id = r.race_id JOIN drivers_{keys} d ON d.id = r.driver_id
+WHERE d.driver_id = 'driver_7' GROUP BY ra.season_id
+""",
+    "season standings": """
+SELECT d.driver_id, SUM(r.points) FROM results_{keys} r
+JOIN races_{keys} ra ON ra.id = r.race_id JOIN drivers_{keys} d ON d.id = r.driver_id
+GROUP BY ra.season_id, d.driver_id ORDER BY ra.season_id, d.driver_id
+""",
+}
+
+
+def index_bytes(db, table: str) -> int:
+    """Size of a table's indexes, including the primary key index of a non-integer key"""
+    names = {
+        row.name
+        for row in db.execute(text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table"), {"table": table})
+    }
+    sizes = db.execute(text("SELECT name, SUM(pgsize) AS size FROM dbstat GROUP BY name")).all()
+    return sum(row.size for row in sizes if row.name in names)
+
+
+def test_key_types(db):
+    create_history(db, seasons=75, rounds=22, drivers=20, first_year=1950)
+    for keys, key_type in (("text", "TEXT"), ("int", "INTEGER")):
+        for statement in (SCHEMA.format(keys=keys, type=key_type) + COPY[keys]).split(";"):
+            if statement.strip():
+                db.execute(text(statement))
+    db.execute(text("ANALYZE"))
+
+    rows = []
+    for keys in ("text", "int"):
+        row = {"keys": keys, "results index KiB": index_bytes(db, f"results_{keys}") / 1024}
+        for name, query in QUERIES.items():
+            statement = text(query.format(keys=keys))
+            row[f"{name} ms"] = timed(lambda: db.execute(statement).all(), repeat=10)
+        rows.append(row)
+
+    report("surrogate keys (33,000 results)", rows)
+    text_row, int_row = rows
+    assert db.execute(text(QUERIES["season standings"].format(keys="text"))).all() == \
+        db.execute(text(QUERIES["season standings"].format(keys="int"))).all()
+    assert int_row["results index KiB"] < text_row["results index KiB"]
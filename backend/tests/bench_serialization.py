@@ -0,0 +1,72 @@
+"""
+Serialization cost per endpoint: FastAPI's default path (validation into the
+response model, jsonable_encoder, json.dumps) against `dump_json`, on the
+results the endpoints return for a synthetic season.
+"""
+import inspect
+import json
+from typing import List
+
+import pytest
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select
+
+from app.api.v1 import drivers, races
+from app.models.driver import Driver
+from app.models.race import Race
+from app.schemas.driver import DriverResponse
+from app.schemas.lap import LapResponse
+from app.schemas.race import RaceCalendarResponse, RaceFullResponse, RaceResponse
+from app.utils.serialization import dump_json, type_adapter
+from tests.benchmark import report, timed
+from tests.factories import create_history, create_race_laps
+
+pytestmark = pytest.mark.bench
+
+
+def default_path(value, response_model) -> bytes:
+    """What FastAPI does for an endpoint returning ORM rows with a response_model"""
+    validated = type_adapter(response_model).validate_python(value, from_attributes=True)
+    return json.dumps(jsonable_encoder(validated), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def test_serialization_per_endpoint(db):
+    create_history(db, seasons=5, rounds=20, drivers=20)
+    race = db.scalars(select(Race).order_by(Race.date.desc()).limit(1)).one()
+    create_race_laps(db, race, list(db.scalars(select(Driver.id))), laps=70)
+    year = race.season.year
+
+    # Results of the endpoints themselves, without their decorators
+    results = {
+        "GET /races?limit=100": (
+            inspect.unwrap(races.get_races)(Response(), limit=100, skip=0, after=None, fmt="json", db=db),
+            List[RaceResponse],
+        ),
+        "GET /races/season/{year}?include=results_summary": (
+            inspect.unwrap(races.get_races_by_season)(year, include="results_summary", fmt="json", db=db),
+            List[RaceCalendarResponse],
+        ),
+        "GET /races/{id}/full": (inspect.unwrap(races.get_race_full)(race.id, db=db), RaceFullResponse),
+        "GET /races/{id}/laps": (
+            inspect.unwrap(races.get_race_laps)(race.id, driver=None, from_lap=None, to_lap=None, fmt="json", db=db),
+            List[LapResponse],
+        ),
+        "GET /drivers?limit=100": (
+            inspect.unwrap(drivers.get_drivers)(Response(), limit=100, skip=0, after=None, fmt="json", db=db),
+            List[DriverResponse],
+        ),
+    }
+
+    rows = []
+    for endpoint, (value, response_model) in results.items():
+        assert json.loads(dump_json(value, response_model)) == json.loads(default_path(value, response_model))
+        default_ms = timed(lambda: default_path(value, response_model), repeat=20)
+        fast_ms = timed(lambda: dump_json(value, response_model), repeat=20)
+        rows.append({
+            "endpoint": endpoint, "items": len(value) if isinstance(value, list) else 1,
+            "jsonable_encoder ms": default_ms, "dump_json ms": fast_ms, "speedup": default_ms / fast_ms,
+        })
+
+    report("response serialization", rows)
+    assert all(row["dump_json ms"] < row["jsonable_encoder ms"] for row in rows)
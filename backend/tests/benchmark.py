@@ -0,0 +1,39 @@
+"""
+Helpers for the benchmarks in tests/bench_*.py. Measurements are collected
+with `report` and printed in the terminal summary of `pytest -m bench`.
+"""
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+# (title, rows) of every benchmark run in the session
+results: List[Tuple[str, List[Dict[str, Any]]]] = []
+
+
+def timed(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Median wall time of `func()` over `repeat` runs, in milliseconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def report(title: str, rows: List[Dict[str, Any]]) -> None:
+    """Record a table of measurements, one dict per row"""
+    results.append((title, rows))
+
+
+def format_table(rows: List[Dict[str, Any]]) -> List[str]:
+    columns = list(rows[0])
+    cells = [[f"{row[column]:.2f}" if isinstance(row[column], float) else str(row[column]) for column in columns] for row in rows]
+    widths = [max(len(column), *(len(row[i]) for row in cells)) for i, column in enumerate(columns)]
+    lines = ["  ".join(column.ljust(width) for column, width in zip(columns, widths))]
+    lines += ["  ".join(cell.ljust(width) for cell, width in zip(row, widths)) for row in cells]
+    return lines
@@ -0,0 +1,133 @@
+"""
+Test fixtures: the API against a SQLite database (aiosqlite for the async
+handlers), with the in-process cache backend and inline jobs, so no Postgres,
+Redis or broker is needed.
+"""
+import os
+from contextlib import contextmanager
+
+os.environ.setdefault("CACHE_BACKEND", "memory")
+os.environ.setdefault("CACHE_WARMUP_ON_STARTUP", "false")
+os.environ.setdefault("JOBS_EAGER", "true")
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool, StaticPool
+
+from app.api.deps import get_async_db, get_db, get_session_factory
+from app.db.database import Base
+from app.main import app, include_routers
+from app.services.analysis import analysis_cache
+from app.utils.cache import entity_cache, response_cache
+from tests.benchmark import format_table, results
+
+
+def _foreign_keys(connection, _):
+    connection.execute("PRAGMA foreign_keys=ON")
+
+
+@pytest.fixture
+def engine(tmp_path):
+    # A file rather than in-memory database, so that the async engine sees it too
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'apexdata.db'}", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    event.listen(engine, "connect", _foreign_keys)
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(session_factory):
+    def override_get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    _clear_caches()
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def async_client(engine, session_factory):
+    """Client of the API as mounted with DB_ASYNC: async read handlers on aiosqlite, sync writes"""
+    async_engine = create_async_engine(engine.url.set(drivername="sqlite+aiosqlite"), poolclass=NullPool)
+    event.listen(async_engine.sync_engine, "connect", _foreign_keys)
+    async_session_factory = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    def override_get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    async def override_get_async_db():
+        async with async_session_factory() as session:
+            yield session
+
+    async_app = FastAPI(default_response_class=ORJSONResponse)
+    include_routers(async_app, async_reads=True)
+    async_app.dependency_overrides[get_db] = override_get_db
+    async_app.dependency_overrides[get_async_db] = override_get_async_db
+    async_app.dependency_overrides[get_session_factory] = lambda: session_factory
+    _clear_caches()
+    with TestClient(async_app) as client:
+        yield client
+
+
+def _clear_caches():
+    response_cache.client.flushdb()
+    entity_cache.clear()
+    analysis_cache.clear()
+
+
+@pytest.fixture
+def count_statements(engine):
+    """Context manager collecting the SQL statements run on the test database"""
+
+    @contextmanager
+    def counter():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    return counter
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Print the measurements of the benchmarks that ran"""
+    for title, rows in results:
+        terminalreporter.section(title)
+        for line in format_table(rows):
+            terminalreporter.write_line(line)
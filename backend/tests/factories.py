@@ -0,0 +1,147 @@
+"""Helpers creating rows for tests"""
+from datetime import date, timedelta
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.models.constructor import Constructor
+from app.models.driver import Driver
+from app.models.lap import Lap
+from app.models.qualifying import Qualifying
+from app.models.race import Race
+from app.models.result import RaceResult
+from app.models.season import Season
+
+
+def create_season(db: Session, year: int) -> Season:
+    season = Season(year=year)
+    db.add(season)
+    db.flush()
+    return season
+
+
+def create_driver(db: Session, driver_id: str) -> Driver:
+    driver = Driver(driver_id=driver_id, given_name=driver_id.title(), family_name=driver_id.title(), nationality="X")
+    db.add(driver)
+    db.flush()
+    return driver
+
+
+def create_constructor(db: Session, constructor_id: str) -> Constructor:
+    constructor = Constructor(constructor_id=constructor_id, name=constructor_id.title(), nationality="X")
+    db.add(constructor)
+    db.flush()
+    return constructor
+
+
+def create_race(db: Session, season: Season, round: int) -> Race:
+    race = Race(
+        season_id=season.id, round=round, race_name=f"Round {round}", circuit_id=f"circuit_{round}",
+        circuit_name=f"Circuit {round}", locality="L", country="C", date=date(season.year, 3, round),
+    )
+    db.add(race)
+    db.flush()
+    return race
+
+
+def create_result(db: Session, race: Race, driver: Driver, constructor: Constructor,
+                  position: int | None, points: float) -> RaceResult:
+    result = RaceResult(
+        race_id=race.id, driver_id=driver.id, constructor_id=constructor.id, number=1, grid=1,
+        position=position, position_text=str(position) if position else "R",
+        position_order=position or 99, points=points, laps=50, status="Finished" if position else "Retired",
+    )
+    db.add(result)
+    db.flush()
+    return result
+
+
+def create_qualifying(db: Session, race: Race, driver: Driver, constructor: Constructor, position: int) -> Qualifying:
+    row = Qualifying(
+        race_id=race.id, driver_id=driver.id, constructor_id=constructor.id, number=1,
+        position=position, q1="1:30.000", q1_ms=90000,
+    )
+    db.add(row)
+    db.flush()
+    return row
+
+
+def create_lap(db: Session, race: Race, driver: Driver, lap: int, lap_time_ms: int) -> Lap:
+    row = Lap(
+        season_year=race.season.year, race_id=race.id, driver_id=driver.id, lap=lap,
+        lap_time_ms=lap_time_ms, session_time_ms=lap * lap_time_ms, stint=1, compound="SOFT", tyre_life=lap,
+    )
+    db.add(row)
+    db.flush()
+    return row
+
+
+def create_history(db: Session, seasons: int, rounds: int, drivers: int, first_year: int = 1980) -> None:
+    """
+    A synthetic championship history inserted in bulk: every driver (two per
+    constructor) classified in every round of every season
+    """
+    db.execute(insert(Season), [{"year": first_year + index} for index in range(seasons)])
+    db.execute(insert(Driver), [
+        {"driver_id": f"driver_{index}", "given_name": "Given", "family_name": f"Family {index}", "nationality": "X"}
+        for index in range(drivers)
+    ])
+    db.execute(insert(Constructor), [
+        {"constructor_id": f"team_{index}", "name": f"Team {index}", "nationality": "X"}
+        for index in range((drivers + 1) // 2)
+    ])
+    db.execute(insert(Race), [
+        {
+            "season_id": season_id, "round": round, "race_name": f"Round {round}", "circuit_id": f"circuit_{round}",
+            "circuit_name": f"Circuit {round}", "locality": "L", "country": "C",
+            "date": date(year, 1, 1) + timedelta(weeks=round),
+        }
+        for season_id, year in db.execute(select(Season.id, Season.year))
+        for round in range(1, rounds + 1)
+    ])
+    driver_ids = [row.id for row in db.execute(select(Driver.id).order_by(Driver.driver_id))]
+    constructor_ids = [row.id for row in db.execute(select(Constructor.id).order_by(Constructor.constructor_id))]
+    db.execute(insert(RaceResult), [
+        {
+            "race_id": race_id, "driver_id": driver_id, "constructor_id": constructor_ids[index // 2], "number": index + 1,
+            "grid": index + 1, "position": index + 1, "position_text": str(index + 1), "position_order": index + 1,
+            "points": max(25 - 2 * index, 0), "laps": 50, "status": "Finished",
+        }
+        for (race_id,) in db.execute(select(Race.id))
+        for index, driver_id in enumerate(driver_ids)
+    ])
+    db.commit()
+
+
+def create_race_laps(db: Session, race: Race, driver_ids: list, laps: int, pit_laps: tuple = (20, 45)) -> None:
+    """
+    Synthetic lap data for a race, inserted in bulk: every driver slightly
+    slower than the one before, with tyre degradation and a pit stop on each
+    of `pit_laps` (staggered by a lap between drivers)
+    """
+    rows = []
+    for index, driver_id in enumerate(driver_ids):
+        session_time, stint, tyre_life = 0, 1, 0
+        stops = {lap + index % 3 for lap in pit_laps}
+        for lap in range(1, laps + 1):
+            tyre_life += 1
+            lap_time = 90000 + 150 * index + 40 * tyre_life + (20000 if lap in stops else 0)
+            session_time += lap_time
+            rows.append({
+                "season_year": race.season.year, "race_id": race.id, "driver_id": driver_id, "lap": lap,
+                "lap_time_ms": lap_time, "sector_1_ms": lap_time // 3, "sector_2_ms": lap_time // 3,
+                "sector_3_ms": lap_time - 2 * (lap_time // 3), "session_time_ms": session_time,
+                "stint": stint, "compound": ("MEDIUM", "HARD", "SOFT")[(stint - 1) % 3], "tyre_life": tyre_life,
+                "pit_in": lap in stops, "pit_out": lap - 1 in stops,
+            })
+            if lap in stops:
+                stint, tyre_life = stint + 1, 0
+    # Running order at the end of each lap
+    by_lap = {}
+    for row in rows:
+        by_lap.setdefault(row["lap"], []).append(row)
+    for lap_rows in by_lap.values():
+        for position, row in enumerate(sorted(lap_rows, key=lambda row: row["session_time_ms"]), start=1):
+            row["position"] = position
+    db.execute(insert(Lap), rows)
+    db.commit()
@@ -0,0 +1,45 @@
+import pytest
+
+from tests.factories import create_driver, create_lap, create_race, create_season
+
+
+@pytest.fixture
+def race_id(db):
+    season = create_season(db, 2023)
+    race = create_race(db, season, 1)
+    for driver_id, lap_time_ms in (("hamilton", 90000), ("alonso", 90500)):
+        driver = create_driver(db, driver_id)
+        for lap in range(1, 6):
+            create_lap(db, race, driver, lap, lap_time_ms)
+    db.commit()
+    return race.id
+
+
+def test_pace_ranks_drivers_by_median_lap(client, race_id):
+    response = client.get(f"/api/v1/races/{race_id}/analysis/pace")
+
+    assert response.status_code == 200
+    assert [(driver["driver_id"], driver["delta_ms"]) for driver in response.json()["drivers"]] == [
+        ("hamilton", 0.0),
+        ("alonso", 500.0),
+    ]
+
+
+@pytest.mark.parametrize("analysis", ["pace", "stints", "gaps", "undercuts"])
+def test_deleting_the_season_invalidates_cached_analyses(client, race_id, analysis):
+    assert client.get(f"/api/v1/races/{race_id}/analysis/{analysis}").status_code == 200
+
+    assert client.delete("/api/v1/seasons/2023").status_code == 204
+
+    assert client.get(f"/api/v1/races/{race_id}/analysis/{analysis}").status_code == 404
+
+
+def test_validators_are_partition_pruned(client, race_id, count_statements):
+    etag = client.get(f"/api/v1/races/{race_id}/analysis/pace").headers["ETag"]
+
+    with count_statements() as statements:
+        response = client.get(f"/api/v1/races/{race_id}/analysis/pace", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert len(statements) == 1
+    assert " ".join(statements[0].split()).count("laps.season_year = (SELECT seasons.year") == 2
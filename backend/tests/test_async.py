@@ -0,0 +1,87 @@
+import pytest
+
+from tests.factories import create_constructor, create_driver, create_qualifying, create_race, create_result, create_season
+
+
+@pytest.fixture
+def race_id(db):
+    season = create_season(db, 2023)
+    race = create_race(db, season, 1)
+    constructor = create_constructor(db, "ferrari")
+    for position, driver_id in enumerate(["leclerc", "sainz"], start=1):
+        driver = create_driver(db, driver_id)
+        create_result(db, race, driver, constructor, position, 26 - position)
+        create_qualifying(db, race, driver, constructor, position)
+    db.commit()
+    return race.id
+
+
+@pytest.fixture
+def paths(race_id):
+    return [
+        "/api/v1/seasons/",
+        "/api/v1/seasons/2023",
+        "/api/v1/seasons/batch?ids=2023,1950",
+        "/api/v1/drivers/?limit=1",
+        "/api/v1/drivers/sainz",
+        "/api/v1/drivers/batch?ids=sainz,leclerc",
+        "/api/v1/constructors/",
+        "/api/v1/constructors/ferrari",
+        "/api/v1/constructors/batch?ids=ferrari",
+        "/api/v1/races/",
+        f"/api/v1/races/{race_id}",
+        f"/api/v1/races/batch?ids={race_id}",
+        "/api/v1/races/season/2023?include=results_summary",
+    ]
+
+
+def test_async_reads_match_sync_reads(client, async_client, count_statements, paths):
+    for path in paths:
+        with count_statements() as statements:
+            response = async_client.get(path)
+        # Served by the async handler, on the aiosqlite engine
+        assert statements == [], path
+        assert response.status_code == 200, path
+        assert response.json() == client.get(path).json(), path
+        assert response.headers["ETag"] == client.get(path).headers["ETag"], path
+
+
+def test_async_list_pages_by_cursor(async_client, db):
+    for driver_id in ("alonso", "bottas", "button"):
+        create_driver(db, driver_id)
+    db.commit()
+
+    first = async_client.get("/api/v1/drivers/", params={"limit": 2})
+    second = async_client.get("/api/v1/drivers/", params={"limit": 2, "after": first.headers["X-Next-Cursor"]})
+
+    assert [driver["driver_id"] for driver in first.json() + second.json()] == ["alonso", "bottas", "button"]
+    assert "X-Next-Cursor" not in second.headers
+
+
+@pytest.mark.parametrize("path", [
+    "/api/v1/seasons/1950",
+    "/api/v1/drivers/nobody",
+    "/api/v1/constructors/nobody",
+    "/api/v1/races/00000000-0000-4000-8000-000000000001",
+    "/api/v1/races/season/1950",
+])
+def test_async_unknown_entities_are_not_found(async_client, path):
+    assert async_client.get(path).status_code == 404
+
+
+def test_async_entity_reflects_sync_writes(async_client, db):
+    create_driver(db, "hamilton")
+    db.commit()
+    assert async_client.get("/api/v1/drivers/hamilton").json()["nationality"] == "X"
+
+    assert async_client.put("/api/v1/drivers/hamilton", json={"nationality": "British"}).status_code == 200
+
+    assert async_client.get("/api/v1/drivers/hamilton").json()["nationality"] == "British"
+
+
+def test_async_conditional_get(async_client, race_id):
+    etag = async_client.get(f"/api/v1/races/{race_id}").headers["ETag"]
+
+    response = async_client.get(f"/api/v1/races/{race_id}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
@@ -0,0 +1,44 @@
+from tests.factories import create_race, create_season
+
+
+def create_races(db, rounds: int):
+    season = create_season(db, 2023)
+    race_ids = [create_race(db, season, round).id for round in range(1, rounds + 1)]
+    db.commit()
+    return race_ids
+
+
+def test_batch_races_in_request_order(client, db):
+    first, second = create_races(db, 2)
+
+    response = client.get("/api/v1/races/batch", params={"ids": f"{second},{first}"})
+
+    assert response.status_code == 200
+    assert [race["id"] for race in response.json()["items"]] == [second, first]
+    assert response.json()["missing"] == []
+
+
+def test_batch_races_accepts_uppercase_ids(client, db):
+    (race_id,) = create_races(db, 1)
+
+    response = client.get("/api/v1/races/batch", params={"ids": race_id.upper()})
+
+    assert [race["id"] for race in response.json()["items"]] == [race_id]
+    assert response.json()["missing"] == []
+
+
+def test_batch_races_deduplicates_equivalent_ids(client, db):
+    (race_id,) = create_races(db, 1)
+
+    response = client.get("/api/v1/races/batch", params={"ids": f"{race_id},{race_id.upper()}"})
+
+    assert [race["id"] for race in response.json()["items"]] == [race_id]
+
+
+def test_batch_races_reports_unknown_and_malformed_ids(client, db):
+    create_races(db, 1)
+    unknown = "00000000-0000-4000-8000-000000000001"
+
+    response = client.get("/api/v1/races/batch", params={"ids": f"{unknown},not-a-uuid"})
+
+    assert response.json() == {"items": [], "missing": [unknown, "not-a-uuid"]}
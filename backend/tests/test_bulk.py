@@ -0,0 +1,95 @@
+import pytest
+
+from app.models.result import RaceResult
+from app.services import bulk
+from app.services.bulk import DuplicateRows, bulk_upsert_results
+from tests.factories import create_constructor, create_driver, create_race, create_season
+
+
+@pytest.fixture
+def grid(db):
+    season = create_season(db, 2023)
+    race = create_race(db, season, 1)
+    drivers = [create_driver(db, name) for name in ("alonso", "hamilton")]
+    constructor = create_constructor(db, "mclaren")
+    db.commit()
+    return race, drivers, constructor
+
+
+def result_row(driver, constructor, position, points):
+    return {
+        "driver_id": driver.id, "constructor_id": constructor.id, "number": 1, "grid": 1,
+        "position": position, "position_text": str(position), "position_order": position,
+        "points": points, "laps": 50, "status": "Finished",
+    }
+
+
+def test_upsert_updates_existing_rows(db, grid):
+    race, (alonso, hamilton), constructor = grid
+    bulk_upsert_results(db, race.id, [result_row(alonso, constructor, 1, 25)])
+    counts = bulk_upsert_results(
+        db, race.id, [result_row(alonso, constructor, 2, 18), result_row(hamilton, constructor, 1, 25)]
+    )
+    db.commit()
+
+    assert counts == {"upserted": 2, "deleted": 0}
+    points = dict(db.query(RaceResult.driver_id, RaceResult.points).all())
+    assert points == {alonso.id: 18, hamilton.id: 25}
+
+
+def test_duplicate_keys_are_rejected(db, grid):
+    race, (alonso, _), constructor = grid
+    rows = [result_row(alonso, constructor, 1, 25), result_row(alonso, constructor, 2, 18)]
+
+    with pytest.raises(DuplicateRows, match=alonso.id):
+        bulk_upsert_results(db, race.id, rows)
+    assert db.query(RaceResult).count() == 0
+
+
+def test_duplicate_keys_are_a_bad_request(client, db, grid):
+    race, (alonso, _), constructor = grid
+    rows = [result_row(alonso, constructor, 1, 25), result_row(alonso, constructor, 2, 18)]
+
+    response = client.post(f"/api/v1/races/{race.id}/results:bulk", json=rows)
+
+    assert response.status_code == 400
+    assert "Duplicate driver_id" in response.json()["detail"]
+
+
+def test_portable_fallback_without_on_conflict(db, grid, monkeypatch):
+    race, (alonso, hamilton), constructor = grid
+    monkeypatch.setattr(bulk, "_INSERTS", {})
+
+    bulk_upsert_results(db, race.id, [result_row(alonso, constructor, 1, 25)])
+    first_id = db.query(RaceResult.id).scalar()
+    counts = bulk_upsert_results(
+        db, race.id, [result_row(alonso, constructor, 2, 18), result_row(hamilton, constructor, 1, 25)],
+        replace=True,
+    )
+    db.commit()
+
+    assert counts == {"upserted": 2, "deleted": 0}
+    points = dict(db.query(RaceResult.driver_id, RaceResult.points).all())
+    assert points == {alonso.id: 18, hamilton.id: 25}
+    # Updated in place, not re-inserted
+    assert db.query(RaceResult.id).filter(RaceResult.driver_id == alonso.id).scalar() == first_id
+
+
+def test_uuid_spellings_of_one_key_are_duplicates(db, grid):
+    race, (alonso, _), constructor = grid
+    rows = [result_row(alonso, constructor, 1, 25), {**result_row(alonso, constructor, 2, 18), "driver_id": alonso.id.upper()}]
+
+    with pytest.raises(DuplicateRows):
+        bulk_upsert_results(db, race.id, rows)
+
+
+def test_uuid_spelling_matches_the_stored_key(db, grid):
+    race, (alonso, hamilton), constructor = grid
+    bulk_upsert_results(db, race.id, [result_row(alonso, constructor, 1, 25), result_row(hamilton, constructor, 2, 18)])
+    row = {**result_row(alonso, constructor, 2, 18), "driver_id": alonso.id.upper(), "constructor_id": constructor.id.upper()}
+
+    counts = bulk_upsert_results(db, race.id.upper(), [row], replace=True)
+    db.commit()
+
+    assert counts == {"upserted": 1, "deleted": 1}
+    assert db.query(RaceResult.driver_id, RaceResult.points).all() == [(alonso.id, 18)]
@@ -0,0 +1,144 @@
+import redis
+
+from app.utils.cache import MemoryCacheBackend, ResponseCache
+
+
+class FlakyBackend(MemoryCacheBackend):
+    """Memory backend that raises like an unreachable Redis while `down` is set"""
+
+    def __init__(self):
+        super().__init__()
+        self.down = False
+
+    def _check(self):
+        if self.down:
+            raise redis.ConnectionError("Connection refused")
+
+    def get(self, key):
+        self._check()
+        return super().get(key)
+
+    def mget(self, keys):
+        self._check()
+        return super().mget(keys)
+
+    def set(self, key, value, ex=None, nx=False):
+        self._check()
+        return super().set(key, value, ex=ex, nx=nx)
+
+    def incr(self, key):
+        self._check()
+        return super().incr(key)
+
+
+def cached_endpoint(cache: ResponseCache):
+    calls = []
+
+    @cache.cached("drivers", response_model=dict)
+    def endpoint(driver_id: str):
+        calls.append(driver_id)
+        return {"driver_id": driver_id, "version": len(calls)}
+
+    return endpoint, calls
+
+
+def test_second_call_is_a_hit():
+    cache = ResponseCache(MemoryCacheBackend())
+    endpoint, calls = cached_endpoint(cache)
+
+    first = endpoint(driver_id="hamilton")
+    second = endpoint(driver_id="hamilton")
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.body == first.body
+    assert calls == ["hamilton"]
+    assert cache.stats() == {"hits": 1, "misses": 1, "errors": 0}
+
+
+def test_parameters_are_part_of_the_key():
+    cache = ResponseCache(MemoryCacheBackend())
+    endpoint, calls = cached_endpoint(cache)
+
+    endpoint(driver_id="hamilton")
+    endpoint(driver_id="verstappen")
+
+    assert calls == ["hamilton", "verstappen"]
+
+
+def test_invalidate_bumps_the_namespace():
+    cache = ResponseCache(MemoryCacheBackend())
+    endpoint, calls = cached_endpoint(cache)
+
+    endpoint(driver_id="hamilton")
+    cache.invalidate("races")
+    assert endpoint(driver_id="hamilton").headers["X-Cache"] == "HIT"
+
+    cache.invalidate("drivers")
+    assert endpoint(driver_id="hamilton").headers["X-Cache"] == "MISS"
+    assert calls == ["hamilton", "hamilton"]
+
+
+def test_backend_error_bypasses_the_cache():
+    backend = FlakyBackend()
+    cache = ResponseCache(backend)
+    endpoint, calls = cached_endpoint(cache)
+
+    backend.down = True
+    response = endpoint(driver_id="hamilton")
+
+    assert response.status_code == 200
+    assert "X-Cache" not in response.headers
+    assert not cache.enabled
+    assert cache.stats()["errors"] == 1
+    # Bypassed without touching the backend until the retry delay has passed
+    assert endpoint(driver_id="hamilton").status_code == 200
+    assert cache.stats()["errors"] == 1
+    assert calls == ["hamilton", "hamilton"]
+
+
+def test_invalidation_during_an_outage_is_applied_on_recovery():
+    backend = FlakyBackend()
+    cache = ResponseCache(backend)
+    endpoint, calls = cached_endpoint(cache)
+    endpoint(driver_id="hamilton")
+
+    # A write while the backend is down cannot bump the generation
+    backend.down = True
+    cache.invalidate("drivers")
+    assert not cache.enabled
+
+    # Backend back and retry delay over: the entry cached before the outage is stale
+    backend.down = False
+    cache._disabled_until = 0.0
+    response = endpoint(driver_id="hamilton")
+
+    assert response.headers["X-Cache"] == "MISS"
+    assert calls == ["hamilton", "hamilton"]
+
+
+def test_invalidate_while_bypassed_still_reaches_the_backend():
+    backend = FlakyBackend()
+    cache = ResponseCache(backend)
+    endpoint, calls = cached_endpoint(cache)
+    endpoint(driver_id="hamilton")
+
+    # Bypassed after an error, but the backend is reachable again
+    backend.down = True
+    endpoint(driver_id="verstappen")
+    backend.down = False
+    cache.invalidate("drivers")
+
+    cache._disabled_until = 0.0
+    assert endpoint(driver_id="hamilton").headers["X-Cache"] == "MISS"
+
+
+def test_disabled_cache_serves_uncached():
+    cache = ResponseCache(None)
+    endpoint, calls = cached_endpoint(cache)
+
+    cache.invalidate("drivers")
+    response = endpoint(driver_id="hamilton")
+
+    assert response.status_code == 200
+    assert "X-Cache" not in response.headers
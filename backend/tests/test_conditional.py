@@ -0,0 +1,124 @@
+from tests.factories import create_driver, create_race, create_season
+
+
+def test_entity_cache_hit_runs_no_query(client, db, count_statements):
+    create_driver(db, "hamilton")
+    db.commit()
+    first = client.get("/api/v1/drivers/hamilton")
+
+    with count_statements() as statements:
+        second = client.get("/api/v1/drivers/hamilton")
+
+    assert statements == []
+    assert second.status_code == 200
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert "Last-Modified" in second.headers
+
+
+def test_response_cache_hit_runs_no_query(client, db, count_statements):
+    create_driver(db, "hamilton")
+    season = create_season(db, 2023)
+    create_race(db, season, 1)
+    db.commit()
+
+    for path in ("/api/v1/drivers/", "/api/v1/races/season/2023"):
+        first = client.get(path)
+        with count_statements() as statements:
+            second = client.get(path)
+
+        assert statements == [], path
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.headers["ETag"] == first.headers["ETag"]
+
+
+def test_stored_validators_match_the_query(client, db):
+    create_driver(db, "hamilton")
+    season = create_season(db, 2023)
+    create_race(db, season, 1)
+    db.commit()
+
+    for path in ("/api/v1/drivers/hamilton", "/api/v1/drivers/", "/api/v1/races/season/2023"):
+        etag = client.get(path).headers["ETag"]
+        client.get(path)
+        response = client.get(path, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304, path
+        assert response.headers["ETag"] == etag
+
+
+def test_conditional_request_after_a_change(client, db):
+    create_driver(db, "hamilton")
+    db.commit()
+    etag = client.get("/api/v1/drivers/hamilton").headers["ETag"]
+
+    client.put("/api/v1/drivers/hamilton", json={"nationality": "British"})
+    response = client.get("/api/v1/drivers/hamilton", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["nationality"] == "British"
+
+
+def test_if_modified_since(client, db):
+    create_driver(db, "hamilton")
+    db.commit()
+    last_modified = client.get("/api/v1/drivers/hamilton").headers["Last-Modified"]
+
+    response = client.get("/api/v1/drivers/hamilton", headers={"If-Modified-Since": last_modified})
+
+    assert response.status_code == 304
+
+
+def test_collections_ignore_if_modified_since(client, db):
+    season = create_season(db, 2023)
+    create_race(db, season, 1)
+    race = create_race(db, season, 2)
+    db.commit()
+    paths = ("/api/v1/races/", "/api/v1/races/season/2023")
+    assert all("Last-Modified" not in client.get(path).headers for path in paths)
+
+    # Deleting a race leaves max(updated_at) where it was
+    assert client.delete(f"/api/v1/races/{race.id}").status_code == 204
+    for path in paths:
+        response = client.get(path, headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"})
+        assert response.status_code == 200, path
+        assert len(response.json()) == 1
+
+
+def test_etag_follows_the_resolved_parameters(client, db):
+    season = create_season(db, 2023)
+    create_race(db, season, 1)
+    db.commit()
+
+    etag = client.get("/api/v1/races/?limit=5&skip=0").headers["ETag"]
+    assert client.get("/api/v1/races/?skip=0&limit=5", headers={"Accept": "text/html"}).headers["ETag"] == etag
+    assert client.get("/api/v1/races/?limit=6").headers["ETag"] != etag
+
+    arrow = client.get("/api/v1/races/?limit=5&format=arrow").headers["ETag"]
+    assert arrow != etag
+    negotiated = client.get("/api/v1/races/?limit=5", headers={"Accept": "application/vnd.apache.arrow.stream"})
+    assert negotiated.headers["ETag"] == arrow
+
+
+def test_if_none_match_star_does_not_hide_missing_resources(client):
+    response = client.get("/api/v1/drivers/zzz", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 404
+
+
+def test_calendar_miss_is_one_round_trip(client, async_client, db, count_statements):
+    season = create_season(db, 2023)
+    create_race(db, season, 1)
+    create_season(db, 2024)
+    db.commit()
+
+    for path in ("/api/v1/races/season/2023", "/api/v1/races/season/2023?include=results_summary",
+                 "/api/v1/races/season/2024"):
+        with count_statements() as statements:
+            response = client.get(path)
+
+        # The validators come back with the calendar rows
+        assert len(statements) == 1, path
+        assert response.headers["X-Cache"] == "MISS"
+        assert client.get(path, headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+        assert async_client.get(path).headers["ETag"] == response.headers["ETag"]
@@ -0,0 +1,77 @@
+import csv
+import io
+import json
+
+import pytest
+
+from app.config import settings
+from tests.factories import create_constructor, create_driver, create_qualifying, create_race, create_result, create_season
+
+
+@pytest.fixture
+def history(db):
+    constructor = create_constructor(db, "mclaren")
+    drivers = [create_driver(db, "norris"), create_driver(db, "piastri")]
+    for year in (2023, 2024):
+        season = create_season(db, year)
+        for round_number in (1, 2):
+            race = create_race(db, season, round_number)
+            for position, driver in enumerate(drivers, start=1):
+                create_result(db, race, driver, constructor, position, 26 - 8 * position)
+                create_qualifying(db, race, driver, constructor, position)
+    db.commit()
+
+
+def test_ndjson_export(client, history, monkeypatch):
+    # Several partitions per response
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 3)
+    response = client.get("/api/v1/export/results.ndjson")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="results.ndjson"'
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 8
+    assert [(row["season"], row["round"], row["position"]) for row in rows[:3]] == [(2023, 1, 1), (2023, 1, 2), (2023, 2, 1)]
+    assert rows[0]["points"] == 18.0
+
+
+def test_csv_export(client, history, monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 3)
+    response = client.get("/api/v1/export/races.csv")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [(row["season"], row["round"]) for row in rows] == [("2023", "1"), ("2023", "2"), ("2024", "1"), ("2024", "2")]
+    assert rows[0]["date"] == "2023-03-01"
+
+
+def test_season_filter(client, history):
+    response = client.get("/api/v1/export/qualifying.csv", params={"season": 2024})
+
+    assert response.headers["content-disposition"] == 'attachment; filename="qualifying-2024.csv"'
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 4 and {row["season"] for row in rows} == {"2024"}
+    assert rows[0]["q1"] == "1:30.000"
+
+    lines = client.get("/api/v1/export/results.ndjson", params={"season": 2023}).text.splitlines()
+    assert {json.loads(line)["season"] for line in lines} == {2023}
+
+
+def test_empty_export(client, db):
+    create_season(db, 2024)
+    db.commit()
+
+    assert client.get("/api/v1/export/results.ndjson", params={"season": 2024}).text == ""
+    assert client.get("/api/v1/export/results.csv", params={"season": 2024}).text.splitlines()[0].startswith("season,round,")
+
+
+def test_unknown_dataset_and_season(client, history):
+    response = client.get("/api/v1/export/laps.ndjson")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Export laps not found"
+
+    response = client.get("/api/v1/export/results.csv", params={"season": 1950})
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Season 1950 not found"
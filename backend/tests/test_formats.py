@@ -0,0 +1,99 @@
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from app.schemas.lap import LapResponse
+from app.schemas.race import RaceResponse
+from app.schemas.result import ResultResponse
+from app.utils.formats import MEDIA_TYPES, arrow_schema
+from tests.factories import create_constructor, create_driver, create_lap, create_race, create_result, create_season
+
+
+def read_arrow(content: bytes) -> pa.Table:
+    return pa.ipc.open_stream(content).read_all()
+
+
+def read_parquet(content: bytes) -> pa.Table:
+    return pq.read_table(io.BytesIO(content))
+
+
+def same_rows(table: pa.Table, body: list, schema) -> bool:
+    return [schema.model_validate(row) for row in table.to_pylist()] == [schema.model_validate(row) for row in body]
+
+
+@pytest.fixture
+def race(db):
+    season = create_season(db, 2024)
+    race = create_race(db, season, 1)
+    for round_number in range(2, 6):
+        create_race(db, season, round_number)
+    constructor = create_constructor(db, "ferrari")
+    create_result(db, race, create_driver(db, "leclerc"), constructor, 1, 25)
+    # A retirement leaves nullable columns empty
+    create_result(db, race, create_driver(db, "sainz"), constructor, None, 0)
+    db.commit()
+    return race
+
+
+def test_arrow_schema_follows_response_model():
+    schema = arrow_schema(ResultResponse)
+
+    assert schema.names == list(ResultResponse.model_fields)
+    assert schema.field("position").type == pa.int64()
+    assert schema.field("points").type == pa.float64()
+    assert schema.field("created_at").type == pa.timestamp("us")
+    assert arrow_schema(RaceResponse).field("date").type == pa.date32()
+
+
+@pytest.mark.parametrize("fmt, read", [("arrow", read_arrow), ("parquet", read_parquet)])
+def test_columnar_page_matches_json(client, race, fmt, read):
+    body = client.get("/api/v1/races/", params={"limit": 2}).json()
+    response = client.get("/api/v1/races/", params={"limit": 2, "format": fmt})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == MEDIA_TYPES[fmt]
+    table = read(response.content)
+    assert table.schema.equals(arrow_schema(RaceResponse))
+    assert same_rows(table, body, RaceResponse)
+    # Keyset paging carries over to columnar pages
+    cursor = response.headers["x-next-cursor"]
+    following = read(client.get("/api/v1/races/", params={"limit": 2, "format": fmt, "after": cursor}).content)
+    assert following.column("round").to_pylist() == [3, 2]
+
+
+def test_format_from_accept_header(client, race):
+    response = client.get(f"/api/v1/races/{race.id}/results", headers={"Accept": MEDIA_TYPES["parquet"]})
+
+    assert response.headers["content-type"] == MEDIA_TYPES["parquet"]
+    table = read_parquet(response.content)
+    assert same_rows(table, client.get(f"/api/v1/races/{race.id}/results").json(), ResultResponse)
+    assert table.column("position").to_pylist() == [1, None]
+
+
+def test_calendar_and_laps_as_arrow(client, db, race):
+    driver = create_driver(db, "hamilton")
+    for lap in range(1, 4):
+        create_lap(db, race, driver, lap, 90000 + lap)
+    db.commit()
+
+    calendar = read_arrow(client.get("/api/v1/races/season/2024", params={"format": "arrow"}).content)
+    assert calendar.column("round").to_pylist() == [1, 2, 3, 4, 5]
+
+    laps = read_arrow(client.get(f"/api/v1/races/{race.id}/laps", params={"format": "arrow"}).content)
+    assert laps.schema.equals(arrow_schema(LapResponse))
+    assert laps.column("lap_time_ms").to_pylist() == [90001, 90002, 90003]
+
+
+def test_columnar_and_json_responses_are_distinct(client, race):
+    json_response = client.get("/api/v1/races/", params={"limit": 2})
+    arrow_response = client.get("/api/v1/races/", params={"limit": 2, "format": "arrow"})
+
+    assert json_response.headers["etag"] != arrow_response.headers["etag"]
+    # Each format is cached separately
+    assert client.get("/api/v1/races/", params={"limit": 2}).headers["content-type"] == "application/json"
+
+
+def test_unknown_format(client, race):
+    assert client.get("/api/v1/races/", params={"format": "xml"}).status_code == 422
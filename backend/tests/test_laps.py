@@ -0,0 +1,51 @@
+from app.models.driver import Driver
+from app.models.race import Race
+
+from tests.factories import create_driver, create_lap, create_race, create_season
+
+
+def race_with_laps(db):
+    season = create_season(db, 2023)
+    race = create_race(db, season, 1)
+    driver = create_driver(db, "hamilton")
+    for lap in (1, 2):
+        create_lap(db, race, driver, lap, 90000)
+    db.commit()
+    return race.id, driver.id
+
+
+def test_laps_identify_drivers_by_natural_key(client, db):
+    race_id, driver_uuid = race_with_laps(db)
+
+    response = client.get(f"/api/v1/races/{race_id}/laps", params={"driver": "hamilton"})
+
+    assert response.status_code == 200
+    assert [(lap["driver_id"], lap["driver_uuid"], lap["lap"]) for lap in response.json()] == [
+        ("hamilton", driver_uuid, 1),
+        ("hamilton", driver_uuid, 2),
+    ]
+
+
+def test_deleting_the_season_invalidates_cached_laps(client, db):
+    race_id, _ = race_with_laps(db)
+    assert client.get(f"/api/v1/races/{race_id}/laps").status_code == 200
+
+    assert client.delete("/api/v1/seasons/2023").status_code == 204
+
+    assert client.get(f"/api/v1/races/{race_id}/laps").status_code == 404
+
+
+def test_lap_validators_are_partition_pruned(client, db, count_statements):
+    race_id, driver_uuid = race_with_laps(db)
+    etag = client.get(f"/api/v1/races/{race_id}/laps").headers["ETag"]
+
+    with count_statements() as statements:
+        response = client.get(f"/api/v1/races/{race_id}/laps", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert len(statements) == 1
+    assert " ".join(statements[0].split()).count("laps.season_year = (SELECT seasons.year") == 2
+
+    create_lap(db, db.get(Race, race_id), db.get(Driver, driver_uuid), 3, 90000)
+    db.commit()
+    assert client.get(f"/api/v1/races/{race_id}/laps", headers={"If-None-Match": etag}).status_code == 200
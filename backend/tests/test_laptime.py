@@ -0,0 +1,81 @@
+import importlib.util
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+from app.models.qualifying import Qualifying
+from app.utils.laptime import format_gap, format_lap_time, format_race_time, parse_lap_times, to_milliseconds
+from tests.factories import create_constructor, create_driver, create_qualifying, create_race, create_season
+
+MIGRATION = Path(__file__).resolve().parent.parent / "alembic" / "versions" / "5e237de91a28_add_lap_time_milliseconds_columns.py"
+
+
+def parsed(*values):
+    return [None if pd.isna(value) else int(value) for value in parse_lap_times(values)]
+
+
+@pytest.mark.parametrize("value, milliseconds", [
+    ("83.456", 83456),
+    ("1:23.456", 83456),
+    ("1:23", 83000),
+    ("1:34:50.616", 5690616),
+    ("  1:23.4  ", 83400),
+    ("0:59.9996", 60000),
+])
+def test_parses_time_formats(value, milliseconds):
+    assert parsed(value) == [milliseconds]
+
+
+@pytest.mark.parametrize("value", [None, "", "   ", float("nan")])
+def test_missing_values_are_null(value):
+    assert parsed(value) == [None]
+
+
+@pytest.mark.parametrize("value", ["abc", "DNF", "+5.123", "1:23.456.7", "1::23.456", "-1:23.456", "1:2:3:4.5"])
+def test_malformed_values_are_null(value):
+    assert parsed(value) == [None]
+
+
+def test_parses_a_column_in_order():
+    assert parsed("1:31.447", None, "bad", "1:30.000") == [91447, None, None, 90000]
+    assert parse_lap_times([]).empty
+    assert str(parse_lap_times(["1:31.447"]).dtype) == "Int64"
+
+
+def test_formats_round_trip():
+    assert format_lap_time(83456) == "1:23.456"
+    assert format_race_time(5690616) == "1:34:50.616"
+    assert format_gap(5123) == "+5.123"
+    assert format_gap(65123) == "+1:05.123"
+    assert parsed(format_lap_time(83456), format_race_time(5690616)) == [83456, 5690616]
+    assert format_lap_time(None) is None
+
+
+def test_to_milliseconds():
+    assert to_milliseconds(pd.Timedelta(seconds=83.4564)) == 83456
+    assert to_milliseconds(pd.NaT) is None
+    assert to_milliseconds(None) is None
+
+
+def test_migration_backfills_milliseconds(engine, db):
+    season = create_season(db, 2023)
+    race = create_race(db, season, 1)
+    constructor = create_constructor(db, "ferrari")
+    times = {"leclerc": ("1:30.000", "1:29.500", None), "sainz": ("1:30.100", "", "bad")}
+    for position, (driver_id, (q1, q2, q3)) in enumerate(times.items(), start=1):
+        row = create_qualifying(db, race, create_driver(db, driver_id), constructor, position)
+        row.q1, row.q2, row.q3, row.q1_ms = q1, q2, q3, None
+    db.commit()
+
+    spec = importlib.util.spec_from_file_location("laptime_migration", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    with engine.begin() as connection, Operations.context(MigrationContext.configure(connection)):
+        migration._backfill("qualifying", {"q1_ms": "q1", "q2_ms": "q2", "q3_ms": "q3"})
+
+    db.expire_all()
+    rows = db.query(Qualifying.q1_ms, Qualifying.q2_ms, Qualifying.q3_ms).order_by(Qualifying.position).all()
+    assert rows == [(90000, 89500, None), (90100, None, None)]
@@ -0,0 +1,54 @@
+import pytest
+
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_cursor
+from tests.factories import create_race, create_season
+
+
+@pytest.fixture
+def seasons(db):
+    for year in (2021, 2022, 2023):
+        create_season(db, year)
+    db.commit()
+
+
+def test_cursor_continues_after_the_last_row(client, seasons):
+    first = client.get("/api/v1/seasons/", params={"limit": 2})
+    cursor = first.headers[NEXT_CURSOR_HEADER]
+
+    second = client.get("/api/v1/seasons/", params={"limit": 2, "after": cursor})
+
+    assert [season["year"] for season in first.json()] == [2023, 2022]
+    assert [season["year"] for season in second.json()] == [2021]
+    assert NEXT_CURSOR_HEADER not in second.headers
+
+
+@pytest.mark.parametrize("values", [
+    [{"a": 1}, "x"],
+    ["abc", "00000000-0000-4000-8000-000000000001"],
+    [True, "00000000-0000-4000-8000-000000000001"],
+    [2022, 5],
+    [2022],
+])
+def test_tampered_season_cursor_is_rejected(client, seasons, values):
+    response = client.get("/api/v1/seasons/", params={"after": encode_cursor(values)})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid pagination cursor"
+
+
+@pytest.mark.parametrize("values", [
+    [5, "x"],
+    ["2023-13-01", "x"],
+    [None, "x"],
+])
+def test_tampered_race_cursor_is_rejected(client, db, values):
+    create_race(db, create_season(db, 2023), 1)
+    db.commit()
+
+    response = client.get("/api/v1/races/", params={"after": encode_cursor(values)})
+
+    assert response.status_code == 400
+
+
+def test_garbage_cursor_is_rejected(client, seasons):
+    assert client.get("/api/v1/seasons/", params={"after": "not base64!"}).status_code == 400
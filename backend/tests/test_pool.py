@@ -0,0 +1,85 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.config import settings
+from app.db import database
+from app.db import pool as pool_metrics
+from app.db.pool import InstrumentedQueuePool, track_pool
+from app.utils.metrics import Histogram
+
+
+class ProbePool(InstrumentedQueuePool):
+    metrics_name = "probe"
+
+
+@pytest.fixture
+def probe_engine(tmp_path, monkeypatch):
+    monkeypatch.setattr(pool_metrics, "checkout_wait", Histogram())
+    monkeypatch.setattr(pool_metrics, "_timeouts", {})
+    monkeypatch.setattr(pool_metrics, "_pools", dict(pool_metrics._pools))
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=ProbePool, pool_size=2, max_overflow=1, pool_timeout=0.05,
+    )
+    track_pool(engine.pool)
+    yield engine
+    engine.dispose()
+
+
+def samples(name: str, pool: str = "probe") -> dict:
+    families = {family.name: family for family in pool_metrics._collect()}
+    return {sample: value for sample, labels, value in families[name].samples if labels.get("pool") == pool}
+
+
+def test_engine_pool_follows_settings():
+    pool = database.engine.pool
+
+    assert isinstance(pool, InstrumentedQueuePool)
+    assert pool.size() == settings.DB_POOL_SIZE
+    assert pool._max_overflow == settings.DB_MAX_OVERFLOW
+    assert pool._timeout == settings.DB_POOL_TIMEOUT
+    assert pool._recycle == settings.DB_POOL_RECYCLE
+    assert pool._pre_ping == settings.DB_POOL_PRE_PING
+    assert pool_metrics._pools["sync"] is pool
+
+
+def test_checkouts_are_timed_and_counted(probe_engine):
+    connections = [probe_engine.connect() for _ in range(3)]
+    for connection in connections:
+        connection.execute(text("SELECT 1"))
+
+    assert samples("apexdata_db_pool_size") == {"apexdata_db_pool_size": 2}
+    assert samples("apexdata_db_pool_checked_out") == {"apexdata_db_pool_checked_out": 3}
+    assert samples("apexdata_db_pool_overflow") == {"apexdata_db_pool_overflow": 1}
+    assert samples("apexdata_db_pool_checkout_seconds")["apexdata_db_pool_checkout_seconds_count"] == 3
+
+    for connection in connections:
+        connection.close()
+    assert samples("apexdata_db_pool_checked_out") == {"apexdata_db_pool_checked_out": 0}
+    assert samples("apexdata_db_pool_idle") == {"apexdata_db_pool_idle": 2}
+
+
+def test_exhausted_pool_counts_timeouts(probe_engine):
+    held = [probe_engine.connect() for _ in range(3)]
+
+    with pytest.raises(exc.TimeoutError):
+        probe_engine.connect()
+
+    assert samples("apexdata_db_pool_timeouts_total") == {"apexdata_db_pool_timeouts_total": 1}
+    wait = samples("apexdata_db_pool_checkout_seconds")
+    # The failed checkout waited for pool_timeout and is part of the histogram
+    assert wait["apexdata_db_pool_checkout_seconds_count"] == 4
+    assert wait["apexdata_db_pool_checkout_seconds_sum"] >= 0.05
+    for connection in held:
+        connection.close()
+
+
+def test_metrics_endpoint(client, probe_engine):
+    with probe_engine.connect():
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE apexdata_db_pool_checked_out gauge" in response.text
+    assert 'apexdata_db_pool_checked_out{pool="probe"} 1' in response.text
+    assert 'apexdata_db_pool_size{pool="sync"} ' in response.text
+    assert 'apexdata_db_pool_checkout_seconds_bucket{pool="probe",le="+Inf"} 1' in response.text
@@ -0,0 +1,62 @@
+import logging
+
+import pytest
+from sqlalchemy import exc, text
+
+from app.config import settings
+from app.utils.profiling import RequestProfile, _profile
+from tests.factories import create_driver
+
+
+@pytest.fixture
+def profile():
+    profile = RequestProfile("/probe")
+    token = _profile.set(profile)
+    yield profile
+    _profile.reset(token)
+
+
+def test_statements_are_counted_and_timed(engine, profile):
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        connection.execute(text("SELECT 2"))
+
+    assert profile.queries == 2
+    assert profile.db_time > 0
+
+
+def test_failed_statements_leave_no_state(engine, profile):
+    with engine.connect() as connection:
+        for _ in range(3):
+            with pytest.raises(exc.OperationalError):
+                connection.execute(text("SELECT * FROM missing_table"))
+        connection.execute(text("SELECT 1"))
+
+        assert profile.queries == 4
+        assert not any("start" in str(key) for key in connection.info)
+        assert not any("start" in str(key) for key in connection.connection.info)
+
+
+def test_slow_queries_are_logged_with_their_route(engine, profile, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "SQL_SLOW_QUERY_MS", 0.0)
+    with caplog.at_level(logging.WARNING, logger="app.utils.profiling"), engine.connect() as connection:
+        connection.execute(text("SELECT   1"))
+        with pytest.raises(exc.OperationalError):
+            connection.execute(text("SELECT * FROM missing_table"))
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 2
+    assert messages[0].startswith("Slow query") and messages[0].endswith("on /probe: SELECT 1")
+    assert messages[1].endswith("on /probe: SELECT * FROM missing_table")
+
+
+def test_server_timing_header(client, db):
+    create_driver(db, "hamilton")
+    db.commit()
+
+    timing = client.get("/api/v1/drivers/hamilton").headers["server-timing"]
+
+    assert timing.startswith("db;dur=")
+    assert 'desc="1 queries"' in timing
+    assert "app;dur=" in timing
+    assert 'desc="0 queries"' in client.get("/api/v1/drivers/hamilton").headers["server-timing"]
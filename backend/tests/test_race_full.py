@@ -0,0 +1,50 @@
+import pytest
+
+from tests.factories import (
+    create_constructor, create_driver, create_qualifying, create_race, create_result, create_season,
+)
+
+
+def full_race(db, drivers: int):
+    season = create_season(db, 2023)
+    race = create_race(db, season, 1)
+    constructors = [create_constructor(db, f"team_{index}") for index in range(max(drivers // 2, 1))]
+    for position in range(1, drivers + 1):
+        driver = create_driver(db, f"driver_{position}")
+        constructor = constructors[(position - 1) % len(constructors)]
+        create_result(db, race, driver, constructor, position, max(26 - position, 0))
+        create_qualifying(db, race, driver, constructor, position)
+    db.commit()
+    return race.id
+
+
+def data_statements(statements):
+    """Statements loading the race, leaving out the conditional request validators"""
+    return [statement for statement in statements if "max(" not in statement]
+
+
+@pytest.mark.parametrize("drivers", [2, 20])
+def test_full_race_loads_in_three_queries(client, db, count_statements, drivers):
+    race_id = full_race(db, drivers)
+
+    with count_statements() as statements:
+        response = client.get(f"/api/v1/races/{race_id}/full")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["results"]) == len(body["qualifying"]) == drivers
+    assert body["results"][0]["driver"]["driver_id"] == "driver_1"
+    assert body["qualifying"][-1]["constructor"]["constructor_id"].startswith("team_")
+    # Race, then results and qualifying with their drivers and constructors
+    assert len(data_statements(statements)) == 3
+
+
+def test_full_race_cache_hit_runs_no_query(client, db, count_statements):
+    race_id = full_race(db, 4)
+    client.get(f"/api/v1/races/{race_id}/full")
+
+    with count_statements() as statements:
+        response = client.get(f"/api/v1/races/{race_id}/full")
+
+    assert response.headers["X-Cache"] == "HIT"
+    assert statements == []
@@ -0,0 +1,32 @@
+from tests.factories import create_race, create_season
+
+
+def test_race_id_spelling_shares_cache_entries(client, async_client, db):
+    race = create_race(db, create_season(db, 2023), 1)
+    db.commit()
+    upper = race.id.upper()
+
+    first = client.get(f"/api/v1/races/{upper}")
+    assert first.json()["id"] == race.id
+    assert client.get(f"/api/v1/races/{race.id}/results").status_code == 200
+
+    # Written with the lowercase id: the uppercase spelling must not stay stale
+    client.put(f"/api/v1/races/{race.id}", json={"race_name": "Renamed"})
+    for path in (f"/api/v1/races/{upper}", f"/api/v1/races/{race.id}"):
+        response = client.get(path, headers={"If-None-Match": first.headers["ETag"]})
+        assert response.status_code == 200
+        assert response.json()["race_name"] == "Renamed"
+    assert async_client.get(f"/api/v1/races/{upper}").json()["race_name"] == "Renamed"
+
+    # Both spellings are the same representation
+    etag = client.get(f"/api/v1/races/{race.id}").headers["ETag"]
+    assert client.get(f"/api/v1/races/{upper}", headers={"If-None-Match": etag}).status_code == 304
+
+    assert client.delete(f"/api/v1/races/{upper}").status_code == 204
+    assert client.get(f"/api/v1/races/{race.id}").status_code == 404
+
+
+def test_unknown_race_ids(client):
+    assert client.get("/api/v1/races/not-a-uuid").json()["detail"] == "Race not-a-uuid not found"
+    response = client.get("/api/v1/races/{0}".format("A" * 8 + "-AAAA-4AAA-8AAA-" + "A" * 12))
+    assert response.json()["detail"] == "Race aaaaaaaa-aaaa-4aaa-8aaa-aaaaaaaaaaaa not found"
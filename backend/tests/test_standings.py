@@ -0,0 +1,92 @@
+import pytest
+
+from app.models.result import RaceResult
+from app.models.standing import ConstructorStanding, DriverStanding
+from app.services.standings import recompute_season, update_standings, update_standings_for_race
+from tests.factories import create_constructor, create_driver, create_race, create_result, create_season
+
+POINTS = {1: 25, 2: 18, 3: 15}
+
+
+def snapshot(db):
+    """Stored standings of both championships, comparable across rebuilds"""
+    return {
+        model.__name__: sorted(
+            (row.race_id, getattr(row, key), row.points, row.wins, row.position) for row in db.query(model)
+        )
+        for model, key in ((DriverStanding, "driver_id"), (ConstructorStanding, "constructor_id"))
+    }
+
+
+@pytest.fixture
+def season(db):
+    season = create_season(db, 2023)
+    drivers = [create_driver(db, name) for name in ("alonso", "hamilton", "verstappen")]
+    constructors = [create_constructor(db, name) for name in ("aston_martin", "mercedes", "red_bull")]
+    db.commit()
+    return season, list(zip(drivers, constructors))
+
+
+def add_race(db, season, round, order):
+    """Race whose finishing order lists indexes into the season's entries"""
+    season, entries = season
+    race = create_race(db, season, round)
+    for position, index in enumerate(order, start=1):
+        driver, constructor = entries[index]
+        create_result(db, race, driver, constructor, position, POINTS[position])
+    return race
+
+
+def test_incremental_updates_match_full_recompute(db, season):
+    # Standings maintained race by race as results arrive, then corrected
+    races = []
+    for round, order in enumerate([(0, 1, 2), (2, 1, 0), (1, 2, 0), (2, 0, 1)], start=1):
+        races.append(add_race(db, season, round, order))
+        update_standings_for_race(db, races[-1])
+    result = db.query(RaceResult).filter(RaceResult.race_id == races[1].id, RaceResult.position == 1).one()
+    result.points = 0.0
+    db.flush()
+    update_standings_for_race(db, races[1])
+    db.commit()
+    incremental = snapshot(db)
+
+    recompute_season(db, 2023)
+    db.commit()
+
+    assert snapshot(db) == incremental
+    assert len(incremental["DriverStanding"]) == 12
+
+
+def test_rounds_without_standings_are_filled_in(db, season):
+    round_1 = add_race(db, season, 1, (0, 1, 2))
+    round_2 = add_race(db, season, 2, (1, 0, 2))
+    db.flush()
+    # Standings lost (or never built) for round 1, then round 2 changes
+    update_standings_for_race(db, round_2)
+    db.query(DriverStanding).delete()
+    db.query(ConstructorStanding).delete()
+    update_standings_for_race(db, round_2)
+    db.commit()
+
+    alonso, hamilton = season[1][0][0], season[1][1][0]
+    after_round_2 = {
+        row.driver_id: row.points for row in db.query(DriverStanding).filter(DriverStanding.race_id == round_2.id)
+    }
+    assert after_round_2[alonso.id] == after_round_2[hamilton.id] == 43
+    assert db.query(DriverStanding).filter(DriverStanding.race_id == round_1.id).count() == 3
+
+
+def test_ties_are_broken_by_count_back(db, season):
+    # Level on points and wins; hamilton has a second place, alonso a third
+    season, entries = season
+    (alonso, aston_martin), (hamilton, mercedes), _ = entries
+    round_1, round_2 = create_race(db, season, 1), create_race(db, season, 2)
+    create_result(db, round_1, alonso, aston_martin, 1, 25)
+    create_result(db, round_1, hamilton, mercedes, 2, 18)
+    create_result(db, round_2, hamilton, mercedes, 1, 25)
+    create_result(db, round_2, alonso, aston_martin, 3, 18)
+    update_standings(db, season.id)
+    db.commit()
+
+    rows = db.query(DriverStanding).filter(DriverStanding.race_id == round_2.id).order_by(DriverStanding.position)
+    assert [(row.driver_id, row.points, row.wins) for row in rows] == [(hamilton.id, 43, 1), (alonso.id, 43, 1)]
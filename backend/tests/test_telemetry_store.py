@@ -0,0 +1,158 @@
+import os
+
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.services.telemetry_store import (
+    CHANNELS, TelemetryNotFound, driver_dir, minmax_downsample, read_driver_telemetry, write_driver_telemetry,
+)
+from tests.factories import create_race, create_season
+
+
+def channels(samples: int, speed: float):
+    data = {channel: np.zeros(samples, dtype=dtype) for channel, dtype in CHANNELS.items()}
+    data["time_ms"] = np.arange(samples, dtype=np.int32) * 100
+    data["speed"] = np.full(samples, speed, dtype=np.float32)
+    data["lap"] = np.repeat(np.arange(1, 3), samples // 2)
+    return data
+
+
+def versions(root, driver_id="hamilton"):
+    parent = os.path.dirname(driver_dir(2023, 1, driver_id, str(root)))
+    return sorted(entry for entry in os.listdir(parent) if entry.startswith(f".{driver_id}."))
+
+
+def test_rewrite_swaps_versions(tmp_path):
+    write_driver_telemetry(2023, 1, "hamilton", channels(10, 100.0), root=str(tmp_path))
+    first = os.path.realpath(driver_dir(2023, 1, "hamilton", str(tmp_path)))
+    write_driver_telemetry(2023, 1, "hamilton", channels(20, 200.0), root=str(tmp_path))
+
+    data = read_driver_telemetry(2023, 1, "hamilton", root=str(tmp_path))
+    assert len(data["speed"]) == 20 and data["speed"][0] == 200.0
+    assert os.path.islink(driver_dir(2023, 1, "hamilton", str(tmp_path)))
+    # The replaced version stays for readers still using it
+    assert os.path.isdir(first)
+    assert len(versions(tmp_path)) == 2
+
+    write_driver_telemetry(2023, 1, "hamilton", channels(10, 300.0), root=str(tmp_path))
+    assert not os.path.exists(first)
+    assert len(versions(tmp_path)) == 2
+
+
+def test_reader_keeps_its_version_during_a_rewrite(tmp_path):
+    write_driver_telemetry(2023, 1, "hamilton", channels(10, 100.0), root=str(tmp_path))
+    old = read_driver_telemetry(2023, 1, "hamilton", root=str(tmp_path))
+    write_driver_telemetry(2023, 1, "hamilton", channels(20, 200.0), root=str(tmp_path))
+
+    assert old["speed"][0] == 100.0
+    assert read_driver_telemetry(2023, 1, "hamilton", lap=2, root=str(tmp_path))["speed"][0] == 200.0
+
+
+def test_unversioned_directory_is_replaced(tmp_path):
+    target = driver_dir(2023, 1, "hamilton", str(tmp_path))
+    os.makedirs(target)
+    np.save(os.path.join(target, "speed.npy"), np.zeros(1))
+
+    write_driver_telemetry(2023, 1, "hamilton", channels(10, 100.0), root=str(tmp_path))
+
+    assert os.path.islink(target)
+    assert read_driver_telemetry(2023, 1, "hamilton", root=str(tmp_path))["speed"][0] == 100.0
+
+
+@pytest.mark.parametrize("driver_id", ["..", "../2022", "a/b", ".hamilton", ""])
+def test_invalid_driver_ids_are_rejected(tmp_path, driver_id):
+    with pytest.raises(ValueError):
+        read_driver_telemetry(2023, 1, driver_id, root=str(tmp_path))
+
+
+def test_missing_telemetry(tmp_path):
+    with pytest.raises(TelemetryNotFound):
+        read_driver_telemetry(2023, 1, "hamilton", root=str(tmp_path))
+
+
+def profile(samples: int):
+    """A race of `samples` points whose speed has one spike and one dip"""
+    data = channels(samples, 200.0)
+    data["speed"] = (200 + 50 * np.sin(np.arange(samples) / 7)).astype(np.float32)
+    data["speed"][samples // 3] = 350.0
+    data["speed"][2 * samples // 3] = 60.0
+    return data
+
+
+def test_minmax_downsample_keeps_extremes():
+    values = profile(1000)["speed"]
+    indices = minmax_downsample(values, 100)
+
+    assert len(indices) <= 100
+    assert np.all(np.diff(indices) > 0)
+    assert values[indices].max() == values.max() and values[indices].min() == values.min()
+    # Every bucket contributes its own minimum and maximum
+    for bucket in np.array_split(np.arange(1000), 50):
+        kept = indices[(indices >= bucket[0]) & (indices <= bucket[-1])]
+        assert set(values[kept]) == {values[bucket].min(), values[bucket].max()}
+
+
+@pytest.mark.parametrize("samples", [1, 5, 10])
+def test_minmax_downsample_short_input_is_untouched(samples):
+    assert list(minmax_downsample(np.arange(samples), 10)) == list(range(samples))
+
+
+def test_minmax_downsample_uneven_buckets():
+    # 101 samples in 5 buckets of 21 leave a partly padded last bucket
+    indices = minmax_downsample(np.arange(101, dtype=float), 10)
+    assert len(indices) <= 10 and indices[0] == 0 and indices[-1] == 100
+
+
+def test_write_builds_lod_pyramid(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "TELEMETRY_LOD_LEVELS", [20, 100, 1000])
+    data = profile(400)
+    source = write_driver_telemetry(2023, 1, "hamilton", data, root=str(tmp_path))
+
+    # Levels at or above the sample count are not stored
+    assert sorted(os.listdir(os.path.join(source, "lod"))) == ["100", "20"]
+    for level in (20, 100):
+        level_dir = os.path.join(source, "lod", str(level))
+        assert sorted(os.listdir(level_dir)) == sorted(f"{channel}.npy" for channel in CHANNELS)
+        speed = np.load(os.path.join(level_dir, "speed.npy"))
+        time_ms = np.load(os.path.join(level_dir, "time_ms.npy"))
+        assert len(speed) <= level
+        assert speed.max() == 350.0 and speed.min() == 60.0
+        # Channels stay aligned on the same samples
+        assert np.array_equal(speed, data["speed"][time_ms // 100])
+
+
+@pytest.mark.parametrize("points, level", [(20, 20), (99, 20), (100, 100), (399, 100), (10, 20)])
+def test_read_chooses_level_by_point_count(tmp_path, monkeypatch, points, level):
+    monkeypatch.setattr(settings, "TELEMETRY_LOD_LEVELS", [20, 100])
+    write_driver_telemetry(2023, 1, "hamilton", profile(400), root=str(tmp_path))
+    stored = np.load(os.path.join(driver_dir(2023, 1, "hamilton", str(tmp_path)), "lod", str(level), "time_ms.npy"))
+
+    data = read_driver_telemetry(2023, 1, "hamilton", points=points, root=str(tmp_path))
+
+    assert len(data["time_ms"]) <= points
+    assert set(data["time_ms"]) <= set(stored)
+    assert data["speed"].max() == 350.0 and data["speed"].min() == 60.0
+
+
+def test_read_downsamples_single_lap_and_full_race(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "TELEMETRY_LOD_LEVELS", [20])
+    data = profile(400)
+    write_driver_telemetry(2023, 1, "hamilton", data, root=str(tmp_path))
+
+    # A request covering every sample reads the full-resolution data
+    assert len(read_driver_telemetry(2023, 1, "hamilton", points=400, root=str(tmp_path))["speed"]) == 400
+
+    lap = read_driver_telemetry(2023, 1, "hamilton", lap=1, channels=["time_ms"], points=30, root=str(tmp_path))
+    assert 0 < len(lap["time_ms"]) <= 30
+    assert set(lap) == {"time_ms"}
+    speeds = data["speed"][lap["time_ms"] // 100]
+    assert speeds.max() == 350.0 and lap["time_ms"].max() < 200 * 100
+
+
+def test_endpoint_validates_driver_id(client, db):
+    race = create_race(db, create_season(db, 2023), 1)
+    db.commit()
+
+    assert client.get(f"/api/v1/races/{race.id}/telemetry/%2E%2E").status_code == 422
+    assert client.get(f"/api/v1/races/{race.id}/telemetry/hamilton").status_code == 404
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.main import app
+from app.services import warmup
+from app.utils.cache import response_cache
+from tests.factories import create_race, create_season
+
+
+@pytest.fixture
+def seasons(db):
+    races = {}
+    for year in (2022, 2023, 2024):
+        season = create_season(db, year)
+        races[year] = [create_race(db, season, round_number) for round_number in (1, 2)]
+    db.commit()
+    return races
+
+
+def test_hot_paths_hottest_first(db, seasons, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_WARMUP_SEASONS", 2)
+
+    paths = warmup.hot_paths(db)
+
+    assert paths == [
+        "/api/v1/seasons/", "/api/v1/drivers/", "/api/v1/constructors/",
+        "/api/v1/races/season/2024", "/api/v1/seasons/2024/standings/drivers",
+        "/api/v1/seasons/2024/standings/constructors",
+        "/api/v1/races/season/2023", "/api/v1/seasons/2023/standings/drivers",
+        "/api/v1/seasons/2023/standings/constructors",
+        *(f"/api/v1/races/{race.id}/full" for race in seasons[2024]),
+    ]
+
+
+def test_hot_paths_without_data(db):
+    assert warmup.hot_paths(db) == warmup.default_paths()
+
+
+def test_warmed_responses_are_cache_hits(client, seasons, count_statements):
+    paths = ["/api/v1/races/season/2024", f"/api/v1/races/{seasons[2024][0].id}/full", "/api/v1/races/season/1900"]
+    progress = []
+
+    warmed = asyncio.run(warmup.warm_paths(app, paths, lambda done, total: progress.append((done, total))))
+
+    # Failing paths are skipped
+    assert warmed == paths[:2]
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    for path in warmed:
+        with count_statements() as statements:
+            response = client.get(path)
+        assert response.headers["X-Cache"] == "HIT", path
+        assert statements == []
+
+
+def test_warm_paths_budget(client, seasons):
+    assert asyncio.run(warmup.warm_paths(app, ["/api/v1/seasons/"], budget=0)) == []
+    assert client.get("/api/v1/seasons/").headers["X-Cache"] == "MISS"
+
+
+def test_warm_up_within_limits(client, session_factory, seasons, monkeypatch):
+    monkeypatch.setattr(warmup, "SessionLocal", session_factory)
+    monkeypatch.setattr(settings, "CACHE_WARMUP_MAX_ENTRIES", 4)
+
+    warmed = asyncio.run(warmup.warm_up(app))
+
+    assert warmed == ["/api/v1/seasons/", "/api/v1/drivers/", "/api/v1/constructors/", "/api/v1/races/season/2024"]
+    assert client.get("/api/v1/races/season/2024").headers["X-Cache"] == "HIT"
+    assert client.get("/api/v1/races/season/2023").headers["X-Cache"] == "MISS"
+
+
+def test_warm_up_without_cache(client, session_factory, seasons, monkeypatch):
+    monkeypatch.setattr(warmup, "SessionLocal", session_factory)
+    monkeypatch.setattr(response_cache, "client", None)
+
+    assert asyncio.run(warmup.warm_up(app)) == []
+
+
+def test_warm_up_never_raises(client, monkeypatch):
+    def broken():
+        raise RuntimeError("database down")
+
+    monkeypatch.setattr(warmup, "SessionLocal", broken)
+
+    assert asyncio.run(warmup.warm_up(app)) == []
+
+
+def test_warm_cache_job(client, seasons):
+    path = "/api/v1/races/season/2023"
+    response = client.post("/api/v1/jobs/", json={"type": "warm_cache", "params": {"paths": [path]}})
+
+    assert response.status_code == 202
+    job = client.get(f"/api/v1/jobs/{response.json()['id']}").json()
+    assert job["status"] == "succeeded"
+    assert job["result"] == {"warmed": 1}
+    assert client.get(path).headers["X-Cache"] == "HIT"
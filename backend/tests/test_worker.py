@@ -0,0 +1,87 @@
+import time
+
+from app import worker
+from app.config import settings
+from app.utils.cache import MemoryCacheBackend
+
+
+def slot_key(job_type: str) -> str:
+    return f"{worker._PREFIX}:slot:{job_type}:0"
+
+
+def test_progress_renews_the_slot_lease():
+    seen = {}
+
+    @worker.job("lease_probe")
+    def lease_probe(progress):
+        key = slot_key("lease_probe")
+        job_id = worker._decode(worker._store.get(key))
+        worker._store.set(key, job_id, ex=1)
+        progress(1, 2)
+        seen["expires_in"] = worker._store._data[key][1] - time.monotonic()
+        worker._store.delete(key)
+        progress(2, 2)
+        seen["retaken"] = worker._decode(worker._store.get(key)) == job_id
+        return {}
+
+    try:
+        result = worker.submit_job("lease_probe", {})
+    finally:
+        worker.JOBS.pop("lease_probe")
+
+    assert result["status"] == "succeeded"
+    assert seen["expires_in"] > settings.JOBS_SLOT_TTL - 60
+    assert seen["retaken"]
+    assert worker._store.get(slot_key("lease_probe")) is None
+
+
+def test_renewal_keeps_a_slot_taken_by_another_job():
+    key = slot_key("lease_taken")
+    worker._store.set(key, "other", ex=60)
+
+    worker._renew_slot(key, "mine")
+
+    assert worker._decode(worker._store.get(key)) == "other"
+    worker._store.delete(key)
+
+
+def test_release_keeps_a_slot_taken_by_another_job():
+    key = slot_key("lease_released")
+    worker._store.set(key, "other", ex=60)
+
+    worker._release_slot(key, "mine")
+    assert worker._decode(worker._store.get(key)) == "other"
+
+    worker._release_slot(key, "other")
+    assert worker._store.get(key) is None
+
+
+def test_expired_lease_is_free():
+    store = MemoryCacheBackend()
+    store.set("slot", "other", ex=60)
+    store._data["slot"] = ("other", time.monotonic() - 1)
+
+    assert store.renew_lease("slot", "mine", 60)
+    assert store.get("slot") == "mine"
+    assert not store.release_lease("slot", "other")
+    assert store.release_lease("slot", "mine")
+
+
+def test_redis_leases_run_as_scripts():
+    calls = []
+
+    class ScriptStore:
+        def register_script(self, script):
+            def run(keys, args):
+                calls.append((script, keys, args))
+                return 0 if args[0] == "other" else 1
+            return run
+
+    renew, release = worker._lease_commands(ScriptStore())
+
+    assert renew("slot", "mine", 60) is True
+    assert release("slot", "other") is False
+    assert calls == [
+        (worker._RENEW_LEASE, ["slot"], ["mine", 60]),
+        (worker._RELEASE_LEASE, ["slot"], ["other"]),
+    ]